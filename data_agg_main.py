@@ -1,6 +1,8 @@
 import os
 import pathlib
 
+import pandas as pd
+
 from data_aggregators.factory import (
     AggregatorOperationFactory,
     DataAggregators,
@@ -60,37 +62,40 @@ fnm = MappingFileFactory.process_file_in_gcs_folder(
     MappingFiles.FieldNameMapping, bucket_name, folder_path
 )
 print(fnm)
-print(fnm.query_entry(field_name="Vissers 146", farm_name="Circle F Farms"))
-print(fnm.query_entry(field_name="Vissers 146", farm_name=None))
-print(fnm.query_entry(field_name="Vissers 14", farm_name="Circle F Farms"))
+print(
+    fnm.query_many(
+        field_names=pd.Series(["Vissers 146", "Vissers 146", "Vissers 14"]),
+        farm_names=pd.Series(["Circle F Farms", None, "Circle F Farms"]),
+    )
+)
 
 folder_path = "01_data"
 pnm = MappingFileFactory.process_file_in_gcs_folder(
     MappingFiles.ProductNameMapping, bucket_name, folder_path
 )
 print(pnm)
-print(pnm.query_entry(product_name="0-0-60 "))
+print(pnm.query_many(pd.Series(["0-0-60 "])))
 
 folder_path = "01_data"
 cct = MappingFileFactory.process_file_in_gcs_folder(
     MappingFiles.CoverCropTable, bucket_name, folder_path
 )
 print(cct)
-print(cct.query_entry(cover_crop_name="Rye"))
+print(cct.query_many(pd.Series(["Rye"])))
 
 folder_path = "01_data"
 unm = MappingFileFactory.process_file_in_gcs_folder(
     MappingFiles.UnitNameMapping, bucket_name, folder_path
 )
 print(unm)
-print(unm.query_entry(unit_name="floz").clear_unit)
+print(unm.query_many(pd.Series(["floz"])).clear_unit)
 
 folder_path = "01_data"
 uct = MappingFileFactory.process_file_in_gcs_folder(
     MappingFiles.UnitConversionTable, bucket_name, folder_path
 )
 print(uct)
-print(uct.query_entry("fl_oz"))
+print(uct.query_many(pd.Series(["fl_oz"])))
 
 
 """ Example using config variables """
@@ -0,0 +1,114 @@
+"""Local on-disk cache for raw objects read from GCS.
+
+Cached copies are content-addressed by bucket path + object generation (falling
+back to etag / md5 / size+mtime for filesystems without generations). Every read
+does a single metadata call to check freshness; the object is only downloaded if
+no copy of the current generation is cached. The cache is capped in size and
+evicts least recently used entries first.
+"""
+import hashlib
+import os
+import pathlib
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from fsspec import AbstractFileSystem
+
+# Metadata keys identifying an object version, in order of preference
+VERSION_KEYS = ["generation", "etag", "md5Hash", "ETag"]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    bytes_downloaded: int = 0
+
+
+class ObjectCache:
+    def __init__(self, cache_dir: str | pathlib.Path, max_bytes: int):
+        self.cache_dir = pathlib.Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def object_version(info: dict) -> str:
+        for key in VERSION_KEYS:
+            if info.get(key):
+                return str(info[key])
+        modified = info.get("mtime") or info.get("updated") or info.get("created")
+        return f"{info.get('size')}-{modified}"
+
+    def cache_path(self, file_path: str, version: str) -> pathlib.Path:
+        key = hashlib.sha256(f"{file_path}@{version}".encode()).hexdigest()
+        return self.cache_dir.joinpath(key[:2], key)
+
+    def open(self, fs: AbstractFileSystem, file_path: str) -> BinaryIO:
+        """Returns a binary file handle to the local copy of `file_path`, downloading
+        it from `fs` first if the cached copy is missing or outdated."""
+        version = self.object_version(fs.info(file_path))
+        path = self.cache_path(file_path, version)
+
+        try:
+            handle = open(path, "rb")
+        except FileNotFoundError:
+            pass
+        else:
+            # bump modification time, used as LRU order for eviction
+            os.utime(handle.fileno())
+            with self._lock:
+                self.stats.hits += 1
+            return handle
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # download next to the target and move into place atomically, so concurrent
+        # readers never see partial files
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as local, fs.open(file_path, "rb") as remote:
+                while chunk := remote.read(8 * 1024 * 1024):
+                    local.write(chunk)
+            os.replace(tmp, path)
+        except BaseException:
+            pathlib.Path(tmp).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            self.stats.misses += 1
+            self.stats.bytes_downloaded += path.stat().st_size
+            self.evict(keep=path)
+
+        return open(path, "rb")
+
+    def evict(self, keep: pathlib.Path | None = None):
+        """Removes least recently used entries until the cache fits `max_bytes`."""
+        entries = []
+        for path in self.cache_dir.glob("*/*"):
+            if path.suffix == ".part":
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            self.stats.evictions += 1
+
+    def summary(self) -> str:
+        return (
+            f"raw data cache: {self.stats.hits} hits, {self.stats.misses} misses, "
+            f"{self.stats.evictions} evictions, "
+            f"{self.stats.bytes_downloaded / 1e6:.1f} MB downloaded"
+        )
@@ -0,0 +1,540 @@
+"""Columnar validation of data aggregator exports.
+
+The per-row ingestion path (`DataFile.from_file`) builds one pydantic model per
+row and dumps them back into a DataFrame. `validate_frame` applies the very same
+field rules declared in `data_aggregators/schema.py` to whole columns instead:
+
+- `mode="before"` and `mode="after"` field validators run over the column values.
+  Validators registered with a Series version next to them in `schema.py`
+  (`@column_rule(...)`, e.g. NA -> None, ensure_str, ensure_float, float_to_str,
+  `---` handling) are applied as Series operations; other validators, and values
+  a Series rule cannot handle, are passed to the validator one by one
+- model validators with `mode="before"` run before field validation, same as
+  pydantic does: column-wise if registered with a Series rule, on the row
+  records otherwise
+- type coercion and `ge`/`le` constraints are checked vectorized for the common
+  cases (str, float, int, datetime); any value the fast path cannot confirm is
+  validated through a pydantic `TypeAdapter` of the field annotation, so edge
+  cases behave exactly as in the per-row path
+
+The result is a DataFrame with the same columns as
+`pd.DataFrame([model.model_dump(by_alias=True) for model in operations])`.
+Failing rows are collected in bulk instead of aborting on the first one. Models
+with validators the columnar path cannot run (wrap and plain field validators,
+model validators other than `mode="before"`) raise `ColumnarNotSupportedError`,
+callers fall back to the per-row path for them.
+"""
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from types import NoneType, UnionType
+from typing import Annotated, Any, Callable, List, Type, Union, get_args, get_origin
+
+import annotated_types
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+ERROR_COLUMNS = ["row", "field", "value", "error"]
+
+# Date(time) strings that pandas and pydantic parse identically
+ISO_DATETIME = re.compile(r"^\d{4}-\d{2}-\d{2}([ T]\d{2}:\d{2}(:\d{2}(\.\d{1,6})?)?)?$")
+
+
+class ColumnarValidationError(ValueError):
+    """Raised by `validate_frame` in strict mode. `errors` lists every failing
+    row with the field, the offending value and the validation message."""
+
+    def __init__(self, model: Type[BaseModel], errors: pd.DataFrame):
+        self.model = model
+        self.errors = errors
+        rows = errors.row.nunique()
+        preview = "; ".join(
+            f"row {e.row} `{e.field}`: {e.error}" for e in errors.head(5).itertuples()
+        )
+        super().__init__(
+            f"{rows} row(s) failed validation against {model.__name__}: {preview}"
+        )
+
+
+class ColumnarNotSupportedError(NotImplementedError):
+    """Raised for models with validators the columnar path cannot run."""
+
+
+@dataclass
+class ColumnRule:
+    """Compiled validation rule for a single model field."""
+
+    name: str
+    key: str
+    aliases: List[str]
+    annotation: Any
+    base_type: Any
+    optional: bool
+    required: bool
+    default: Any
+    validate_default: bool
+    before: List[Callable] = field(default_factory=list)
+    after: List[Callable] = field(default_factory=list)
+    constraints: List[Any] = field(default_factory=list)
+    adapter: TypeAdapter = None
+
+
+@dataclass
+class ColumnarResult:
+    frame: pd.DataFrame
+    errors: pd.DataFrame
+
+    @property
+    def failed_rows(self) -> List[int]:
+        return sorted(self.errors.row.unique().tolist())
+
+
+def _split_optional(annotation) -> tuple[Any, bool]:
+    if get_origin(annotation) in (Union, UnionType):
+        args = [a for a in get_args(annotation) if a is not NoneType]
+        optional = len(args) != len(get_args(annotation))
+        return (args[0] if len(args) == 1 else annotation), optional
+    return annotation, False
+
+
+@lru_cache(maxsize=None)
+def compile_rules(model: Type[BaseModel]) -> List[ColumnRule]:
+    """Translates the fields and field validators of `model` into column rules.
+    Cached per model class."""
+    decorators = model.__pydantic_decorators__
+    populate_by_name = model.model_config.get("populate_by_name", False)
+    rules = []
+
+    for name, info in model.model_fields.items():
+        base_type, optional = _split_optional(info.annotation)
+        key = info.alias or name
+        aliases = [info.alias, name] if info.alias and populate_by_name else [key]
+
+        rule = ColumnRule(
+            name=name,
+            key=key,
+            aliases=aliases,
+            annotation=info.annotation,
+            base_type=base_type,
+            optional=optional,
+            required=info.is_required(),
+            default=(
+                None
+                if info.is_required()
+                else info.get_default(call_default_factory=True)
+            ),
+            validate_default=bool(info.validate_default),
+            constraints=list(info.metadata),
+            adapter=(
+                TypeAdapter(Annotated[(info.annotation, *info.metadata)])
+                if info.metadata
+                else TypeAdapter(info.annotation)
+            ),
+        )
+
+        for dec in decorators.field_validators.values():
+            if name not in dec.info.fields and "*" not in dec.info.fields:
+                continue
+            if dec.info.mode == "before":
+                # pydantic runs `before` validators in reverse definition order
+                rule.before.insert(0, dec.func)
+            elif dec.info.mode == "after":
+                rule.after.append(dec.func)
+            else:
+                raise ColumnarNotSupportedError(
+                    f"{dec.info.mode} validator `{dec.cls_var_name}` on {model.__name__} is not supported in columnar mode"
+                )
+        rules.append(rule)
+
+    return rules
+
+
+def _model_before_validators(model: Type[BaseModel]) -> List[Callable]:
+    validators = []
+    for dec in model.__pydantic_decorators__.model_validators.values():
+        if dec.info.mode != "before":
+            raise ColumnarNotSupportedError(
+                f"{dec.info.mode} model validator `{dec.cls_var_name}` on {model.__name__} is not supported in columnar mode"
+            )
+        validators.insert(0, dec.func)
+    return validators
+
+
+def _error_message(e: Exception) -> str:
+    if isinstance(e, ValidationError):
+        return "; ".join(err["msg"] for err in e.errors())
+    return str(e)
+
+
+def _apply_elementwise(func, values: list, failed: dict) -> list:
+    """Applies `func` to every not yet failed value; records exceptions in
+    `failed` (position -> message)."""
+    out = list(values)
+    for i, v in enumerate(values):
+        if i in failed:
+            continue
+        try:
+            out[i] = func(v)
+        except Exception as e:
+            failed[i] = _error_message(e)
+    return out
+
+
+def _isinstance_mask(values: pd.Series, types) -> np.ndarray:
+    return values.map(lambda v: isinstance(v, types)).to_numpy(dtype=bool)
+
+
+def _to_float(values: pd.Series) -> pd.Series:
+    """`float(v)` for all `values`, raises `ValueError` like `float`."""
+    return pd.Series(
+        values.to_numpy(dtype=object).astype(float), index=values.index, dtype=object
+    )
+
+
+def _try_float(values: pd.Series) -> tuple[pd.Series, np.ndarray]:
+    """`float(v)` for the string `values` `pd.to_numeric` can parse, and a mask of
+    them. The others are left for the validator (which may still parse some, like
+    "1_000")."""
+    parsable = pd.to_numeric(values, errors="coerce").notna().to_numpy()
+    out = values.copy()
+    try:
+        out[parsable] = _to_float(values[parsable])
+    except (ValueError, OverflowError):
+        parsable[:] = False
+    return out, parsable
+
+
+def _to_str(values: pd.Series) -> pd.Series:
+    """`str(v)` for all `values`."""
+    return pd.Series(
+        values.to_numpy(dtype=object).astype(str), index=values.index, dtype=object
+    )
+
+
+# Columnar rules take the column values (object Series) and return the validated
+# values and a mask of the values they handled. Values not handled (e.g. ones
+# that would raise) are passed to the validator itself. Validators in `schema.py`
+# name their rule with `column_rule`.
+
+
+def column_rule(rule: Callable) -> Callable:
+    """Registers the Series `rule` as the columnar version of the decorated
+    (field or model) validator. Apply it below `field_validator` or
+    `model_validator`."""
+
+    def register(validator):
+        getattr(validator, "__func__", validator).column_rule = rule
+        return validator
+
+    return register
+
+
+def get_column_rule(func) -> Callable | None:
+    """Returns the columnar version of the validator `func`, None if there is none."""
+    return getattr(getattr(func, "__func__", func), "column_rule", None)
+
+
+def na_to_none_column(values: pd.Series) -> tuple[pd.Series, np.ndarray]:
+    """`None if pd.isna(v) else v`"""
+    # `pd.isna` of list like values is not a bool
+    handled = values.map(pd.api.types.is_scalar).to_numpy(dtype=bool)
+    is_na = values.isna().to_numpy() & handled
+    return values.where(~is_na, None), handled
+
+
+def ensure_str_column(values: pd.Series) -> tuple[pd.Series, np.ndarray]:
+    """`str(v) if v is not None else None`"""
+    # numpy cannot cast list like values to str
+    handled = values.map(pd.api.types.is_scalar).to_numpy(dtype=bool)
+    convert = handled & values.map(lambda v: v is not None).to_numpy(dtype=bool)
+    out = values.copy()
+    out[convert] = _to_str(values[convert])
+    return out, handled
+
+
+def ensure_float_column(values: pd.Series) -> tuple[pd.Series, np.ndarray]:
+    """`float(v)` for float and int values, others unchanged."""
+    is_number = _isinstance_mask(values, (float, int))
+    out, handled = values.copy(), np.ones(len(values), dtype=bool)
+    try:
+        out[is_number] = _to_float(values[is_number])
+    except OverflowError:
+        handled &= ~is_number
+    return out, handled
+
+
+def ensure_float_stripped_column(values: pd.Series) -> tuple[pd.Series, np.ndarray]:
+    """`ensure_float_column`, and `float(v)` of strings without `%` and `,`."""
+    out, handled = ensure_float_column(values)
+    is_str = _isinstance_mask(values, str)
+    stripped = values[is_str].str.replace("%", "").str.replace(",", "")
+    out[is_str], parsed = _try_float(stripped)
+    handled[np.flatnonzero(is_str)[~parsed]] = False
+    return out, handled
+
+
+def float_to_str_column(values: pd.Series) -> tuple[pd.Series, np.ndarray]:
+    """`str(v)` for float values, others unchanged."""
+    is_float = _isinstance_mask(values, float)
+    out = values.copy()
+    out[is_float] = _to_str(values[is_float])
+    return out, np.ones(len(values), dtype=bool)
+
+
+def measurement_value_column(values: pd.Series) -> tuple[pd.Series, np.ndarray]:
+    """None for `---` strings, `float(v)` of other strings, dicts are left to the
+    validator."""
+    is_str = _isinstance_mask(values, str)
+    is_missing = is_str & (values.where(is_str).str.strip() == "---").to_numpy(
+        dtype=bool
+    )
+    is_value = is_str & ~is_missing
+    out = values.where(~is_missing, None)
+    handled = ~_isinstance_mask(values, dict)
+    out[is_value], parsed = _try_float(values[is_value])
+    handled[np.flatnonzero(is_value)[~parsed]] = False
+    return out, handled
+
+
+def _apply_validator(func, values: list, failed: dict) -> list:
+    """Applies the field validator `func` to `values`: column-wise if it has a
+    column rule, the values the rule does not handle (and validators without rule)
+    one by one."""
+    rule = get_column_rule(func)
+    if rule is None:
+        return _apply_elementwise(func, values, failed)
+
+    series = pd.Series(values, dtype=object)
+    todo = np.ones(len(values), dtype=bool)
+    todo[list(failed)] = False
+
+    out, handled = rule(series[todo])
+    result = list(values)
+    for i, v in zip(np.flatnonzero(todo)[handled], out[handled].tolist()):
+        result[i] = v
+
+    remaining = np.flatnonzero(todo)[~handled]
+    if len(remaining):
+        values_left = _apply_elementwise(
+            func, [values[i] for i in remaining], fails := {}
+        )
+        for i, v in zip(remaining, values_left):
+            result[i] = v
+        failed.update({remaining[j]: msg for j, msg in fails.items()})
+    return result
+
+
+def _apply_model_validator(
+    validator, rule, source: dict, n_rows: int, failed: dict, errors: list
+) -> dict:
+    """Applies the model validator `validator` to all `source` columns with its
+    column `rule`. Rows with values the rule does not handle are validated as
+    records by `validator` itself."""
+    columns, unhandled = {}, np.zeros(n_rows, dtype=bool)
+    for key, values in source.items():
+        out, handled = rule(pd.Series(values, dtype=object))
+        columns[key] = out.tolist()
+        unhandled |= ~handled
+
+    before = dict(failed)
+    for i in np.flatnonzero(unhandled):
+        if i in failed:
+            continue
+        try:
+            record = validator({key: values[i] for key, values in source.items()})
+        except Exception as e:
+            failed[i] = _error_message(e)
+            continue
+        record = record if isinstance(record, dict) else {}
+        for key, values in columns.items():
+            values[i] = record.get(key)
+    errors.extend(
+        (i, "__model__", None, msg) for i, msg in failed.items() if i not in before
+    )
+    return columns
+
+
+def _fast_path_mask(rule: ColumnRule, values: pd.Series) -> np.ndarray:
+    """Marks values whose type is already what pydantic would produce, so they can
+    skip the `TypeAdapter`. Everything else goes through the adapter."""
+    base = rule.base_type
+    if rule.optional:
+        is_none = values.map(lambda v: v is None).to_numpy(dtype=bool)
+    else:
+        is_none = np.zeros(len(values), dtype=bool)
+
+    if base is str:
+        ok = values.map(lambda v: type(v) is str).to_numpy(dtype=bool)
+    elif base is float:
+        ok = values.map(lambda v: type(v) in (float, int, np.float64)).to_numpy(
+            dtype=bool
+        )
+    elif base is int:
+        ok = values.map(lambda v: type(v) is int).to_numpy(dtype=bool)
+    elif base is datetime:
+        ok = values.map(
+            lambda v: (type(v) is str and ISO_DATETIME.match(v) is not None)
+            or (isinstance(v, datetime) and not pd.isna(v) and v.tzinfo is None)
+        ).to_numpy(dtype=bool)
+    else:
+        ok = np.zeros(len(values), dtype=bool)
+
+    return ok | is_none
+
+
+def _check_constraints(rule: ColumnRule, values: pd.Series, mask: np.ndarray):
+    """Vectorized `ge`/`gt`/`le`/`lt` checks for numeric fast path values.
+    Returns a mask of the values violating a constraint."""
+    if rule.base_type not in (float, int) or not rule.constraints:
+        return np.zeros(len(values), dtype=bool)
+
+    numeric = pd.to_numeric(values.where(mask), errors="coerce").to_numpy(dtype=float)
+    bad = np.zeros(len(values), dtype=bool)
+    with np.errstate(invalid="ignore"):
+        for c in rule.constraints:
+            if isinstance(c, annotated_types.Ge):
+                bad |= numeric < c.ge
+            elif isinstance(c, annotated_types.Gt):
+                bad |= numeric <= c.gt
+            elif isinstance(c, annotated_types.Le):
+                bad |= numeric > c.le
+            elif isinstance(c, annotated_types.Lt):
+                bad |= numeric >= c.lt
+    return bad & mask
+
+
+def _coerce(rule: ColumnRule, values: list, failed: dict, use_enum_values: bool):
+    series = pd.Series(values, dtype=object)
+    fast = _fast_path_mask(rule, series)
+    if rule.constraints:
+        # let pydantic decide how NaN compares against `ge`/`le`
+        fast &= ~series.map(lambda v: isinstance(v, float) and np.isnan(v)).to_numpy(
+            dtype=bool
+        )
+    # constraint violations get their error message from pydantic
+    fast &= ~_check_constraints(rule, series, fast)
+
+    out = list(values)
+    for i in np.flatnonzero(~fast):
+        if i in failed:
+            continue
+        try:
+            out[i] = rule.adapter.validate_python(values[i])
+        except Exception as e:
+            failed[i] = _error_message(e)
+
+    if rule.base_type is float:
+        out = [
+            float(v) if v is not None and i not in failed else v
+            for i, v in enumerate(out)
+        ]
+    elif rule.base_type is datetime:
+        out = [
+            pd.Timestamp(v).to_pydatetime() if type(v) is str and i not in failed else v
+            for i, v in enumerate(out)
+        ]
+
+    if use_enum_values:
+        out = [v.value if isinstance(v, Enum) else v for v in out]
+
+    return out
+
+
+def validate_frame(
+    df: pd.DataFrame, model: Type[BaseModel], strict: bool = True
+) -> ColumnarResult:
+    """Validates all rows of `df` against `model` column by column.
+
+    Returns a `ColumnarResult` holding the validated frame (failing rows dropped)
+    and a frame listing all failing rows (`row`, `field`, `value`, `error`). With
+    `strict=True` a `ColumnarValidationError` is raised instead if any row fails,
+    mirroring the per-row path which fails the whole file.
+
+    Raises `ColumnarNotSupportedError` if `model` has validators the columnar path
+    cannot run.
+    """
+    rules = compile_rules(model)
+    model_validators = _model_before_validators(model)
+    use_enum_values = model.model_config.get("use_enum_values", False)
+    index = df.index
+    n_rows = len(df)
+    errors = []
+    failed: dict[int, str] = {}
+
+    # column name -> values; model validators work on (and may alter) row records
+    source = {c: df[c].tolist() for c in df.columns}
+    column_rules = [get_column_rule(v) for v in model_validators]
+    if model_validators and all(column_rules):
+        for validator, rule in zip(model_validators, column_rules):
+            source = _apply_model_validator(
+                validator, rule, source, n_rows, failed, errors
+            )
+    elif model_validators:
+        records = df.to_dict("records")
+        for validator in model_validators:
+            before = dict(failed)
+            records = _apply_elementwise(validator, records, failed)
+            errors.extend(
+                (i, "__model__", None, msg)
+                for i, msg in failed.items()
+                if i not in before
+            )
+        records = [r if isinstance(r, dict) else {} for r in records]
+        keys = dict.fromkeys(k for r in records for k in r)
+        source = {k: [r.get(k) for r in records] for k in keys}
+
+    columns = {}
+    for rule in rules:
+        key = next((a for a in rule.aliases if a in source), None)
+        field_failed: dict[int, str] = {}
+
+        if key is None:
+            if rule.required:
+                field_failed = {i: "Field required" for i in range(n_rows)}
+                values = [None] * n_rows
+            else:
+                values = [rule.default] * n_rows
+                if rule.validate_default:
+                    for validator in rule.before:
+                        values = _apply_validator(validator, values, field_failed)
+                    values = _coerce(rule, values, field_failed, use_enum_values)
+        else:
+            values = source[key]
+            for validator in rule.before:
+                values = _apply_validator(validator, values, field_failed)
+            values = _coerce(rule, values, field_failed, use_enum_values)
+            for validator in rule.after:
+                values = _apply_validator(validator, values, field_failed)
+
+        for i, msg in field_failed.items():
+            raw = source[key][i] if key is not None else None
+            errors.append((i, rule.key, raw, msg))
+            failed.setdefault(i, msg)
+
+        columns[rule.key] = values
+
+    errors = pd.DataFrame(errors, columns=ERROR_COLUMNS)
+    if not errors.empty:
+        # report rows by the index labels of the input frame
+        errors["row"] = index.take(errors.row.to_numpy())
+        errors = errors.sort_values("row", kind="stable").reset_index(drop=True)
+
+    if strict and not errors.empty:
+        raise ColumnarValidationError(model, errors)
+
+    keep = [i for i in range(n_rows) if i not in failed]
+    frame = pd.DataFrame(
+        {key: [values[i] for i in keep] for key, values in columns.items()},
+        columns=list(columns),
+    )
+
+    if not errors.empty:
+        logging.warning(
+            f"{errors.row.nunique()} of {n_rows} rows failed validation against {model.__name__}"
+        )
+
+    return ColumnarResult(frame=frame, errors=errors)
@@ -188,3 +188,9 @@ COLUMN_RENAMER = {
         },
     },
 }
+
+# File name patterns identifying raw data aggregator exports
+JDOPS_EXPORT_PATTERN = (
+    r"(Harvest|Seeding|Application|Tillage)_[0-9]{4}_[a-zA-Z]*\.xlsx$"
+)
+GRANULAR_EXPORT_PATTERN = r"(.*\d{6,}.*)_(\d{4})\.csv$"
@@ -1,6 +1,8 @@
 from enum import Enum
 from typing import List, Type
 
+import pandas as pd
+
 from data_aggregators.files import (
     ClimateFieldViewFile,
     CoverCropTable,
@@ -44,18 +46,36 @@ class AggregatorOperationFactory:
 
     @staticmethod
     def process_files_in_gcs_folder(
-        aggregator: DataAggregators, bucket_name: str, folder_path: str
-    ) -> List:
+        aggregator: DataAggregators,
+        bucket_name: str,
+        folder_path: str,
+        columnar: bool = False,
+        max_workers: int = 1,
+    ) -> List | pd.DataFrame:
         file_class = AggregatorOperationFactory.get_file_class(aggregator)
-        return file_class.process_files_in_gcs_folder(bucket_name, folder_path)
+        return file_class.process_files_in_gcs_folder(
+            bucket_name, folder_path, columnar=columnar, max_workers=max_workers
+        )
 
     @staticmethod
     def process_file_by_type_in_gcs(
-        aggregator: DataAggregators, bucket_name: str, folder_path: str, file_type: str
-    ) -> List:
+        aggregator: DataAggregators,
+        bucket_name: str,
+        folder_path: str,
+        file_type: str,
+        columnar: bool = False,
+        max_workers: int = 1,
+    ) -> List | pd.DataFrame:
+        """With `columnar=True` returns a DataFrame validated column-wise instead of
+        a list of pydantic models. `max_workers` bounds the number of files fetched
+        and parsed concurrently."""
         file_class = AggregatorOperationFactory.get_file_class(aggregator)
         return file_class.process_file_by_type_in_gcs(
-            bucket_name, folder_path, file_type
+            bucket_name,
+            folder_path,
+            file_type,
+            columnar=columnar,
+            max_workers=max_workers,
         )
 
 
@@ -2,13 +2,19 @@ import logging
 import pathlib
 import re
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 # from dataclasses import field
-from typing import Any, Generic, List, Optional, TypeVar
+from typing import Any, Callable, Generic, Hashable, List, Optional, TypeVar
 
 import gcsfs
 import pandas as pd
+from data_aggregators.cache import ObjectCache
 from data_aggregators.clean import Base
+from data_aggregators.columnar import ColumnarNotSupportedError, validate_frame
+from data_aggregators.constants import GRANULAR_EXPORT_PATTERN, JDOPS_EXPORT_PATTERN
+from data_aggregators.listing import ListingIndex
 from data_aggregators.schema import (
     ApplicationDataTemplate,
     CFVApplicationReport,
@@ -41,10 +47,44 @@ from data_aggregators.schema import (
 from pydantic import BaseModel, Field
 from pydantic.dataclasses import dataclass
 
+from src.feedstock_aggregation_scripts.config import settings
 from src.feedstock_aggregation_scripts.data_prep.constants import CROP_TYPES
 
 GOOGLE_CLOUD_FILE_SYSTEM = gcsfs.GCSFileSystem()
 
+RAW_DATA_CACHE = (
+    ObjectCache(
+        cache_dir=settings.raw_data_cache.path,
+        max_bytes=settings.raw_data_cache.max_size_mb * 1024**2,
+    )
+    if settings.raw_data_cache.enabled
+    else None
+)
+
+
+# Folder listings are cached for the whole run, see `data_aggregators/listing.py`
+LISTING_INDEX = ListingIndex()
+
+
+def list_folder(bucket_name: str, folder_path: str) -> List[str]:
+    """Lists `folder_path` in the bucket, answered from the run's listing index."""
+    return LISTING_INDEX.ls(GOOGLE_CLOUD_FILE_SYSTEM, f"{bucket_name}/{folder_path}")
+
+
+def prefetch_listing(bucket_name: str, folder_path: str):
+    """Lists everything below `folder_path` (e.g. all growers' raw data) in one
+    paginated call; later `list_folder` calls below it are served from memory."""
+    LISTING_INDEX.prefetch(GOOGLE_CLOUD_FILE_SYSTEM, f"{bucket_name}/{folder_path}")
+
+
+def open_raw_file(file_path: str):
+    """Opens `file_path` on GCS for binary reading, served from the local raw data
+    cache if enabled."""
+    if RAW_DATA_CACHE is None:
+        return GOOGLE_CLOUD_FILE_SYSTEM.open(file_path, "rb")
+    return RAW_DATA_CACHE.open(GOOGLE_CLOUD_FILE_SYSTEM, file_path)
+
+
 T = TypeVar("T")
 
 
@@ -58,7 +98,7 @@ class DataFile(BaseModel, Generic[T]):
     @classmethod
     @abstractmethod
     def read_file(cls, file_path: str) -> pd.DataFrame:
-        with GOOGLE_CLOUD_FILE_SYSTEM.open(file_path, "rb") as f:
+        with open_raw_file(file_path) as f:
             if file_path.endswith(".csv"):
                 return pd.read_csv(f)
             elif file_path.endswith(".xlsx"):
@@ -73,6 +113,71 @@ class DataFile(BaseModel, Generic[T]):
     def from_file(cls, file_path: str) -> "DataFile":
         pass
 
+    @classmethod
+    @abstractmethod
+    def frame_from_file(cls, file_path: str) -> pd.DataFrame:
+        """Columnar counterpart of `from_file`. Validates whole columns against the
+        schema and returns the same frame as `to_frame()` on the per-row result."""
+        pass
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [operation.model_dump(by_alias=True) for operation in self.operations]
+        )
+
+    @classmethod
+    def load_files(
+        cls,
+        files: List[str],
+        columnar: bool = False,
+        skip_failed: bool = False,
+        max_workers: int = 1,
+    ) -> List | pd.DataFrame:
+        """Reads all `files` and returns the combined operations. With `columnar=True`
+        returns a single DataFrame built via `frame_from_file` instead, files whose
+        model cannot be validated column-wise are validated row by row
+        (`from_file(...).to_frame()`).
+
+        `skip_failed` logs and skips files that fail to process instead of raising.
+
+        `max_workers > 1` downloads and parses up to `max_workers` files at once in a
+        thread pool. Results are still combined in the order of `files`.
+        """
+
+        def load(file: str) -> List | pd.DataFrame:
+            if columnar:
+                try:
+                    return cls.frame_from_file(file_path=file)
+                except ColumnarNotSupportedError as e:
+                    logging.warning(f"{e}, validating {file} row by row")
+                    return cls.from_file(file_path=file).to_frame()
+            return cls.from_file(file_path=file).operations
+
+        if max_workers > 1 and len(files) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as pool:
+                futures = [pool.submit(load, file) for file in files]
+            loaded = [future.result for future in futures]
+        else:
+            loaded = [partial(load, file) for file in files]
+
+        operations = []
+        frames = []
+
+        for file, result in zip(files, loaded):
+            try:
+                if columnar:
+                    frames.append(result())
+                else:
+                    operations.extend(result())
+            except Exception as e:
+                if not skip_failed:
+                    raise
+                logging.error(f"Error processing file {file}: {e}")
+
+        if columnar:
+            return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        return operations
+
 
 class ClimateFieldViewFile(DataFile[CFVData]):
     def add_operation(self, operation: "CFVData"):
@@ -122,6 +227,35 @@ class ClimateFieldViewFile(DataFile[CFVData]):
 
         return file
 
+    @classmethod
+    def frame_from_file(cls, file_path: str) -> pd.DataFrame:
+        df = cls.read_file(file_path)
+        cleaner = Base(filepath=file_path)
+
+        crop_type = pathlib.Path(file_path).stem.split("_")[-1]
+
+        df["Crop_type"] = crop_type if crop_type in CROP_TYPES else None
+        df = df.rename(
+            columns={
+                "Unnamed: 0": "Client",
+                "Unnamed: 1": "Farm_name",
+            }
+        )
+
+        if cleaner.report_type == "Application":
+            model = CFVApplicationReport
+        elif cleaner.report_type == "Harvest":
+            model = CFVHarvestReport
+        elif cleaner.report_type == "Seeding" or cleaner.report_type == "Planting":
+            model = CFVPlantingReport
+        else:
+            return pd.DataFrame()
+
+        frame = validate_frame(df, model).frame
+        frame["File_type"] = cleaner.report_type
+
+        return frame
+
     @classmethod
     def add_operations(
         cls,
@@ -147,56 +281,53 @@ class ClimateFieldViewFile(DataFile[CFVData]):
 
     @staticmethod
     def process_files_in_gcs_folder(
-        bucket_name: str, folder_path: str
-    ) -> List[CFVData]:
+        bucket_name: str, folder_path: str, columnar: bool = False, max_workers: int = 1
+    ) -> List[CFVData] | pd.DataFrame:
         try:
-            files = GOOGLE_CLOUD_FILE_SYSTEM.ls(f"{bucket_name}/{folder_path}")
+            files = list_folder(bucket_name, folder_path)
         except Exception as e:
             logging.error(
                 f"Error accessing files in bucket {bucket_name} at {folder_path}: {e}"
             )
-            return []
+            return pd.DataFrame() if columnar else []
 
-        combined_data = []
         grower_name = folder_path.strip("/").split("/")[-1]
         report_types = ["Harvest", "Planting", "Application"]
 
-        for file in files:
-            file_lower = file.lower()
-            if (
-                "@" in file_lower
-                and grower_name.lower() in file_lower
-                and any(rt.lower() in file_lower for rt in report_types)
-            ):
-                try:
-                    cfv_file = ClimateFieldViewFile.from_file(file_path=file)
-                    combined_data.extend(cfv_file.operations)
-                except Exception as e:
-                    logging.error(f"Error processing file {file}: {e}")
+        files = [
+            file
+            for file in files
+            if "@" in file.lower()
+            and grower_name.lower() in file.lower()
+            and any(rt.lower() in file.lower() for rt in report_types)
+        ]
 
-        return combined_data
+        return ClimateFieldViewFile.load_files(
+            files, columnar=columnar, skip_failed=True, max_workers=max_workers
+        )
 
     @staticmethod
     def process_file_by_type_in_gcs(
-        bucket_name: str, folder_path: str, file_type: str
-    ) -> List[CFVData]:
+        bucket_name: str,
+        folder_path: str,
+        file_type: str,
+        columnar: bool = False,
+        max_workers: int = 1,
+    ) -> List[CFVData] | pd.DataFrame:
         """Reads only file by file_type from GCS bucket.
 
         `file_type` is using constants defined at `src/feedstock_aggregation_scripts/data_prep/constants.py`.
-        Those file types are defined to contain parts of the name of the target file."""
-        files = GOOGLE_CLOUD_FILE_SYSTEM.ls(f"{bucket_name}/{folder_path}")
+        Those file types are defined to contain parts of the name of the target file.
 
-        combined_data = []
+        With `columnar=True` the files are validated column-wise and returned as one DataFrame.
+        """
+        files = list_folder(bucket_name, folder_path)
 
-        for file in files:
-            if "@" in file and file_type in file:
-                try:
-                    cfv_file = ClimateFieldViewFile.from_file(file_path=file)
-                    combined_data.extend(cfv_file.operations)
-                except Exception as e:
-                    logging.error(f"Error processing file {file}: {e}")
+        files = [file for file in files if "@" in file and file_type in file]
 
-        return combined_data
+        return ClimateFieldViewFile.load_files(
+            files, columnar=columnar, skip_failed=True, max_workers=max_workers
+        )
 
 
 # @dataclass
@@ -285,34 +416,59 @@ class MyJohnDeereFile(DataFile[MyJohnDeereData]):
 
         return file
 
+    @classmethod
+    def frame_from_file(cls, file_path: str) -> pd.DataFrame:
+        df = cls.read_file(file_path=file_path)
+        cleaner = Base(filepath=file_path)
+
+        if cleaner.report_type == "Application":
+            model = MyJohnDeereApplication
+        elif cleaner.report_type == "Harvest":
+            model = MyJohnDeereHarvest
+        elif cleaner.report_type == "Seeding":
+            model = MyJohnDeerePlanting
+        elif cleaner.report_type == "Tillage":
+            model = MyJohnDeereTillage
+        else:
+            return pd.DataFrame()
+
+        frame = validate_frame(df, model).frame
+        frame["File_type"] = cleaner.report_type
+
+        return frame
+
     @staticmethod
-    def process_files_in_gcs_folder(bucket_name: str, folder_path: str) -> List:
-        files = GOOGLE_CLOUD_FILE_SYSTEM.ls(f"{bucket_name}/{folder_path}")
-        combined_operations = []
+    def process_files_in_gcs_folder(
+        bucket_name: str, folder_path: str, columnar: bool = False, max_workers: int = 1
+    ) -> List | pd.DataFrame:
+        files = list_folder(bucket_name, folder_path)
 
-        for file in files:
-            if re.search(
-                r"(Harvest|Seeding|Application|Tillage)_[0-9]{4}_[a-zA-Z]*\.xlsx$", file
-            ):
-                john_deere_file = MyJohnDeereFile.from_file(file)
-                combined_operations.extend(john_deere_file.operations)
+        files = [file for file in files if re.search(JDOPS_EXPORT_PATTERN, file)]
 
-        return combined_operations
+        return MyJohnDeereFile.load_files(
+            files, columnar=columnar, max_workers=max_workers
+        )
 
     @staticmethod
     def process_file_by_type_in_gcs(
-        bucket_name: str, folder_path: str, file_type: str
-    ) -> List[MyJohnDeereData]:
+        bucket_name: str,
+        folder_path: str,
+        file_type: str,
+        columnar: bool = False,
+        max_workers: int = 1,
+    ) -> List[MyJohnDeereData] | pd.DataFrame:
         """Reads only file by file_type from GCS bucket."""
-        files = GOOGLE_CLOUD_FILE_SYSTEM.ls(f"{bucket_name}/{folder_path}")
-        combined_operations = []
+        files = list_folder(bucket_name, folder_path)
 
-        for file in files:
-            if re.search(rf"{file_type}_[0-9]{{4}}_[a-zA-Z]*\.xlsx", file):
-                john_deere_file = MyJohnDeereFile.from_file(file)
-                combined_operations.extend(john_deere_file.operations)
+        files = [
+            file
+            for file in files
+            if re.search(rf"{file_type}_[0-9]{{4}}_[a-zA-Z]*\.xlsx", file)
+        ]
 
-        return combined_operations
+        return MyJohnDeereFile.load_files(
+            files, columnar=columnar, max_workers=max_workers
+        )
 
 
 # @dataclass
@@ -358,31 +514,69 @@ class GranularFile(DataFile[GranularData]):
 
         return file
 
-    @staticmethod
-    def process_files_in_gcs_folder(bucket_name: str, folder_path: str):
-        files = GOOGLE_CLOUD_FILE_SYSTEM.ls(f"{bucket_name}/{folder_path}")
-        combined_operations = []
+    @classmethod
+    def frame_from_file(cls, file_path: str) -> pd.DataFrame:
+        df = cls.read_file(file_path=file_path)
+        file_name = file_path.lower()
+        data_source = None
+
+        if "yield" in file_name:
+            model, file_type = GranularHarvestData, "Harvest"
+        elif "application" in file_name:
+            model, file_type = GranularApplicationData, "Application"
+        # See `from_file`: planting and tillage files are stored in target column header format
+        elif "planting" in file_name:
+            model, file_type = PlantingDataTemplate, "Planting"
+            data_source = "Granular"
+        elif "tillage" in file_name:
+            model, file_type = TillageDataTemplate, "Tillage"
+            data_source = "Granular"
+        else:
+            return pd.DataFrame()
+
+        frame = validate_frame(df, model).frame
+        frame["File_type"] = file_type
+        if data_source is not None:
+            frame["Data_source"] = data_source
+
+        return frame
 
-        for file in files:
-            if re.match(r"(.*\d{6,}.*)_(\d{4})\.csv$", file, re.IGNORECASE):
-                granular_file = GranularFile.from_file(file)
-                combined_operations.extend(granular_file.operations)
-        return combined_operations
+    @staticmethod
+    def process_files_in_gcs_folder(
+        bucket_name: str, folder_path: str, columnar: bool = False, max_workers: int = 1
+    ) -> List | pd.DataFrame:
+        files = list_folder(bucket_name, folder_path)
+
+        files = [
+            file
+            for file in files
+            if re.match(GRANULAR_EXPORT_PATTERN, file, re.IGNORECASE)
+        ]
+
+        return GranularFile.load_files(
+            files, columnar=columnar, max_workers=max_workers
+        )
 
     @staticmethod
     def process_file_by_type_in_gcs(
-        bucket_name: str, folder_path: str, file_type: str
-    ) -> List[GranularData]:
+        bucket_name: str,
+        folder_path: str,
+        file_type: str,
+        columnar: bool = False,
+        max_workers: int = 1,
+    ) -> List[GranularData] | pd.DataFrame:
         """Reads only file by file_type from GCS bucket."""
-        files = GOOGLE_CLOUD_FILE_SYSTEM.ls(f"{bucket_name}/{folder_path}")
-        combined_operations = []
+        files = list_folder(bucket_name, folder_path)
 
-        for file in files:
-            if file_type in file or f"Granular_{file_type}" in file:
-                granular_file = GranularFile.from_file(file)
-                combined_operations.extend(granular_file.operations)
+        files = [
+            file
+            for file in files
+            if file_type in file or f"Granular_{file_type}" in file
+        ]
 
-        return combined_operations
+        return GranularFile.load_files(
+            files, columnar=columnar, max_workers=max_workers
+        )
 
 
 # @dataclass
@@ -421,20 +615,40 @@ class FarmMobileFile(DataFile):
 
         return file
 
+    @classmethod
+    def frame_from_file(cls, file_path: str) -> pd.DataFrame:
+        df = cls.read_file(file_path=file_path)
+
+        if "_SP_" in file_path:
+            model, file_type = FarMobileApplication, "Application"
+        elif "_HR_" in file_path:
+            model, file_type = FarMobileHarvest, "Harvest"
+        elif "_TL_" in file_path:
+            model, file_type = FarMobileTillage, "Tillage"
+        else:
+            return pd.DataFrame()
+
+        frame = validate_frame(df, model).frame
+        frame["File_type"] = file_type
+
+        return frame
+
     @staticmethod
     def process_file_by_type_in_gcs(
-        bucket_name: str, folder_path: str, file_type: str
-    ) -> List[FarMobileData]:
+        bucket_name: str,
+        folder_path: str,
+        file_type: str,
+        columnar: bool = False,
+        max_workers: int = 1,
+    ) -> List[FarMobileData] | pd.DataFrame:
         """Reads only file by file_type from GCS bucket."""
-        files = GOOGLE_CLOUD_FILE_SYSTEM.ls(f"{bucket_name}/{folder_path}")
-        combined_operations = []
+        files = list_folder(bucket_name, folder_path)
 
-        for file in files:
-            if file_type in file and "efr_data_" in file:
-                fm_file = FarmMobileFile.from_file(file)
-                combined_operations.extend(fm_file.operations)
+        files = [file for file in files if file_type in file and "efr_data_" in file]
 
-        return combined_operations
+        return FarmMobileFile.load_files(
+            files, columnar=columnar, max_workers=max_workers
+        )
 
 
 # @dataclass
@@ -481,39 +695,64 @@ class DataTemplateFile(DataFile[DataTemplate]):
 
             file.add_operation(operation)
 
+        return file
+
+    @classmethod
+    def frame_from_file(cls, file_path: str) -> pd.DataFrame:
+        df = cls.read_file(file_path=file_path)
+
+        cleaner = Base(filepath=file_path)
+        file_name = file_path.strip("/").split("/")[-1]
+
+        # Same as the per-row path: np.nan -> None before validation
+        df = df.astype(object).where(pd.notnull(df), None)
+
+        if cleaner.report_type == "application":
+            model = ApplicationDataTemplate
+        elif cleaner.report_type == "harvest":
+            model = HarvestDataTemplate
+        elif cleaner.report_type == "planting":
+            model = PlantingDataTemplate
+        else:
+            return pd.DataFrame()
+
+        frame = validate_frame(df, model).frame
+        frame["Client"] = file_name.split(f"_{cleaner.report_type}_data_template_")[0]
+        frame["Data_source"] = file_name.split(
+            f"_{cleaner.report_type}_data_template_"
+        )[-1].split(".csv")[0]
+
+        return frame
+
     @staticmethod
-    def process_files_in_gcs_folder(bucket_name: str, folder_path: str) -> List:
+    def process_files_in_gcs_folder(
+        bucket_name: str, folder_path: str, columnar: bool = False, max_workers: int = 1
+    ) -> List | pd.DataFrame:
         try:
-            files = GOOGLE_CLOUD_FILE_SYSTEM.ls(f"{bucket_name}/{folder_path}")
+            files = list_folder(bucket_name, folder_path)
         except Exception as e:
             logging.error(
                 f"Error accessing files in bucket {bucket_name} at {folder_path}: {e}"
             )
-            return []
+            return pd.DataFrame() if columnar else []
 
-        combined_data = []
         grower_name = folder_path.strip("/").split("/")[-1]
         report_types = ["Harvest", "Planting", "Application"]
         print(folder_path)
         # data_source =
         # crop_types = ["Corn", "Soybean", "Soybeans"]
 
-        for file in files:
-            print(file)
-            file_lower = file.lower()
+        files = [
+            file
+            for file in files
+            if grower_name.lower() in file.lower()
+            and any(rt.lower() in file.lower() for rt in report_types)
+            and "_data_template_" in file.lower()
+        ]
 
-            if (
-                grower_name.lower() in file_lower
-                and any(rt.lower() in file_lower for rt in report_types)
-                and "_data_template_" in file_lower
-            ):
-                try:
-                    template_file = DataTemplateFile.from_file(file_path=file)
-                    combined_data.extend(template_file.operations)
-                except Exception as e:
-                    logging.error(f"Error processing file {file}: {e}")
-
-        return combined_data
+        return DataTemplateFile.load_files(
+            files, columnar=columnar, skip_failed=True, max_workers=max_workers
+        )
 
 
 """ MAPPING FILES """
@@ -532,7 +771,7 @@ class MappingFile(ABC):
     @classmethod
     @abstractmethod
     def read_file(cls, file_path: str) -> pd.DataFrame:
-        with GOOGLE_CLOUD_FILE_SYSTEM.open(file_path, "rb") as f:
+        with open_raw_file(file_path) as f:
             if file_path.endswith(".csv"):
                 return pd.read_csv(f)
             elif file_path.endswith(".xlsx"):
@@ -547,6 +786,51 @@ class MappingFile(ABC):
     def from_file(cls, file_path: str) -> "DataFile":
         pass
 
+    def index(self, name: str, key: Callable[[Any], Hashable]) -> dict:
+        """Hash index `key(entry) -> position` over `self.entries`, keeping the FIRST
+        entry per key like the former linear scans. Built on first use and reset
+        whenever entries are added."""
+        indexes = self.__dict__.setdefault("_indexes", {})
+        if name not in indexes:
+            index = {}
+            for position, entry in enumerate(self.entries):
+                index.setdefault(key(entry), position)
+            indexes[name] = index
+        return indexes[name]
+
+    def reset_indexes(self):
+        self.__dict__.pop("_indexes", None)
+        self.__dict__.pop("_entries_frame", None)
+
+    def entries_frame(self) -> pd.DataFrame:
+        """All entries as DataFrame, one row per entry in `self.entries` order."""
+        if "_entries_frame" not in self.__dict__:
+            self._entries_frame = pd.DataFrame(
+                [entry.model_dump() for entry in self.entries]
+            )
+        return self._entries_frame
+
+    def entries_at(
+        self, positions: pd.Series, query: pd.Series | pd.DataFrame
+    ) -> pd.DataFrame:
+        """Returns the entries at `positions` (NaN for misses) aligned with the index
+        of `positions`. Logs a single summary of the `query` values without a match."""
+        table = self.entries_frame()
+        missing = positions.isna()
+        # an all-NaN row appended to the table serves every miss (position -1)
+        padded = pd.concat([table, pd.DataFrame(index=[-1], columns=table.columns)])
+        result = padded.iloc[positions.fillna(-1).astype(int).to_numpy()]
+        result.index = positions.index
+
+        if missing.any():
+            misses = query[missing].drop_duplicates()
+            logging.warning(
+                f"{type(self).__name__}: no matching entry for {missing.sum()} of {len(positions)} queries "
+                f"({len(misses)} unique), e.g. {misses.head(10).values.tolist()}"
+            )
+
+        return result
+
 
 @dataclass
 class InputBreakdownTable(MappingFile):
@@ -583,7 +867,7 @@ class InputBreakdownTable(MappingFile):
         bucket_name: str, folder_path: str
     ) -> List[InputBreakdownData]:
         try:
-            files = GOOGLE_CLOUD_FILE_SYSTEM.ls(f"{bucket_name}/{folder_path}")
+            files = list_folder(bucket_name, folder_path)
         except Exception as e:
             logging.error(
                 f"Error accessing files in bucket {bucket_name} at {folder_path}: {e}"
@@ -618,6 +902,7 @@ class FieldNameMapping(MappingFile):
         if not isinstance(entry, FieldNameMappingData):
             raise TypeError("mapping must be an instance of FieldNameMappingData")
         self.entries.append(entry)
+        self.reset_indexes()
 
     @classmethod
     def read_file(cls, file_path: str) -> pd.DataFrame:
@@ -637,7 +922,7 @@ class FieldNameMapping(MappingFile):
         return file
 
     def query_entry(
-        self, field_name: str, farm_name: str | None = None
+        self, field_name: str, farm_name: str | None = None, verbose: bool = True
     ) -> FieldNameMappingData:
         """Returns entry with matching parameters for `field_name` and `farm_name`. If `farm_name`
         equals `None`, it matches only using the `field_name`. If no entry entry is available, returns `None`.
@@ -657,20 +942,56 @@ class FieldNameMapping(MappingFile):
         if field_name is None:
             raise ValueError("field_name must be given for query")
 
-        for entry in self.entries:
-            if entry.farm_name == farm_name and entry.name == field_name:
-                return entry
-        logging.warning(
-            f"No matching clear name for inputs field_name: {field_name}, farm_name: {farm_name}"
+        position = self.position(field_name, farm_name)
+        if position is None:
+            if verbose:
+                logging.warning(
+                    f"No matching clear name for inputs field_name: {field_name}, farm_name: {farm_name}"
+                )
+            return None
+        return self.entries[position]
+
+    def farm_and_name_index(self) -> dict:
+        return self.index("farm_and_name", lambda entry: (entry.farm_name, entry.name))
+
+    def name_index(self) -> dict:
+        return self.index("name", lambda entry: entry.name)
+
+    def position(self, field_name: str, farm_name: str | None = None) -> int | None:
+        """Position of the entry `query_entry` returns, `None` if nothing matches."""
+        if farm_name is None or pd.isna(farm_name):
+            # entries without farm name first, then any entry with that field name
+            position = self.farm_and_name_index().get((None, field_name))
+            if position is None:
+                position = self.name_index().get(field_name)
+            return position
+        return self.farm_and_name_index().get((farm_name, field_name))
+
+    def query_many(
+        self, field_names: pd.Series, farm_names: pd.Series | None = None
+    ) -> pd.DataFrame:
+        """Bulk version of `query_entry`: returns one row of entry columns per
+        `field_names` row, aligned with its index (NaN where nothing matches). Rows
+        without a farm name are matched by field name only."""
+        if farm_names is None:
+            positions = [self.position(name) for name in field_names]
+            query = field_names
+        else:
+            positions = [
+                self.position(name, farm) for name, farm in zip(field_names, farm_names)
+            ]
+            query = pd.DataFrame({"farm_name": farm_names, "name": field_names})
+
+        return self.entries_at(
+            pd.Series(positions, index=field_names.index, dtype=float), query
         )
-        return None
 
     @staticmethod
     def process_file_in_gcs_folder(
         bucket_name: str, folder_path: str
     ) -> List[FieldNameMappingData]:
         try:
-            files = GOOGLE_CLOUD_FILE_SYSTEM.ls(f"{bucket_name}/{folder_path}")
+            files = list_folder(bucket_name, folder_path)
         except Exception as e:
             logging.error(
                 f"Error accessing files in bucket {bucket_name} at {folder_path}: {e}"
@@ -704,6 +1025,7 @@ class ProductNameMapping(MappingFile):
         if not isinstance(entry, ProductNameMappingData):
             raise TypeError("mapping must be an instance of FieldNameMappingData")
         self.entries.append(entry)
+        self.reset_indexes()
 
     @classmethod
     def read_file(cls, file_path: str) -> pd.DataFrame:
@@ -722,7 +1044,9 @@ class ProductNameMapping(MappingFile):
 
         return file
 
-    def query_entry(self, product_name: str) -> ProductNameMappingData:
+    def query_entry(
+        self, product_name: str, verbose: bool = True
+    ) -> ProductNameMappingData:
         """Returns entry with matching parameter for `product_name`.
         If no entry entry is available, returns `None`.
 
@@ -734,20 +1058,29 @@ class ProductNameMapping(MappingFile):
         if product_name is None:
             raise ValueError("product_name must be given for query")
 
-        for entry in self.entries:
-            if entry.name == product_name:
-                return entry
-        logging.warning(
-            f"No matching clear name for input product_name: `{product_name}`"
-        )
-        return None
+        position = self.name_index().get(product_name)
+        if position is None:
+            if verbose:
+                logging.warning(
+                    f"No matching clear name for input product_name: `{product_name}`"
+                )
+            return None
+        return self.entries[position]
+
+    def name_index(self) -> dict:
+        return self.index("name", lambda entry: entry.name)
+
+    def query_many(self, product_names: pd.Series) -> pd.DataFrame:
+        """Bulk version of `query_entry`, aligned with the index of `product_names`."""
+        positions = product_names.map(self.name_index().get)
+        return self.entries_at(positions.astype(float), product_names)
 
     @staticmethod
     def process_file_in_gcs_folder(
         bucket_name: str, folder_path: str
     ) -> List[ProductNameMappingData]:
         try:
-            files = GOOGLE_CLOUD_FILE_SYSTEM.ls(f"{bucket_name}/{folder_path}")
+            files = list_folder(bucket_name, folder_path)
         except Exception as e:
             logging.error(
                 f"Error accessing files in bucket {bucket_name} at {folder_path}: {e}"
@@ -777,6 +1110,7 @@ class CoverCropTable(MappingFile):
         if not isinstance(entry, CoverCropTableData):
             raise TypeError("mapping must be an instance of CoverCropTableData")
         self.entries.append(entry)
+        self.reset_indexes()
 
     @classmethod
     def read_file(cls, file_path: str) -> pd.DataFrame:
@@ -795,7 +1129,9 @@ class CoverCropTable(MappingFile):
 
         return file
 
-    def query_entry(self, cover_crop_name: str) -> CoverCropTableData | None:
+    def query_entry(
+        self, cover_crop_name: str, verbose: bool = True
+    ) -> CoverCropTableData | None:
         """Returns entry for `cover_crop_name`. If no entry entry is available, returns `None`.
         Entries contain:
 
@@ -808,18 +1144,27 @@ class CoverCropTable(MappingFile):
         if cover_crop_name is None:
             raise ValueError("cover_crop_name must be given for query")
 
-        for entry in self.entries:
-            if entry.Cover_crop_type == cover_crop_name:
-                return entry
-        logging.warning(
-            f"No matching clear name for input product_name: `{cover_crop_name}`"
-        )
-        return None
+        position = self.cover_crop_index().get(cover_crop_name)
+        if position is None:
+            if verbose:
+                logging.warning(
+                    f"No matching clear name for input product_name: `{cover_crop_name}`"
+                )
+            return None
+        return self.entries[position]
+
+    def cover_crop_index(self) -> dict:
+        return self.index("cover_crop_type", lambda entry: entry.Cover_crop_type)
+
+    def query_many(self, cover_crop_names: pd.Series) -> pd.DataFrame:
+        """Bulk version of `query_entry`, aligned with the index of `cover_crop_names`."""
+        positions = cover_crop_names.map(self.cover_crop_index().get)
+        return self.entries_at(positions.astype(float), cover_crop_names)
 
     @staticmethod
     def process_file_in_gcs_folder(bucket_name: str, folder_path: str) -> pd.DataFrame:
         try:
-            files = GOOGLE_CLOUD_FILE_SYSTEM.ls(f"{bucket_name}/{folder_path}")
+            files = list_folder(bucket_name, folder_path)
         except Exception as e:
             logging.error(
                 f"Error accessing files in bucket {bucket_name} at {folder_path}: {e}"
@@ -852,6 +1197,7 @@ class UnitNameMapping(MappingFile):
         if not isinstance(entry, UnitNameMappingData):
             raise TypeError("mapping must be an instance of UnitNameMappingData")
         self.entries.append(entry)
+        self.reset_indexes()
 
     @classmethod
     def read_file(cls, file_path: str) -> pd.DataFrame:
@@ -870,7 +1216,9 @@ class UnitNameMapping(MappingFile):
 
         return file
 
-    def query_entry(self, unit_name: str) -> UnitNameMappingData | None:
+    def query_entry(
+        self, unit_name: str, verbose: bool = True
+    ) -> UnitNameMappingData | None:
         """Returns entry for `unit_name`. If no entry entry is available, returns `None`.
         Entries contain:
 
@@ -882,18 +1230,27 @@ class UnitNameMapping(MappingFile):
         if unit_name is None:
             raise ValueError("unit_name must be given for query")
 
-        for entry in self.entries:
-            if entry.unit == unit_name:
-                return entry
-        logging.warning(f"No matching entry for unit: `{unit_name}`")
-        return None
+        position = self.unit_index().get(unit_name)
+        if position is None:
+            if verbose:
+                logging.warning(f"No matching entry for unit: `{unit_name}`")
+            return None
+        return self.entries[position]
+
+    def unit_index(self) -> dict:
+        return self.index("unit", lambda entry: entry.unit)
+
+    def query_many(self, unit_names: pd.Series) -> pd.DataFrame:
+        """Bulk version of `query_entry`, aligned with the index of `unit_names`."""
+        positions = unit_names.map(self.unit_index().get)
+        return self.entries_at(positions.astype(float), unit_names)
 
     @staticmethod
     def process_file_in_gcs_folder(
         bucket_name: str, folder_path: str
     ) -> List[UnitNameMappingData]:
         try:
-            files = GOOGLE_CLOUD_FILE_SYSTEM.ls(f"{bucket_name}/{folder_path}")
+            files = list_folder(bucket_name, folder_path)
         except Exception as e:
             logging.error(
                 f"Error accessing files in bucket {bucket_name} at {folder_path}: {e}"
@@ -932,6 +1289,7 @@ class UnitConversionTable(MappingFile):
         if not isinstance(entry, UnitConversionTableData):
             raise TypeError("mapping must be an instance of UnitConversionTableData")
         self.entries.append(entry)
+        self.reset_indexes()
 
     @classmethod
     def read_file(cls, file_path: str) -> pd.DataFrame:
@@ -950,7 +1308,9 @@ class UnitConversionTable(MappingFile):
 
         return file
 
-    def query_entry(self, unit_name: str) -> UnitConversionTableData | None:
+    def query_entry(
+        self, unit_name: str, verbose: bool = True
+    ) -> UnitConversionTableData | None:
         """Returns entry for `unit_name`. If no entry entry is available, returns `None`.
         Entries contain:
 
@@ -964,18 +1324,28 @@ class UnitConversionTable(MappingFile):
         if unit_name is None:
             raise ValueError("unit_name must be given for query")
 
-        for entry in self.entries:
-            if entry.unit == unit_name.lower():
-                return entry
-        logging.warning(f"No matching entry for unit: `{unit_name}`")
-        return None
+        position = self.unit_index().get(unit_name.lower())
+        if position is None:
+            if verbose:
+                logging.warning(f"No matching entry for unit: `{unit_name}`")
+            return None
+        return self.entries[position]
+
+    def unit_index(self) -> dict:
+        return self.index("unit", lambda entry: entry.unit)
+
+    def query_many(self, unit_names: pd.Series) -> pd.DataFrame:
+        """Bulk version of `query_entry` (units are matched lowercased), aligned with
+        the index of `unit_names`."""
+        positions = unit_names.str.lower().map(self.unit_index().get)
+        return self.entries_at(positions.astype(float), unit_names)
 
     @staticmethod
     def process_file_in_gcs_folder(
         bucket_name: str, folder_path: str
     ) -> List[UnitConversionTableData]:
         try:
-            files = GOOGLE_CLOUD_FILE_SYSTEM.ls(f"{bucket_name}/{folder_path}")
+            files = list_folder(bucket_name, folder_path)
         except Exception as e:
             logging.error(
                 f"Error accessing files in bucket {bucket_name} at {folder_path}: {e}"
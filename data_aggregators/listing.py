@@ -0,0 +1,68 @@
+"""In-memory index of bucket folder listings.
+
+Every `process_*_in_gcs*` call used to list its folder on GCS again. The
+`ListingIndex` lists each folder once per run and answers repeated listings from
+memory. `prefetch` lists a whole prefix (e.g. all growers' raw data) with one
+recursive, paginated call and serves every folder below it.
+"""
+import posixpath
+import threading
+from collections import defaultdict
+from typing import List
+
+from fsspec import AbstractFileSystem
+
+
+def normalize(fs: AbstractFileSystem, path: str) -> str:
+    return fs._strip_protocol(str(path)).rstrip("/")
+
+
+class ListingIndex:
+    def __init__(self):
+        self._folders: dict[str, List[str]] = {}
+        self._prefetched: List[str] = []
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._folders.clear()
+            self._prefetched.clear()
+
+    def prefetch(self, fs: AbstractFileSystem, prefix: str):
+        """Lists all objects below `prefix` in one recursive call and indexes every
+        folder below it."""
+        prefix = normalize(fs, prefix)
+        folders = defaultdict(dict)
+
+        for file in fs.find(prefix):
+            file = normalize(fs, file)
+            parent = posixpath.dirname(file)
+            folders[parent][file] = None
+            # register sub folders in their parents like `ls` does
+            while parent != prefix and parent.startswith(prefix + "/"):
+                folders[posixpath.dirname(parent)][parent] = None
+                parent = posixpath.dirname(parent)
+
+        with self._lock:
+            for folder, entries in folders.items():
+                self._folders[folder] = sorted(entries)
+            self._prefetched.append(prefix)
+
+    def ls(self, fs: AbstractFileSystem, path: str) -> List[str]:
+        """Drop-in for `fs.ls(path)` (without details), served from memory after the
+        first call."""
+        path = normalize(fs, path)
+
+        with self._lock:
+            if path in self._folders:
+                return list(self._folders[path])
+            covered = any(
+                path == p or path.startswith(p + "/") for p in self._prefetched
+            )
+        if covered:
+            raise FileNotFoundError(path)
+
+        files = [normalize(fs, f) for f in fs.ls(path, detail=False)]
+        with self._lock:
+            self._folders[path] = files
+        return list(files)
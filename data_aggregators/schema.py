@@ -3,6 +3,15 @@ from enum import Enum
 from typing import Dict, List, Optional
 
 import pandas as pd
+from data_aggregators.columnar import (
+    column_rule,
+    ensure_float_column,
+    ensure_float_stripped_column,
+    ensure_str_column,
+    float_to_str_column,
+    measurement_value_column,
+    na_to_none_column,
+)
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
@@ -11,6 +20,7 @@ class Measurement(BaseModel):
     unit: Optional[str] = None
 
     @field_validator("value", mode="before")
+    @column_rule(measurement_value_column)
     def validate_value(cls, v):
         if isinstance(v, str):
             if v.strip() == "---":
@@ -98,6 +108,7 @@ class CFVApplicationReport(CFVData):
     )
 
     @field_validator("Product", mode="before")
+    @column_rule(na_to_none_column)
     def convert_na_to_none(cls, value):
         if pd.isna(value):
             return None
@@ -106,10 +117,12 @@ class CFVApplicationReport(CFVData):
     @field_validator(
         "Field_name", "Date_Applied", "Units", mode="before"
     )  # , always=True)
+    @column_rule(ensure_str_column)
     def ensure_str(cls, v):
         return str(v) if v is not None else None
 
     @field_validator("Acres_Applied", "Avg_Rate", mode="before")
+    @column_rule(ensure_float_column)
     def ensure_float(cls, v):
         if isinstance(v, (float, int)):
             return float(v)
@@ -157,6 +170,7 @@ class CFVPlantingReport(CFVData):
         mode="before",
         # always=True,
     )
+    @column_rule(ensure_str_column)
     def ensure_str(cls, v):
         return str(v) if v is not None else None
 
@@ -167,6 +181,7 @@ class CFVPlantingReport(CFVData):
         "Sing_Percent",
         mode="before",
     )
+    @column_rule(ensure_float_stripped_column)
     def ensure_float(cls, v):
         if isinstance(v, str):
             for char in ["%", ","]:
@@ -212,10 +227,12 @@ class CFVHarvestReport(CFVData):
         mode="before",
         # always=True
     )
+    @column_rule(ensure_str_column)
     def ensure_str(cls, v):
         return str(v) if v is not None else None
 
     @field_validator("Acres", "Yield", mode="before")
+    @column_rule(ensure_float_column)
     def ensure_float(cls, v):
         if isinstance(v, (float, int)):
             return float(v)
@@ -251,10 +268,12 @@ class MyJohnDeereData(BaseModel):
     @field_validator(
         "operation_id", "operation_type", "crop_type", mode="before"  # , always=True
     )
+    @column_rule(ensure_str_column)
     def ensure_str(cls, v):
         return str(v) if v is not None else None
 
     @field_validator("area", mode="before")
+    @column_rule(ensure_float_column)
     def ensure_float(cls, v):
         if isinstance(v, (float, int)):
             return float(v)
@@ -333,12 +352,14 @@ class MyJohnDeereApplication(DAMeta):
         "Unit_5",
         mode="before",
     )
+    @column_rule(na_to_none_column)
     def convert_na_to_none(cls, value):
         if pd.isna(value):
             return None
         return value
 
     @field_validator("Area_Applied", mode="before")
+    @column_rule(float_to_str_column)
     def float_to_str(cls, value):
         if isinstance(value, float):
             return str(value)
@@ -421,12 +442,14 @@ class MyJohnDeereHarvest(DAMeta):
         "Unit_6",
         mode="before",
     )
+    @column_rule(na_to_none_column)
     def convert_na_to_none(cls, value):
         if pd.isna(value):
             return None
         return value
 
     @field_validator("Area_Harvested", mode="before")
+    @column_rule(float_to_str_column)
     def float_to_str(cls, value):
         if isinstance(value, float):
             return str(value)
@@ -512,12 +535,14 @@ class MyJohnDeerePlanting(DAMeta):
         "Unit_5",
         mode="before",
     )
+    @column_rule(na_to_none_column)
     def convert_na_to_none(cls, value):
         if pd.isna(value):
             return None
         return value
 
     @field_validator("Area_Seeded", mode="before")
+    @column_rule(float_to_str_column)
     def float_to_str(cls, value):
         if isinstance(value, float):
             return str(value)
@@ -574,12 +599,14 @@ class MyJohnDeereTillage(DAMeta):
         "Unit_4",
         mode="before",
     )
+    @column_rule(na_to_none_column)
     def convert_na_to_none(cls, value):
         if pd.isna(value):
             return None
         return value
 
     @field_validator("Area_Tilled", mode="before")
+    @column_rule(float_to_str_column)
     def float_to_str(cls, value):
         if isinstance(value, float):
             return str(value)
@@ -750,6 +777,7 @@ class GranularHarvestData(GranularData):
         "Harvested_area_yield_avg_unit",
         mode="before",
     )
+    @column_rule(na_to_none_column)
     def convert_na_to_none(cls, value):
         if pd.isna(value):
             return None
@@ -860,12 +888,14 @@ class GranularPlantingData(GranularData):
     )
 
     @field_validator("Planted_area", mode="before")
+    @column_rule(ensure_float_column)
     def ensure_float(cls, v):
         if isinstance(v, (float, int)):
             return float(v)
         return v
 
     @field_validator("Rate_applied", "Total_applied", mode="before")  # , always=True)
+    @column_rule(ensure_str_column)
     def ensure_str(cls, v):
         return str(v) if v is not None else None
 
@@ -990,6 +1020,7 @@ class FarMobileData(DAMeta):
     CLU_ID: Optional[str]  #       NaN
 
     @model_validator(mode="before")
+    @column_rule(na_to_none_column)
     def convert_na_to_none(cls, values):
         for value in values:
             print(value, values[value])
@@ -1089,6 +1120,7 @@ class DataTemplate(DAMeta):
         return value
 
     @field_validator("Boundary_name", mode="before")
+    @column_rule(na_to_none_column)
     def convert_na_to_none(cls, value):
         if pd.isna(value):
             return None
@@ -1136,6 +1168,7 @@ class PlantingDataTemplate(DataTemplate):
         return values
 
     @field_validator("Manufacturer", mode="before")
+    @column_rule(na_to_none_column)
     def convert_na_to_none(cls, value):
         if pd.isna(value):
             return None
@@ -1238,6 +1271,7 @@ class TillageDataTemplate(DataTemplate):
     @field_validator(
         "Applied_unit", "Product", "Manufacturer", "Reg_number", mode="before"
     )
+    @column_rule(na_to_none_column)
     def convert_na_to_none(cls, value):
         if pd.isna(value):
             return None
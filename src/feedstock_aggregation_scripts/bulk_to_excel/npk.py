@@ -3,8 +3,8 @@ import pandas as pd
 from loguru import logger as log
 
 from ..config import settings
-from ..util.conversion import convert_quantity_by_unit
 from ..util.readers.general import get_breakdown_list
+from ..util.units import unit_conversion_engine
 
 GREET_ELEMENT_COLS = [
     "% Ammonia",
@@ -21,47 +21,48 @@ GREET_ELEMENT_COLS = [
 ]
 
 
-def get_greet_element(
-    product: str,
-    element: str,
-    total: float,
-    unit: str,
-    reference_acreage: float,
-    fert_list: pd.DataFrame,
-) -> float:
-    temp = fert_list[fert_list.product_name == product]
-    if temp.empty:
-        return float(np.nan)
-    n = temp[element].iloc[0] if not np.isnan(temp[element].iloc[0]) else 0
-    conversion = (
-        temp["lbs / gal"].iloc[0] if not np.isnan(temp["lbs / gal"].iloc[0]) else 0
-    )
-    total, _ = convert_quantity_by_unit(total, unit)
-    return n * conversion * total / reference_acreage
+def get_greet_elements(bulk: pd.DataFrame, breakdown_list: pd.DataFrame) -> np.ndarray:
+    """Returns the rate of each `GREET_ELEMENT_COLS` element (columns) per
+    reference acre for each row of `bulk`, NaN for products missing in
+    `breakdown_list`.
 
+    The products are joined with their (first) breakdown in one merge, missing
+    percentages and densities count as 0. A zero `REFERENCE_ACREAGE` gives inf (NaN
+    for a zero rate or percentage).
+    """
+    products = breakdown_list[breakdown_list.product_name.notna()].drop_duplicates(
+        subset="product_name", keep="first"
+    )
+    merged = bulk[["INPUT_NAME"]].merge(
+        products[["product_name", "lbs / gal"] + GREET_ELEMENT_COLS],
+        left_on="INPUT_NAME",
+        right_on="product_name",
+        how="left",
+    )
+    found = merged.product_name.notna().to_numpy()
 
-def add_greet_elements(
-    breakdown_list: pd.DataFrame, element: str, column_name: str, bulk: pd.DataFrame
-):
-    bulk[column_name] = bulk.apply(
-        lambda x: get_greet_element(
-            x["INPUT_NAME"],
-            element,
-            x["INPUT_RATE"],
-            x["INPUT_UNIT"],
-            x["REFERENCE_ACREAGE"],
-            breakdown_list,
-        ),
-        axis=1,
+    totals, _ = unit_conversion_engine().convert_quantities(
+        bulk["INPUT_RATE"], bulk["INPUT_UNIT"], normalize=False
     )
-    return bulk
+    percents = merged[GREET_ELEMENT_COLS].fillna(0).to_numpy(dtype=float)
+    conversion = merged["lbs / gal"].fillna(0).to_numpy(dtype=float)
+    reference_acreage = bulk["REFERENCE_ACREAGE"].to_numpy(dtype=float)
+    elements = (
+        percents
+        * conversion[:, np.newaxis]
+        * totals.to_numpy(dtype=float)[:, np.newaxis]
+        / reference_acreage[:, np.newaxis]
+    )
+    elements[~found] = np.nan
+    return elements
 
 
 def add_elements(bulk: pd.DataFrame, breakdown_list: pd.DataFrame):
-    for col in GREET_ELEMENT_COLS:
-        col_name = col.split("%")[-1].strip()
-        log.info(f"adding {col_name} to bulk")
-        add_greet_elements(breakdown_list, col, col_name, bulk)
+    col_names = [col.split("%")[-1].strip() for col in GREET_ELEMENT_COLS]
+    log.info(f"adding {', '.join(col_names)} to bulk")
+    elements = get_greet_elements(bulk, breakdown_list)
+    for i, col_name in enumerate(col_names):
+        bulk[col_name] = elements[:, i]
     return bulk
 
 
@@ -1,12 +1,11 @@
 import pandas as pd
 
 
-def add_cover_crop_use_decision(field: str, cc_report: pd.DataFrame) -> bool:
-    temp = cc_report[cc_report["Field_name"].isin([field])]
-
-    if temp.empty:
-        return False
-    else:
-        if (temp["Area_coverage_percent"] > 0.50).any():
-            return True
-        return False
+def get_cover_crop_use_decisions(cc_report: pd.DataFrame) -> pd.Series:
+    """Returns per field of `cc_report` whether a cover crop was planted on more than
+    50% of its area."""
+    return (
+        (cc_report["Area_coverage_percent"] > 0.50)
+        .groupby(cc_report["Field_name"], dropna=False, sort=False)
+        .any()
+    )
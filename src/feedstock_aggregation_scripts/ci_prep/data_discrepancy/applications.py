@@ -1,116 +1,168 @@
 import numpy as np
 import pandas as pd
-from loguru import logger as log
 
-from ...util.conversion import convert_quantity_by_unit
-from ..helpers import get_attributes_from_all_sources
+from ...util.units import unit_conversion_engine
+from .helpers import SOURCE_POSITION, get_attribute_ranks, stack_sources
 
 
-def create_app_input_comparison_by_crop(data_sources: dict) -> pd.DataFrame:
-    """creates an overview of applications and planting operations.
-    Overview is separates inputs by `Crop_type` (where available).
-    For unavailable `Crop_type`, the total will be written to the existing records.
-    """
+def aggregate_applied_totals(data: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    """Sums `Applied_total` per `keys` and converts the sums by their first
+    `Applied_unit` (see `convert_quantity_by_unit`). Sums of 0 are kept without
+    unit."""
+    totals = data.groupby(keys, sort=False).Applied_total.sum()
+    first_units = (
+        data.drop_duplicates(subset=keys)
+        .set_index(keys)
+        .Applied_unit.reindex(totals.index)
+    )
 
-    # get complete list of fields from all available sources
-    fields = get_attributes_from_all_sources(
-        col_name="Field_name", data_sources=data_sources
+    has_total = ((totals != 0) & totals.notna()).to_numpy()
+    quantities, units = unit_conversion_engine().convert_quantities(
+        totals[has_total], first_units[has_total], normalize=False
+    )
+
+    agg = pd.DataFrame(
+        {
+            "Applied_total": totals.to_numpy(dtype=float),
+            "Applied_unit": np.full(len(totals), None, dtype=object),
+        },
+        index=totals.index,
+    )
+    agg.loc[has_total, "Applied_total"] = quantities.to_numpy(dtype=float)
+    agg.loc[has_total, "Applied_unit"] = units.to_numpy(dtype=object)
+    return agg.reset_index()
+
+
+def pivot_totals(
+    totals: pd.DataFrame, keys: list[str], n_sources: int
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """Pivots `totals` per source and `keys` (see `aggregate_applied_totals`) to one
+    entry per `keys` and one column per source (NaN for sources without records).
+    Returns the entries, with their first source and the first `Applied_unit` of
+    their totals, and the totals."""
+    totals = totals.sort_values(SOURCE_POSITION, kind="stable")
+    entries = totals.drop_duplicates(subset=keys)[[*keys, SOURCE_POSITION]]
+    first_units = (
+        totals.dropna(subset=["Applied_unit"])
+        .drop_duplicates(subset=keys)
+        .set_index(keys)
+        .Applied_unit
+    )
+    entry_index = pd.MultiIndex.from_frame(entries[keys])
+    entries = entries.assign(
+        Applied_unit=first_units.reindex(entry_index).to_numpy(dtype=object)
+    ).reset_index(drop=True)
+    table = totals.pivot(
+        index=keys, columns=SOURCE_POSITION, values="Applied_total"
+    ).reindex(index=entry_index, columns=range(n_sources))
+    return entries, table.to_numpy(dtype=float)
+
+
+def apply_totals_without_crop(
+    stacked: pd.DataFrame,
+    entries: pd.DataFrame,
+    totals: np.ndarray,
+    missing_rank: int,
+    n_sources: int,
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """Applies the totals of each source over all crop types of a field and product
+    (records without `Crop_type` included) to the `entries` and `totals` per crop
+    type (see `pivot_totals`).
+
+    Crop types are taken in the order of `get_attributes_from_all_sources`, the
+    missing one at `missing_rank`. A source's total over all crop types is written
+    to all entries of field and product that exist by then: entries of earlier
+    sources, and of its own crop types before the missing one. Its crop types after
+    the missing one keep their own total. If field and product have no entry yet, a
+    new entry without crop type is added.
+    """
+    by_product = ["Field_name", "Product"]
+    product_entries, product_totals = pivot_totals(
+        aggregate_applied_totals(stacked, [SOURCE_POSITION, *by_product]),
+        by_product,
+        n_sources,
     )
-    # get all products used in all available sources
-    products = get_attributes_from_all_sources(
-        col_name="Product", data_sources=data_sources
+    all_crops = product_totals[
+        pd.MultiIndex.from_frame(product_entries[by_product]).get_indexer(
+            pd.MultiIndex.from_frame(entries[by_product])
+        )
+    ]
+
+    sources = np.arange(n_sources)
+    created_by = entries[SOURCE_POSITION].to_numpy()[:, None]
+    before_missing = (entries.Crop_rank < missing_rank).to_numpy()[:, None]
+    existing = (created_by < sources) | ((created_by == sources) & before_missing)
+    own_total = ~np.isnan(totals) & ~before_missing
+    totals = np.where(~np.isnan(all_crops) & existing & ~own_total, all_crops, totals)
+
+    has_entry = pd.MultiIndex.from_frame(
+        entries[before_missing[:, 0]][[*by_product, SOURCE_POSITION]]
     )
-    # get all crop types used in all available sources
-    crops = get_attributes_from_all_sources(
-        col_name="Crop_type", data_sources=data_sources
+    is_new = ~pd.MultiIndex.from_frame(
+        product_entries[[*by_product, SOURCE_POSITION]]
+    ).isin(has_entry)
+    entries = pd.concat(
+        [
+            entries,
+            product_entries[is_new].assign(Crop_type=np.nan, Crop_rank=missing_rank),
+        ],
+        ignore_index=True,
     )
+    return entries, np.concatenate([totals, product_totals[is_new]])
 
-    # initialize
+
+def create_app_input_comparison_by_crop(data_sources: dict) -> pd.DataFrame:
+    """creates an overview of applications and planting operations.
+    Overview is separates inputs by `Crop_type` (where available).
+    For unavailable `Crop_type`, the total will be written to the existing records.
+
+    An entry takes the `Applied_unit` of the first of its totals with a unit (see
+    `aggregate_applied_totals`).
+    """
     cols = ["Field_name", "Crop_type", "Product", "Applied_unit", "Operation_type"]
-    df = pd.DataFrame(columns=cols)
     operation_type = "Application"
 
-    for name, data in data_sources.items():
-        log.info(name)
-        # if no data available, skip data_source
-        if data.empty:
-            continue
-
-        # add source column to data frame
-        df[name] = np.nan
-
-        for field in fields:
-            # create temporary extracts based on field name
-            data_t = data[(data.Field_name == field)]
-
-            # if no data available for current field, skip field for this data source
-            if data_t.empty:
-                continue
-
-            for product in products:
-                # if product is nan, skip (irrelevant entries)
-                if pd.isna(product):
-                    continue
-
-                # prefilter for operations by product
-                data_tp = data_t[(data_t.Product == product)]
-
-                # if no data available for current field-product combination, skip product for this field
-                if data_tp.empty:
-                    continue
-
-                for crop in crops:
-                    # prefilter for operations by product
-                    if not pd.isna(crop):
-                        data_tpc = data_tp[(data_tp.Crop_type == crop)]
-                        existing_entry = df[
-                            (df.Field_name == field)
-                            & (df.Product == product)
-                            & (df.Crop_type == crop)
-                        ]
-                    else:
-                        # if no Crop_type available,
-                        data_tpc = data_tp
-                        existing_entry = df[
-                            (df.Field_name == field) & (df.Product == product)
-                        ]
-                    # if no data available for current field-product combination, skip product for this field
-                    if data_tpc.empty:
-                        continue
-
-                    # get quantities
-                    data_q = data_tpc.Applied_total.sum()
-                    # if name == 'Granular' and field == 'Woodrich 104':
-                    #     print(name, field, product, crop, data_q)
-
-                    # set unit
-                    unit = None
-
-                    if not (data_q == 0 or np.isnan(data_q)):
-                        # extract units
-                        data_u = data_tpc.Applied_unit.iloc[0]
-
-                        data_q, data_u = convert_quantity_by_unit(data_q, data_u)
-                        unit = data_u
-
-                    t = pd.DataFrame(
-                        columns=cols + [name],
-                        data=[[field, crop, product, unit, operation_type, data_q]],
-                    )
-
-                    # CASE 1: no entry for field-product combination in df
-                    if existing_entry.empty:
-                        # add new row to data frame
-                        df = pd.concat([df, t], ignore_index=True)
-
-                    # CASE 2: existing entry for field-product combination in df
-                    else:
-                        for i in existing_entry.index:
-                            df.loc[i, name] = data_q
-
-                        # check for missing unit for this entry
-                        if pd.isna(df.loc[existing_entry.index[0], "Applied_unit"]):
-                            log.info(f"missing unit for {product} on field {field}")
-                            df.loc[existing_entry.index[0], "Applied_unit"] = data_u
+    names, stacked = stack_sources(data_sources)
+    if names:
+        # entries without field or product are irrelevant
+        stacked = stacked.dropna(subset=["Field_name", "Product"])
+    if stacked.empty:
+        return pd.DataFrame(columns=cols + names)
+
+    field_ranks, _ = get_attribute_ranks("Field_name", data_sources)
+    product_ranks, _ = get_attribute_ranks("Product", data_sources)
+    crop_ranks, missing_crop_ranks = get_attribute_ranks("Crop_type", data_sources)
+    by_product = ["Field_name", "Product"]
+    by_crop = [*by_product, "Crop_type"]
+
+    # totals per crop type, one entry per field, product and crop type
+    entries, totals = pivot_totals(
+        aggregate_applied_totals(
+            stacked.dropna(subset=["Crop_type"]), [SOURCE_POSITION, *by_crop]
+        ),
+        by_crop,
+        len(names),
+    )
+    entries["Crop_rank"] = entries.Crop_type.map(crop_ranks)
+
+    if len(missing_crop_ranks):
+        entries, totals = apply_totals_without_crop(
+            stacked, entries, totals, missing_crop_ranks[0], len(names)
+        )
+
+    # order of the former loops: first source > field > product > crop type
+    order = np.lexsort(
+        [
+            entries.Crop_rank,
+            entries.Product.map(product_ranks),
+            entries.Field_name.map(field_ranks),
+            entries[SOURCE_POSITION],
+        ]
+    )
+    entries = entries.iloc[order].reset_index(drop=True)
 
+    df = entries[["Field_name", "Crop_type", "Product", "Applied_unit"]].assign(
+        Operation_type=operation_type
+    )
+    df[names] = totals[order]
     return df
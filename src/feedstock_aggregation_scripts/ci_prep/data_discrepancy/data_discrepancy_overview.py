@@ -17,14 +17,14 @@ def add_max_delta_for_inputs(inputs: pd.DataFrame) -> pd.DataFrame:
     # get data source columns
     rel_cols = [col for col in inputs.columns if col in DATA_AGGREGATORS]
 
-    # line-by-line: add max delta
-    for i, row in inputs.iterrows():
-        temp = row[rel_cols]
-        min_ = np.nanmin(temp.values)
-        max_ = np.nanmax(temp.values)
-
-        # set value
-        inputs.loc[i, "Max_delta"] = max_ - min_
+    # max delta over all sources, NaN for rows without any value
+    values = inputs[rel_cols].to_numpy(dtype=float)
+    has_value = ~np.isnan(values).all(axis=1)
+    max_delta = np.full(len(inputs), np.nan)
+    max_delta[has_value] = np.nanmax(values[has_value], axis=1) - np.nanmin(
+        values[has_value], axis=1
+    )
+    inputs["Max_delta"] = max_delta
 
     return inputs
 
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+from loguru import logger as log
+
+from ..helpers import get_attributes_from_all_sources
+
+SOURCE = "Source"
+SOURCE_POSITION = "Source_position"
+
+
+def stack_sources(data_sources: dict) -> tuple[list[str], pd.DataFrame]:
+    """Returns the names of the non-empty `data_sources` and their rows in one data
+    frame, with the source name in column `Source` and its position in
+    `Source_position`."""
+    names = [name for name, data in data_sources.items() if not data.empty]
+    for name in names:
+        log.info(name)
+
+    if not names:
+        return names, pd.DataFrame(columns=[SOURCE, SOURCE_POSITION])
+
+    stacked = pd.concat(
+        [
+            data_sources[name].assign(**{SOURCE: name, SOURCE_POSITION: i})
+            for i, name in enumerate(names)
+        ],
+        ignore_index=True,
+    )
+    return names, stacked
+
+
+def get_attribute_ranks(
+    col_name: str, data_sources: dict
+) -> tuple[pd.Series, np.ndarray]:
+    """Positions of the attributes `col_name` of all `data_sources` (see
+    `get_attributes_from_all_sources`), i.e. the order of the former loops over
+    them. Returns the positions by attribute and the positions of missing ones."""
+    attributes = pd.Series(
+        get_attributes_from_all_sources(col_name=col_name, data_sources=data_sources),
+        dtype=object,
+    )
+    missing = attributes.isna().to_numpy()
+    ranks = pd.Series(np.flatnonzero(~missing), index=attributes[~missing])
+    return ranks, np.flatnonzero(missing)
+
+
+def create_input_comparison(
+    data_sources: dict, operation_type: str, value: str
+) -> pd.DataFrame:
+    """Creates an overview of the total `value` per field and crop type of the
+    `operation_type` operations in `data_sources`, with one column per (non-empty)
+    source.
+
+    Rows are ordered by the first source, field and crop type they appear in, rows
+    with missing field or crop type are dropped.
+    """
+    cols = ["Field_name", "Crop_type", "Operation_type"]
+    keys = ["Field_name", "Crop_type"]
+
+    names, stacked = stack_sources(data_sources)
+    if not names:
+        return pd.DataFrame(columns=cols)
+
+    stacked = stacked[stacked.Operation_type == operation_type].dropna(subset=keys)
+
+    table = stacked.pivot_table(
+        index=keys, columns=SOURCE, values=value, aggfunc="sum", sort=False
+    )
+    if stacked.empty or table.empty:
+        return pd.DataFrame(columns=cols + names)
+
+    # row order of the former loops: source > field > crop type
+    field_ranks, _ = get_attribute_ranks("Field_name", data_sources)
+    crop_ranks, _ = get_attribute_ranks("Crop_type", data_sources)
+    order = (
+        stacked.assign(
+            Field_rank=stacked.Field_name.map(field_ranks),
+            Crop_rank=stacked.Crop_type.map(crop_ranks),
+        )
+        .groupby(keys, sort=False)[[SOURCE_POSITION, "Field_rank", "Crop_rank"]]
+        .min()
+        .reindex(table.index)
+        .sort_values([SOURCE_POSITION, "Field_rank", "Crop_rank"], kind="stable")
+    )
+    table = table.reindex(index=order.index, columns=names)
+
+    df = table.reset_index()
+    df.columns.name = None
+    df.insert(2, "Operation_type", operation_type)
+    return df
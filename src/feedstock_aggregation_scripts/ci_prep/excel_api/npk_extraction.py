@@ -1,5 +1,38 @@
+import numpy as np
 import pandas as pd
-from loguru import logger as log
+
+from ...util.reference_data import REFERENCE_DATA
+
+CHEMICAL_PRODUCT_BREAKDOWN = (
+    "01_data/verity_chemical_product_breakdown_table - Sheet1.csv"
+)
+
+REFERENCE_DATA.register(
+    "chemical_product_breakdown",
+    pd.read_csv,
+    lambda: (CHEMICAL_PRODUCT_BREAKDOWN,),
+)
+
+
+# breakdown columns per product and their columns in the breakdown table
+FERTILIZER_COLS = {
+    "A": "% Ammonia",
+    "U": "% Urea",
+    "AN": "% AN",
+    "AS": "% AS",
+    "UAN": "% UAN",
+    "MAP_N": "% MAP N",
+    "DAP_N": "% DAP N",
+    "MAP_P": "% MAP P2O5",
+    "DAP_P": "% DAP P2O5",
+    "K2O": "% K2O",
+}
+# active ingredients, only set for the respective product types
+ACTIVE_INGREDIENT_COLS = {
+    "AI_H": ("lbs AI / gal", ["HERBICIDE", "FUNGICIDE"]),  # HERBICIDES + FUNGICIDES
+    "AI_I": ("lbs AI / gal", ["INSECTICIDE"]),  # INSECTICIDES
+    "CACO3": ("% CaCO3", ["LIME"]),  # LIME
+}
 
 
 def init_product_breakdown():
@@ -7,116 +40,57 @@ def init_product_breakdown():
         "Product": [],
         "Product_type": [],
         "Conversion_factor": [],
-        "A": [],
-        "U": [],
-        "AN": [],
-        "AS": [],
-        "UAN": [],
-        "MAP_N": [],
-        "DAP_N": [],
-        "MAP_P": [],
-        "DAP_P": [],
-        "K2O": [],
-        "AI_H": [],  # HERBICIDES + FUNGICIDES
-        "AI_I": [],  # INSECTICIDES
-        "CACO3": [],  # LIME
+        **{col: [] for col in FERTILIZER_COLS},
+        **{col: [] for col in ACTIVE_INGREDIENT_COLS},
     }
     return pb
 
 
-cpb = pd.read_csv("01_data/verity_chemical_product_breakdown_table - Sheet1.csv")
+def extract_product_breakdown_info(product_names):
+    """Returns the breakdown of each of `product_names` registered in the chemical
+    product breakdown table (the first one per product, in order of
+    `product_names`). Products without breakdown or product type are skipped."""
+    cpb = REFERENCE_DATA.get("chemical_product_breakdown")
+    cpb = cpb[cpb.product_name.notna()].drop_duplicates(subset="product_name")
+    # skip not registered products
+    cpb = cpb[cpb.product_type.map(lambda t: isinstance(t, str))]
+
+    products = pd.DataFrame({"Product": pd.Series(product_names, dtype=object)})
+    temp = products.merge(cpb, left_on="Product", right_on="product_name")
+
+    pb = pd.DataFrame(
+        {
+            "Product": temp.Product,
+            "Product_type": temp.product_type,
+            "Conversion_factor": temp["lbs / gal"],
+            **{col: temp[cpb_col] for col, cpb_col in FERTILIZER_COLS.items()},
+        },
+        columns=list(init_product_breakdown()),
+    )
 
+    product_types = temp.product_type.str.upper()
+    for col, (cpb_col, types) in ACTIVE_INGREDIENT_COLS.items():
+        pb[col] = temp[cpb_col].astype(float).where(product_types.isin(types))
 
-def extract_product_breakdown_info(product_names):
-    pb = init_product_breakdown()
-
-    for product_name in product_names:
-        temp = cpb[cpb.product_name == product_name]
-        # skip not registered products
-        # or temp.product_type.iloc[0].upper() != 'FERTILISER':
-        if temp.empty or not isinstance(temp.product_type.iloc[0], str):
-            continue
-
-        pb["Product"].append(product_name)
-        product_type = temp.product_type.iloc[0]
-
-        if temp.empty:
-            log.warning(f"no breakdown in DB for {product_name}")
-
-            pb["Product_type"].append(None)
-            pb["Conversion_factor"].append(None)
-            pb["A"].append(None)
-            pb["U"].append(None)
-            pb["AN"].append(None)
-            pb["AS"].append(None)
-            pb["UAN"].append(None)
-            pb["MAP_N"].append(None)
-            pb["DAP_N"].append(None)
-            pb["MAP_P"].append(None)
-            pb["DAP_P"].append(None)
-            pb["K2O"].append(None)
-            pb["AI_H"].append(None)
-            pb["AI_I"].append(None)
-            pb["CACO3"].append(None)
-
-            continue
-
-        pb["Product_type"].append(product_type)
-        pb["Conversion_factor"].append(temp["lbs / gal"].iloc[0])
-        pb["A"].append(temp["% Ammonia"].iloc[0])
-        pb["U"].append(temp["% Urea"].iloc[0])
-        pb["AN"].append(temp["% AN"].iloc[0])
-        pb["AS"].append(temp["% AS"].iloc[0])
-        pb["UAN"].append(temp["% UAN"].iloc[0])
-        pb["MAP_N"].append(temp["% MAP N"].iloc[0])
-        pb["DAP_N"].append(temp["% DAP N"].iloc[0])
-        pb["MAP_P"].append(temp["% MAP P2O5"].iloc[0])
-        pb["DAP_P"].append(temp["% DAP P2O5"].iloc[0])
-        pb["K2O"].append(temp["% K2O"].iloc[0])
-
-        if product_type.upper() == "HERBICIDE" or product_type.upper() == "FUNGICIDE":
-            pb["AI_H"].append(temp["lbs AI / gal"].iloc[0])
-            pb["AI_I"].append(None)
-            pb["CACO3"].append(None)
-
-        elif product_type.upper() == "INSECTICIDE":
-            pb["AI_H"].append(None)
-            pb["AI_I"].append(temp["lbs AI / gal"].iloc[0])
-            pb["CACO3"].append(None)
-        elif product_type.upper() == "LIME":
-            pb["AI_H"].append(None)
-            pb["AI_I"].append(None)
-            pb["CACO3"].append(temp["% CaCO3"].iloc[0])
-        else:
-            pb["AI_H"].append(None)
-            pb["AI_I"].append(None)
-            pb["CACO3"].append(None)
-
-    return pd.DataFrame(pb)
+    return pb
 
 
 def calculate_inputs_by_row(pb):
-    """Adds columns with total input values to the passed data frame"""
-    pb["Total_A"] = pb.Applied_total * pb.Conversion_factor * pb.A / pb.Area_applied
-    pb["Total_U"] = pb.Applied_total * pb.Conversion_factor * pb.U / pb.Area_applied
-    pb["Total_AN"] = pb.Applied_total * pb.Conversion_factor * pb.AN / pb.Area_applied
-    pb["Total_AS"] = pb.Applied_total * pb.Conversion_factor * pb.AS / pb.Area_applied
-    pb["Total_UAN"] = pb.Applied_total * pb.Conversion_factor * pb.UAN / pb.Area_applied
-    pb["Total_MAP_N"] = (
-        pb.Applied_total * pb.Conversion_factor * pb.MAP_N / pb.Area_applied
-    )
-    pb["Total_DAP_N"] = (
-        pb.Applied_total * pb.Conversion_factor * pb.DAP_N / pb.Area_applied
-    )
-    pb["Total_MAP_P"] = (
-        pb.Applied_total * pb.Conversion_factor * pb.MAP_P / pb.Area_applied
-    )
-    pb["Total_DAP_P"] = (
-        pb.Applied_total * pb.Conversion_factor * pb.DAP_P / pb.Area_applied
-    )
-    pb["Total_K2O"] = pb.Applied_total * pb.Conversion_factor * pb.K2O / pb.Area_applied
-    pb["Total_AI_H"] = pb.Applied_total * pb.AI_H / pb.Area_applied
-    pb["Total_AI_I"] = pb.Applied_total * pb.AI_I / pb.Area_applied
-    pb["Total_CACO3"] = pb.Applied_total * pb.CACO3 / pb.Area_applied
+    """Adds columns with total input values to the passed data frame. A zero
+    `Area_applied` gives inf (NaN for zero totals)."""
+    # fertilizers are converted by `Conversion_factor` (lbs / gal), active
+    # ingredients are per unit applied already
+    cols = list(FERTILIZER_COLS) + list(ACTIVE_INGREDIENT_COLS)
+    conversion = np.ones((len(pb), len(cols)))
+    conversion[:, : len(FERTILIZER_COLS)] = pb.Conversion_factor.to_numpy(dtype=float)[
+        :, np.newaxis
+    ]
+
+    applied_total = pb.Applied_total.to_numpy(dtype=float)[:, np.newaxis]
+    area_applied = pb.Area_applied.to_numpy(dtype=float)[:, np.newaxis]
+    totals = applied_total * conversion * pb[cols].to_numpy(dtype=float) / area_applied
+
+    for i, col in enumerate(cols):
+        pb[f"Total_{col}"] = totals[:, i]
 
     return pb
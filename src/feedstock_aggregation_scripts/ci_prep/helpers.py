@@ -175,20 +175,21 @@ def adjust_input_type(input_type: str, input_unit: str) -> str | None:
         return None
 
 
-def determine_major_crop_types(field: str, decisions: pd.DataFrame) -> str | None:
-    temp = decisions[
-        (decisions["Field_name"].isin([field]))
-        & (decisions["Crop_type"].isin(FDCIC_CROPS))
-    ]
-    num_crops = len(temp["Crop_type"].unique())
-    if num_crops == 1:
-        return temp["Crop_type"].iloc[0]
+def get_major_crop_types(decisions: pd.DataFrame) -> pd.Series:
+    """Returns the major crop type per field with FD-CIC crops in `decisions`: the
+    crop type if there is only one, `Potential_split_field` otherwise."""
+    temp = decisions[decisions["Crop_type"].isin(FDCIC_CROPS)]
+    crops = temp.groupby("Field_name", dropna=False, sort=False)["Crop_type"].agg(
+        ["nunique", "first"]
+    )
+    return crops["first"].where(crops["nunique"] == 1, "Potential_split_field")
 
-    elif num_crops > 1:
-        return "Potential_split_field"
 
-    else:
-        return None
+def map_by_field(field_names: pd.Series, by_field: pd.Series, default=None):
+    """Maps `field_names` to the values per field `by_field`, fields without value
+    get `default`."""
+    values = field_names.map(by_field).where(field_names.isin(by_field.index), default)
+    return values.infer_objects()
 
 
 def adjust_crop_type(field: str, decisions: pd.DataFrame) -> pd.DataFrame:
@@ -1,12 +1,11 @@
 import pandas as pd
 
 
-def add_manure_use_decision(field: str, manure_report: pd.DataFrame) -> bool:
-    temp = manure_report[manure_report["Field_name"].isin([field])]
-
-    if temp.empty:
-        return False
-    else:
-        if (temp["Area_coverage_percent"] > 0.50).any():
-            return True
-        return False
+def get_manure_use_decisions(manure_report: pd.DataFrame) -> pd.Series:
+    """Returns per field of `manure_report` whether manure was applied to more than
+    50% of its area."""
+    return (
+        (manure_report["Area_coverage_percent"] > 0.50)
+        .groupby(manure_report["Field_name"], dropna=False, sort=False)
+        .any()
+    )
@@ -1,91 +1,18 @@
-import numpy as np
 import pandas as pd
 
-from ...util.conversion import convert_quantity_by_unit
 from ..helpers import clean_input_type
+from .helpers import select_max_total
 
 
-def create_comprehensive_apps_list(
-    source_1: pd.DataFrame, source_2: pd.DataFrame
-) -> pd.DataFrame:
-    # get complete list of fields
-    if not source_1.empty:
-        temp = pd.concat(
-            [
-                pd.Series(source_1.Field_name.unique()),
-                pd.Series(source_2.Field_name.unique()),
-            ]
-        )
-    else:
-        temp = pd.Series(source_2.Field_name.unique(), name="Field_name")
-
-    fields = temp.unique()
-
-    source_1 = source_1.drop_duplicates(ignore_index=True)
-    source_2 = source_2.drop_duplicates(ignore_index=True)
-
-    merge_cols = source_1.columns.to_list()
-    df = pd.DataFrame(columns=merge_cols)
-
-    for field in fields:
-        # create temporary extracts based on field name
-        source_1_t = source_1[(source_1.Field_name == field)]
-        source_2_t = source_2[(source_2.Field_name == field)]
-
-        # get all products used from both files
-        temp = pd.concat(
-            [
-                pd.Series(source_1_t.Product.unique()),
-                pd.Series(source_2_t.Product.unique()),
-            ]
-        )
-        products = temp.unique()
-
-        for product in products:
-            # quantity = 0
-            # prefilter for operations by product
-            source_1_tp = source_1_t[(source_1_t.Product == product)]
-            source_2_tp = source_2_t[(source_2_t.Product == product)]
-            # get quantities
-            source_1_q = source_1_tp.Applied_total.sum()
-            source_2_q = source_2_tp.Applied_total.sum()
-
-            # CASE 1: no data in source_1 - data available in source_2
-            if (source_1_q == 0 or np.isnan(source_1_q)) and source_2_q > 0:
-                df = pd.concat([df, source_2_tp])
-
-            # CASE 2: data available in source_1 - no data in source_2
-            elif (source_2_q == 0 or np.isnan(source_2_q)) and source_1_q > 0:
-                df = pd.concat([df, source_1_tp])
-
-            # CASE 3: no data in source_1 - no data in source_2
-            elif source_2_q == source_1_q == 0:
-                pass
-
-            # CASE 4: data available in source_1 - data available in source_2
-            else:
-                # extract units
-                source_1_u = source_1_tp.Applied_unit.iloc[0]
-                source_2_u = source_2_tp.Applied_unit.iloc[0]
-
-                if source_1_u != source_2_u:
-                    # make quantities comparable
-                    source_1_q, source_1_u = convert_quantity_by_unit(
-                        source_1_q, source_1_u
-                    )
-                    source_2_q, source_2_u = convert_quantity_by_unit(
-                        source_2_q, source_2_u
-                    )
-
-                # select the greater quantity (MAX)
-                df = (
-                    pd.concat([df, source_1_tp])
-                    if source_1_q > source_2_q
-                    else pd.concat([df, source_2_tp])
-                )
-
-        # break
-    return df
+def create_comprehensive_apps_list(*sources: pd.DataFrame) -> pd.DataFrame:
+    """Collects the max total input operations per field and product from
+    `sources`, see `select_max_total`."""
+    return select_max_total(
+        list(sources),
+        keys=["Field_name", "Product"],
+        total="Applied_total",
+        unit="Applied_unit",
+    )
 
 
 def create_comprehensive_apps_from_cleaned_files(cleaned_files: dict) -> pd.DataFrame:
@@ -105,9 +32,9 @@ def create_comprehensive_apps_from_cleaned_files(cleaned_files: dict) -> pd.Data
     if "PAP" in clean_files_dict:
         del clean_files_dict["PAP"]
 
-    for file in clean_files_dict.values():
-        if not file.empty:
-            comp_inputs = create_comprehensive_apps_list(comp_inputs, file)
+    files = [file for file in clean_files_dict.values() if not file.empty]
+    if files:
+        comp_inputs = pd.concat([comp_inputs, create_comprehensive_apps_list(*files)])
 
     if "PAP" in cleaned_files:
         pap_app = cleaned_files["PAP"]
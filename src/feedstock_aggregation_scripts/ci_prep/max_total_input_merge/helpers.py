@@ -0,0 +1,195 @@
+import numpy as np
+import pandas as pd
+
+from ...util.units import unit_conversion_engine
+
+
+def get_key_positions(
+    sources: list[pd.DataFrame], keys: list[str]
+) -> tuple[pd.MultiIndex, list[np.ndarray]]:
+    """Returns all `keys` values of `sources` (in order of first appearance, without
+    missing values) and, per source, the position of each row's key in them (-1 for
+    rows with missing keys)."""
+    all_keys = pd.MultiIndex.from_frame(
+        pd.concat([source[keys] for source in sources], ignore_index=True)
+        .dropna()
+        .drop_duplicates()
+    )
+    positions = [
+        all_keys.get_indexer(pd.MultiIndex.from_frame(source[keys]))
+        for source in sources
+    ]
+    return all_keys, positions
+
+
+def get_key_totals(
+    values: pd.Series, positions: np.ndarray, n_keys: int, missing: float
+) -> np.ndarray:
+    """Sums `values` per key position, keys without rows are `missing`."""
+    has_key = positions >= 0
+    totals = np.full(n_keys, missing, dtype=float)
+    summed = values[has_key].groupby(positions[has_key]).sum()
+    totals[summed.index.to_numpy(dtype=int)] = summed.to_numpy(dtype=float)
+    return totals
+
+
+def get_key_firsts(values: pd.Series, positions: np.ndarray, n_keys: int) -> np.ndarray:
+    """First value (in row order) per key position, NaN for keys without rows."""
+    has_key = positions >= 0
+    firsts = np.full(n_keys, np.nan, dtype=object)
+    key_positions = positions[has_key]
+    is_first = ~pd.Series(key_positions).duplicated().to_numpy()
+    firsts[key_positions[is_first]] = values.to_numpy(dtype=object)[has_key][is_first]
+    return firsts
+
+
+def get_first_positions(positions: np.ndarray, n: int) -> np.ndarray:
+    """Row of the first appearance of each of `n` positions, the number of rows for
+    positions without rows (-1 positions are ignored)."""
+    first = np.full(n, len(positions))
+    rows = np.flatnonzero(positions >= 0)
+    np.minimum.at(first, positions[rows], rows)
+    return first
+
+
+def get_merge_ranks(
+    acc_rank: np.ndarray,
+    in_acc: np.ndarray,
+    key_fields: np.ndarray,
+    source_field_first: np.ndarray,
+    source_key_first: np.ndarray,
+) -> np.ndarray:
+    """Position of the keys in the rows of `acc` after a merge step (-1 for keys
+    without rows, `in_acc` marks the keys with rows after the step).
+
+    Fields in `acc` before the step come first in their order, then the fields of
+    the source by their first row. Within a field, keys in `acc` before the step
+    keep their order, followed by the keys of the source by their first row.
+    """
+    n_keys = len(acc_rank)
+    was_in_acc = acc_rank >= 0
+    offset = n_keys + 1
+
+    field_rank = source_field_first + offset
+    np.minimum.at(field_rank, key_fields[was_in_acc], acc_rank[was_in_acc])
+    key_rank = np.where(was_in_acc, acc_rank, source_key_first + offset)
+
+    order = np.lexsort((key_rank, field_rank[key_fields]))
+    order = order[in_acc[order]]
+    rank = np.full(n_keys, -1)
+    rank[order] = np.arange(len(order))
+    return rank
+
+
+def select_max_total(
+    sources: list[pd.DataFrame],
+    keys: list[str],
+    total: str,
+    unit: str | None = None,
+    missing: float = 0.0,
+    operation_type: str | None = None,
+) -> pd.DataFrame:
+    """Selects, per `keys`, the rows of the source with the max sum of `total`.
+
+    Gives the same result as merging the (deduplicated) `sources` pairwise, in
+    order, where `acc` are the rows selected so far:
+
+    - CASE 1: no data in `acc` - data available in source -> source
+    - CASE 2: data available in `acc` - no data in source -> `acc`
+    - CASE 3: no data in `acc` - no data in source -> none
+    - CASE 4: data available in `acc` - data available in source -> the greater
+      total, the source on ties. With `unit`, totals are converted (see
+      `convert_quantity_by_unit`) by their first unit if these differ.
+
+    Totals of keys without rows in a source are `missing`. With `operation_type`,
+    only rows of that `Operation_type` are selected. Rows with missing keys are
+    dropped.
+
+    All keys are decided at once per source and the selected rows are joined back
+    in one pass. Rows are ordered like the pairwise merge: by field (the first
+    of `keys`), then key, then source row. Each merge step keeps the fields and
+    keys of `acc` in their order and appends the new ones of the source by first
+    appearance (fields by all rows of the source, also with `operation_type`).
+    """
+    sources = [source.drop_duplicates(ignore_index=True) for source in sources]
+    if not sources:
+        return pd.DataFrame()
+
+    full_sources = sources
+    if operation_type is not None:
+        sources = [
+            source[source["Operation_type"] == operation_type] for source in sources
+        ]
+
+    all_keys, row_positions = get_key_positions(sources, keys)
+    n_keys = len(all_keys)
+    key_fields, fields = pd.factorize(all_keys.get_level_values(0))
+
+    winner = np.full(n_keys, -1)
+    acc_total = np.full(n_keys, missing, dtype=float)
+    acc_unit = np.full(n_keys, np.nan, dtype=object)
+    # position of the keys in the rows of `acc`, -1 for keys without rows
+    acc_rank = np.full(n_keys, -1)
+
+    for i, (source, positions) in enumerate(zip(sources, row_positions)):
+        source_total = get_key_totals(source[total], positions, n_keys, missing)
+        has_rows = np.zeros(n_keys, dtype=bool)
+        has_rows[positions[positions >= 0]] = True
+
+        acc_none = (acc_total == 0) | np.isnan(acc_total)
+        source_none = (source_total == 0) | np.isnan(source_total)
+
+        case_1 = acc_none & (source_total > 0)
+        case_2 = ~case_1 & source_none & (acc_total > 0)
+        case_3 = ~case_1 & ~case_2 & (source_total == 0) & (acc_total == 0)
+        case_4 = ~case_1 & ~case_2 & ~case_3
+
+        acc_q, source_q = acc_total[case_4], source_total[case_4]
+        if unit is not None:
+            source_unit = get_key_firsts(source[unit], positions, n_keys)
+            # make quantities comparable
+            differ = acc_unit[case_4] != source_unit[case_4]
+            engine = unit_conversion_engine()
+            acc_q[differ] = engine.convert_quantities(
+                pd.Series(acc_q[differ]),
+                pd.Series(acc_unit[case_4][differ]),
+                normalize=False,
+            )[0].to_numpy(dtype=float)
+            source_q[differ] = engine.convert_quantities(
+                pd.Series(source_q[differ]),
+                pd.Series(source_unit[case_4][differ]),
+                normalize=False,
+            )[0].to_numpy(dtype=float)
+
+        # select the greater quantity (MAX)
+        take_source = case_1.copy()
+        take_source[case_4] = ~(acc_q > source_q)
+
+        winner[take_source] = i
+        winner[case_3] = -1
+        acc_total[take_source] = source_total[take_source]
+        acc_total[case_3] = missing
+        if unit is not None:
+            acc_unit[take_source] = source_unit[take_source]
+            acc_unit[case_3] = np.nan
+
+        in_acc = acc_rank >= 0
+        acc_rank = get_merge_ranks(
+            acc_rank,
+            in_acc=np.where(take_source, has_rows, in_acc & ~case_3),
+            key_fields=key_fields,
+            source_field_first=get_first_positions(
+                fields.get_indexer(full_sources[i][keys[0]]), len(fields)
+            ),
+            source_key_first=get_first_positions(positions, n_keys),
+        )
+
+    selected, order = [], []
+    for i, (source, positions) in enumerate(zip(sources, row_positions)):
+        is_selected = positions >= 0
+        is_selected[is_selected] = winner[positions[is_selected]] == i
+        selected.append(source[is_selected])
+        order.append(acc_rank[positions[is_selected]])
+
+    df = pd.concat(selected)
+    return df.iloc[np.argsort(np.concatenate(order), kind="stable")]
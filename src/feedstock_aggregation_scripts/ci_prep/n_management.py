@@ -1,9 +1,10 @@
-from datetime import datetime
 from pathlib import Path
+from typing import Iterable
 
+import numpy as np
 import pandas as pd
 from loguru import logger as log
-from pandas import DataFrame, isna, merge
+from pandas import DataFrame, merge
 
 from ..config import settings
 from ..data_prep.npk_breakdowns import prepare_NPK
@@ -11,20 +12,40 @@ from ..data_prep.split_field.split_field import get_harvest_params
 from ..util.readers.generated_reports import read_shp_file_overview
 from .constants import INPUT_TYPE_FERTILIZER
 from .helpers import get_datetime
-from .soil_data_extract.soil_temp import (
-    get_hourly_soil_temp_data,
-    return_start_4r_timing,
-)
+from .soil_data_extract.soil_temp import get_start_4r_timings
+
+
+def get_fertilizer_timing_windows_4r(growing_cycle: int) -> dict[str, tuple]:
+    """returns the 4R timing windows [start, end) of `growing_cycle`"""
+    return {
+        # time frame for FALL applications
+        "Fall": (
+            get_datetime(growing_cycle - 1, month=9, day=1),
+            get_datetime(growing_cycle, 1, 1),
+        ),
+        # time frame for SPRING applications
+        "Spring": (
+            get_datetime(growing_cycle, month=3, day=1),
+            get_datetime(growing_cycle, 7, 1),
+        ),
+        # time frame in between FALL and SPRING --> flag
+        # for additional investigation
+        "FLAG": (
+            get_datetime(growing_cycle, month=1, day=1),
+            get_datetime(growing_cycle, 3, 1),
+        ),
+    }
 
 
 def categorize_fertilizer_timing_4r(
-    input_type: str,
-    operation_start: datetime,
-    operation_end: datetime,
-    growing_cycle: int,
-) -> str | None:
+    input_type: pd.Series,
+    operation_start: pd.Series,
+    operation_end: pd.Series,
+    growing_cycle: int | pd.Series,
+) -> pd.Series:
     """categorizes all products where `input_type` == `FERTILIZER` according to 4R timing
-    business rules.
+    business rules. `growing_cycle` is either one growing cycle for all operations or
+    the growing cycle per operation.
 
     Return values:
     - None --> input_type != FERTILIZER
@@ -33,68 +54,51 @@ def categorize_fertilizer_timing_4r(
     - FLAG --> for further investigation
     - NO_4R --> ineligible for 4R
     """
-    if input_type != INPUT_TYPE_FERTILIZER:
-        return None
-
-    if (
-        get_datetime(growing_cycle - 1, month=9, day=1)
-        <= operation_start
-        < get_datetime(growing_cycle, 1, 1)
-        and get_datetime(growing_cycle - 1, 9, 1)
-        <= operation_end
-        < get_datetime(growing_cycle, 1, 1)
-        # cases where no `Operation_end` date is available
-        or get_datetime(growing_cycle - 1, 9, 1)
-        <= operation_start
-        < get_datetime(growing_cycle, 1, 1)
-        and isna(operation_end)
-    ):
-        # time frame for FALL applications
-        return "Fall"
-
-    elif (
-        get_datetime(growing_cycle, month=3, day=1)
-        <= operation_start
-        < get_datetime(growing_cycle, 7, 1)
-        and get_datetime(growing_cycle, 3, 1)
-        <= operation_end
-        < get_datetime(growing_cycle, 7, 1)
-        # cases where no `Operation_end` date is available
-        or get_datetime(growing_cycle, 3, 1)
-        <= operation_start
-        < get_datetime(growing_cycle, 7, 1)
-        and isna(operation_end)
-    ):
-        # time frame for SPRING applications
-        return "Spring"
-
-    elif (
-        get_datetime(growing_cycle, month=1, day=1)
-        <= operation_start
-        < get_datetime(growing_cycle, 3, 1)
-        and get_datetime(growing_cycle, 1, 1)
-        <= operation_end
-        < get_datetime(growing_cycle, 3, 1)
-        # cases where no `Operation_end` date is available
-        or get_datetime(growing_cycle, 1, 1)
-        <= operation_start
-        < get_datetime(growing_cycle, 3, 1)
-        and isna(operation_end)
-    ):
-        # time frame in between FALL and SPRING --> flag
-        # for additional investigation
-        return "FLAG"
-
-    else:
-        # unacceptable timing for 4R nitrogen management
-        return "NO_4R"
+    start = pd.to_datetime(operation_start)
+    end = pd.to_datetime(operation_end)
+    cycles = pd.Series(growing_cycle, index=operation_start.index)
+    windows = {
+        cycle: get_fertilizer_timing_windows_4r(int(cycle))
+        for cycle in cycles.dropna().unique()
+    }
+
+    conditions = [(input_type != INPUT_TYPE_FERTILIZER).to_numpy()]
+    for timing in ["Fall", "Spring", "FLAG"]:
+        window_start = pd.to_datetime(
+            cycles.map({c: w[timing][0] for c, w in windows.items()})
+        )
+        window_end = pd.to_datetime(
+            cycles.map({c: w[timing][1] for c, w in windows.items()})
+        )
+        conditions.append(
+            (
+                (window_start <= start)
+                & (start < window_end)
+                & (
+                    (window_start <= end) & (end < window_end)
+                    # cases where no `Operation_end` date is available
+                    | end.isna()
+                )
+            ).to_numpy()
+        )
+
+    return pd.Series(
+        np.select(
+            conditions,
+            [None, "Fall", "Spring", "FLAG"],
+            # unacceptable timing for 4R nitrogen management
+            default="NO_4R",
+        ),
+        index=operation_start.index,
+    )
 
 
 def add_fertilizer_timing_categorization_4r(
-    comprehensive_input_list: DataFrame, growing_cycle: int
+    comprehensive_input_list: DataFrame, growing_cycle: int | None = None
 ) -> DataFrame:
     """adds column `Fertilizer_timing` with the categorization of a given `FERTILIZER`
-    application (`Input_type`).
+    application (`Input_type`). Without `growing_cycle`, the growing cycle of each
+    application is taken from column `Growing_cycle`.
     """
     # The timing of fertilizing activities needs to be categorizes
     # broadly into 2 categories:
@@ -111,105 +115,149 @@ def add_fertilizer_timing_categorization_4r(
     #
     # All other fertilizer operations are not in line with "4R"
     # timing requirements.
-    comprehensive_input_list["Fertilizer_timing"] = comprehensive_input_list.apply(
-        lambda x: categorize_fertilizer_timing_4r(
-            x.Input_type, x.Operation_start, x.Operation_end, growing_cycle
+    comprehensive_input_list["Fertilizer_timing"] = categorize_fertilizer_timing_4r(
+        comprehensive_input_list.Input_type,
+        comprehensive_input_list.Operation_start,
+        comprehensive_input_list.Operation_end,
+        (
+            comprehensive_input_list.Growing_cycle
+            if growing_cycle is None
+            else growing_cycle
         ),
-        axis=1,
     )
 
     return comprehensive_input_list
 
 
-def add_fertilizer_timing_decision_4r(
-    field: str,
-    grower: str,
-    growing_cycle: int,
-    comprehensive_input_list: DataFrame,
-) -> str:
-    fertilizer_input_list = comprehensive_input_list[
-        (comprehensive_input_list["Field_name"].isin([field]))
-        & (comprehensive_input_list["Input_type"].isin(["FERTILIZER", "EEF"]))
-    ]
+def get_start_4r_timings_by_field(
+    grower: str, growing_cycle: int, fields: Iterable[str]
+) -> dict[str, str | None]:
+    """Returns the start of the 4R timing period for all `fields` of `grower` with a
+    location in the shp file overview, fetching the soil temperatures of all their
+    centroids in one batch."""
+    fields = list(fields)
+    if not fields:
+        return {}
+
+    shapefile_data = read_shp_file_overview(settings.data_prep.dest_path, grower)
+    shapefile_data = shapefile_data[
+        shapefile_data.Field_name.isin(fields)
+    ].drop_duplicates(subset="Field_name", keep="first")
+
+    return get_start_4r_timings(
+        f"{growing_cycle - 1}-09-01",
+        f"{growing_cycle - 1}-12-31",
+        {
+            field: (lat, long)
+            for field, lat, long in zip(
+                shapefile_data.Field_name,
+                shapefile_data.Centroid_lat,
+                shapefile_data.Centroid_long,
+            )
+        },
+    )
 
-    no4r_applications = fertilizer_input_list[
-        fertilizer_input_list["Fertilizer_timing"].isin(["NO_4R"])
-    ]
-    fall_applications = fertilizer_input_list[
-        fertilizer_input_list["Fertilizer_timing"].isin(["Fall"])
-    ]
-    flagged_applications = fertilizer_input_list[
-        fertilizer_input_list["Fertilizer_timing"].isin(["FLAG"])
+
+def get_fertilizer_timing_decisions_4r(
+    grower: str, growing_cycle: int, comprehensive_input_list: DataFrame
+) -> pd.Series:
+    """Returns the 4R timing decision (`4R` / `NO_4R`) per field with fertilizer
+    applications in `comprehensive_input_list`. Fields without fertilizer
+    applications are `NO_4R`.
+    """
+    fertilizer_input_list = comprehensive_input_list[
+        comprehensive_input_list["Input_type"].isin(["FERTILIZER", "EEF"])
     ]
+    timing = fertilizer_input_list["Fertilizer_timing"]
+    is_fall = timing.isin(["Fall"])
+
+    by_field = (
+        DataFrame(
+            {
+                "Field_name": fertilizer_input_list["Field_name"],
+                "NO_4R": timing.isin(["NO_4R"]),
+                "FLAG": timing.isin(["FLAG"]),
+                "Fall": is_fall,
+                "Fall_start": pd.to_datetime(
+                    fertilizer_input_list["Operation_start"]
+                ).where(is_fall),
+            }
+        )
+        .groupby("Field_name", dropna=False, sort=False)
+        .agg(
+            NO_4R=("NO_4R", "any"),
+            FLAG=("FLAG", "any"),
+            Fall=("Fall", "any"),
+            Fall_start=("Fall_start", "min"),
+        )
+    )
+    decisions = pd.Series("4R", index=by_field.index, dtype=object)
 
     # If any fertilizing operations are clasified as `NO_4R`, the
     # nitrogen management for that field will be `NO_4R`
-    if fertilizer_input_list.empty or not no4r_applications.empty:
-        return "NO_4R"
+    no_4r = by_field.NO_4R.to_numpy()
 
     # If flagged operations are present, return `NO_4R`
-    elif not flagged_applications.empty:
+    flagged = ~no_4r & by_field.FLAG.to_numpy()
+    for field in by_field.index[flagged]:
         log.warning(f"operation FLAGGED for field {field} and grower {grower}")
-        return "NO_4R"
 
     # If there is at least 1 fertilizing operation that is classified as `Fall`,
     # we need to check the temperature cut-off date for those operations.
-    elif not fall_applications.empty:
-        shapefile_data = read_shp_file_overview(settings.data_prep.dest_path, grower)
-        shapefile_data_by_field = shapefile_data[
-            shapefile_data.Field_name.isin([field])
-        ]
-
-        if not shapefile_data_by_field.empty:
-            soil_temp_data = get_hourly_soil_temp_data(
-                f"{growing_cycle - 1}-09-01",
-                f"{growing_cycle - 1}-12-31",
-                shapefile_data_by_field.Centroid_lat.values[0],
-                shapefile_data_by_field.Centroid_long.values[0],
-            )
-            start_timing_for_4r = return_start_4r_timing(soil_temp_data)
-
-            for fall_application in fall_applications.itertuples(index=False):
-                # If at least one of those `Fall` applications happened before the
-                # temperature cut-off, we will classify as `NO_4R`.
-                if fall_application.Operation_start < pd.to_datetime(
-                    start_timing_for_4r
-                ):
-                    return "NO_4R"
-
-            # If all operation happened after the cut-off date, we can safely categorize
-            # nitrogen management as `4R`.
-            return "4R"
-
-        # If no shapefile data is present, log error and return `NO_4R`.
-        else:
-            log.error(
-                f"missing shp file location for field {field} and grower {grower}; \
-                    unable to determine 4R temperature cut-off date for fall applications"
-            )
-            return "NO_4R"
+    fall = ~no_4r & ~flagged & by_field.Fall.to_numpy()
+    fall_fields = by_field.index[fall]
+    start_timings_4r = get_start_4r_timings_by_field(grower, growing_cycle, fall_fields)
+
+    # If no shapefile data is present, log error and return `NO_4R`.
+    has_location = fall_fields.isin(list(start_timings_4r))
+    for field in fall_fields[~has_location]:
+        log.error(
+            f"missing shp file location for field {field} and grower {grower}; "
+            "unable to determine 4R temperature cut-off date for fall applications"
+        )
+
+    # soil temperature never dropped below the target temperature,
+    # all `Fall` applications happened before the cut-off
+    start_timing_for_4r = pd.to_datetime(
+        pd.Series([start_timings_4r.get(field) for field in fall_fields], dtype=object)
+    ).to_numpy()
+    has_cut_off = has_location & ~np.isnat(start_timing_for_4r)
+    for field in fall_fields[has_location & ~has_cut_off]:
+        log.warning(
+            f"no 4R temperature cut-off date for field {field} and grower {grower}"
+        )
+
+    # If at least one of those `Fall` applications happened before the
+    # temperature cut-off, we will classify as `NO_4R`. If all operation happened
+    # after the cut-off date, we can safely categorize nitrogen management as `4R`.
+    fall_4r = has_cut_off & ~(
+        by_field.Fall_start[fall].to_numpy() < start_timing_for_4r
+    )
 
-        # TODO: reevaluate percentage of 4R applications.
-        # 4R is a mechanism to optimize and reduce N fertilizer
-        # applications on a given field. This implies to a certain
-        # extend that only a fraction of a field may actually be
-        # fertilized.
+    # TODO: reevaluate percentage of 4R applications.
+    # 4R is a mechanism to optimize and reduce N fertilizer
+    # applications on a given field. This implies to a certain
+    # extend that only a fraction of a field may actually be
+    # fertilized.
 
-        # percentage_of_4r_applications = (
-        #     spring_applied_area + qualifying_fall_applied_area
-        # ) / total_applied_area
+    # percentage_of_4r_applications = (
+    #     spring_applied_area + qualifying_fall_applied_area
+    # ) / total_applied_area
 
-        # if percentage_of_4r_applications > 0.5:
-        #     return "4R"
-        # else:
-        #     return "NO_4R"
+    # if percentage_of_4r_applications > 0.5:
+    #     return "4R"
+    # else:
+    #     return "NO_4R"
 
     # If no fertilizer applications are present that are either `NO_4R` or `Fall`
     # applications, we can safely assume, that only operations are present, that
     # are categorized as `Spring`. In this case, we will automatically classify as
     # `4R`.
-    else:
-        return "4R"
+    not_4r = no_4r | flagged
+    not_4r[fall] = ~fall_4r
+    decisions[not_4r] = "NO_4R"
+
+    return decisions
 
 
 def calculate_nitrogen_use_efficiency(
@@ -291,26 +339,38 @@ def add_nitrogen_use_efficiency(
     return decisions
 
 
-def add_eef_decision(
-    field_name: str, bulk_upload_template: DataFrame
-) -> DataFrame | None:
-    bulk_upload_template_by_field = bulk_upload_template[
-        bulk_upload_template["Field_name"] == field_name
-    ]
-    if bulk_upload_template_by_field["EEF_product"].str.contains("y").any():
-        return "EEF"
-    else:
-        return None
-
-
-def add_n_management_decision(timing_4r: str, amount_4r: str, eef: str) -> str:
-    # 1. check for eligibility for 4R
-    if timing_4r == "4R" and amount_4r == "4R":
-        return "4R"
-    # 2. check for eligibility for EEF
-    elif eef == "EEF":
-        return "EEF"
-    # If no eligibility for 4R or EEF, then classify
-    # as `BUSINESS_AS_USUAL`.
-    else:
-        return "BUSINESS_AS_USUAL"
+def get_eef_decisions(bulk_upload_template: DataFrame) -> pd.Series:
+    """Returns `EEF` per field with enhanced efficiency fertilizers (`EEF_product`)
+    in `bulk_upload_template`, None otherwise."""
+    is_eef = (
+        bulk_upload_template["EEF_product"]
+        .str.contains("y")
+        .astype(object)
+        .fillna(False)
+        .astype(bool)
+    )
+    return (
+        is_eef.groupby(bulk_upload_template["Field_name"], sort=False)
+        .any()
+        .map({True: "EEF", False: None})
+    )
+
+
+def get_n_management_decisions(
+    timing_4r: pd.Series, amount_4r: pd.Series, eef: pd.Series
+) -> pd.Series:
+    return pd.Series(
+        np.select(
+            [
+                # 1. check for eligibility for 4R
+                ((timing_4r == "4R") & (amount_4r == "4R")).to_numpy(),
+                # 2. check for eligibility for EEF
+                (eef == "EEF").to_numpy(),
+            ],
+            ["4R", "EEF"],
+            # If no eligibility for 4R or EEF, then classify
+            # as `BUSINESS_AS_USUAL`.
+            default="BUSINESS_AS_USUAL",
+        ),
+        index=timing_4r.index,
+    )
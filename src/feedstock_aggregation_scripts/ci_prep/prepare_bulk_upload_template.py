@@ -13,7 +13,7 @@ from ..util.readers.generated_reports import (
     read_combined_report,
     read_split_field_reports,
 )
-from .cc_use import add_cover_crop_use_decision
+from .cc_use import get_cover_crop_use_decisions
 from .constants import (
     BULK_TEMPLATE_COLS,
     CC_REPORT,
@@ -24,24 +24,25 @@ from .helpers import (
     adjust_input_type,
     adjust_operation_type,
     adjust_yield_for_secondary_crops,
-    determine_major_crop_types,
     get_attributes_from_all_sources,
+    get_major_crop_types,
+    map_by_field,
     mark_verified_fields,
 )
-from .manure_use import add_manure_use_decision
+from .manure_use import get_manure_use_decisions
 from .max_total_input_merge.max_total_input_merge import (
     create_comprehensive_inputs_from_cleaned_files,
 )
 from .n_management import (
-    add_eef_decision,
     add_fertilizer_timing_categorization_4r,
-    add_fertilizer_timing_decision_4r,
-    add_n_management_decision,
     add_nitrogen_use_efficiency,
+    get_eef_decisions,
+    get_fertilizer_timing_decisions_4r,
+    get_n_management_decisions,
 )
 from .reference_acreage import select_reference_acreage
 from .shp_files import add_shp_file_name_comparison
-from .tillage import add_tillage_params, add_tillage_practice_decision
+from .tillage import add_tillage_params, get_tillage_practice_decisions
 
 # This number may change after feedback from Chan - also pending supporting documentation
 amount_4r_threshold = 0.15
@@ -147,24 +148,27 @@ def create_decision_matrix(
         lambda nue: "4R" if amount_4r_threshold < nue < 1.0 else "NO_4R"
     )
 
+    # Per field decisions are computed from the inputs grouped by field once and
+    # mapped to the rows of the decision matrix.
+
     # 4R - Timing
-    decisions["4R_timing"] = decisions.apply(
-        lambda x: add_fertilizer_timing_decision_4r(
-            x["Field_name"], grower, growing_cycle, bulk_mapping_overview
+    decisions["4R_timing"] = map_by_field(
+        decisions["Field_name"],
+        get_fertilizer_timing_decisions_4r(
+            grower, growing_cycle, bulk_mapping_overview
         ),
-        axis=1,
+        default="NO_4R",
     )
     # EEF (Enhanced Efficiency Fertilizers)
-    decisions["EEF"] = decisions.apply(
-        lambda x: add_eef_decision(x["Field_name"], bulk_mapping_overview), axis=1
+    decisions["EEF"] = map_by_field(
+        decisions["Field_name"], get_eef_decisions(bulk_mapping_overview)
     )
 
     # N management classification
-    decisions["N_MGT_PRACTICE"] = decisions.apply(
-        lambda x: add_n_management_decision(
-            timing_4r=x["4R_timing"], amount_4r=x["4R_amount"], eef=x["EEF"]
-        ),
-        axis=1,
+    decisions["N_MGT_PRACTICE"] = get_n_management_decisions(
+        timing_4r=decisions["4R_timing"],
+        amount_4r=decisions["4R_amount"],
+        eef=decisions["EEF"],
     )
 
     # Manure use
@@ -180,8 +184,10 @@ def create_decision_matrix(
         # set all records to no manure used.
         decisions["MANURE_USE"] = False
     else:
-        decisions["MANURE_USE"] = decisions.apply(
-            lambda x: add_manure_use_decision(x["Field_name"], manure_report), axis=1
+        decisions["MANURE_USE"] = map_by_field(
+            decisions["Field_name"],
+            get_manure_use_decisions(manure_report),
+            default=False,
         )
 
     # Cover crop use
@@ -201,21 +207,17 @@ def create_decision_matrix(
         # `Area_coverage_percent` (see ticket DPREP-201).
         try:
             log.info(f"Adding cover crop use decision for {grower}")
-            decisions["COVER_CROP_USE"] = decisions.apply(
-                lambda x: add_cover_crop_use_decision(x["Field_name"], cc_report),
-                axis=1,
+            decisions["COVER_CROP_USE"] = map_by_field(
+                decisions["Field_name"],
+                get_cover_crop_use_decisions(cc_report),
+                default=False,
             )
         except Exception as err:
             log.exception(str(err))
 
     # Tillage practice
     decisions = add_tillage_params(decisions, bulk_mapping_overview)
-    decisions["TILL_PRACTICE"] = decisions.apply(
-        lambda x: add_tillage_practice_decision(
-            x["Field_name"], x["Till_depth"], x["Till_passes"]
-        ),
-        axis=1,
-    )
+    decisions["TILL_PRACTICE"] = get_tillage_practice_decisions(decisions)
 
     # Determine major crop type
     split_field_report = read_split_field_reports(
@@ -225,8 +227,8 @@ def create_decision_matrix(
     )
     if split_field_report.empty:
         # If no `split_field_report` file is available, set by crop count.
-        decisions["Major_crop_type"] = decisions.apply(
-            lambda x: determine_major_crop_types(x["Field_name"], decisions), axis=1
+        decisions["Major_crop_type"] = map_by_field(
+            decisions["Field_name"], get_major_crop_types(decisions)
         )
     else:
         # Set Major_crop_type = Potential_split_field if field in split_field_report
@@ -1,33 +1,326 @@
 import pathlib
 
+import numpy as np
 import pandas as pd
-from fuzzywuzzy import fuzz, process
+from rapidfuzz import fuzz, process, utils
 
+from ..config import settings
 from ..util.readers.generated_reports import read_shp_file_overview
 
 partial_match_ratio = 60
+# shape files are candidates for fields whose planted or harvested acres are within
+# this (relative) tolerance of their `Acreage_calc`
+acreage_tolerance = 0.2
+ACRE_COLS = ["Planted_acres", "Harvest_acres"]
+
+
+def get_acreage_pairs(
+    acres: np.ndarray,
+    shp_acres: np.ndarray,
+    field_farms: np.ndarray,
+    shp_farms: np.ndarray,
+    tolerance: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the (field, shape file) position pairs of the same farm (or where
+    either farm is unknown) whose acres agree within `tolerance`, for `acres` with
+    one row per field and one column per acreage. Shape files without acreage are
+    paired with all fields with acres of their farm.
+
+    The shape files are sorted by farm and acreage once, the shapes within the
+    interval of each field acreage are found by binary search in the segments of
+    the field's farm and of shape files without farm.
+    """
+    codes, farms = pd.factorize(np.concatenate([shp_farms, field_farms]))
+    n_farms = len(farms)
+    shp_codes, field_codes = codes[: len(shp_farms)], codes[len(shp_farms) :]
+    # shape files without farm in a segment of their own
+    shp_segments = np.where(shp_codes < 0, n_farms, shp_codes)
+
+    # segments span `width` acres each, so intervals never cross segments
+    width = (
+        np.nanmax(
+            np.concatenate([shp_acres, acres.ravel() * (1 + tolerance)]), initial=0
+        )
+        + 1
+    )
+    known = ~np.isnan(shp_acres)
+    keys = shp_segments[known] * width + shp_acres[known]
+    order = np.flatnonzero(known)[np.argsort(keys, kind="stable")]
+    sorted_keys = np.sort(keys, kind="stable")
+
+    field_pos = np.repeat(np.arange(len(acres)), acres.shape[1])
+    codes = np.repeat(field_codes, acres.shape[1])
+    acres = acres.ravel()
+    has_acres = ~np.isnan(acres)
+    field_pos, codes, acres = field_pos[has_acres], codes[has_acres], acres[has_acres]
+
+    # fields of known farms search their farm and the shape files without farm,
+    # fields without farm search all segments
+    has_farm = codes >= 0
+    n_unknown = (~has_farm).sum()
+    query_pos = np.concatenate(
+        [np.tile(field_pos[has_farm], 2), np.repeat(field_pos[~has_farm], n_farms + 1)]
+    )
+    query_acres = np.concatenate(
+        [np.tile(acres[has_farm], 2), np.repeat(acres[~has_farm], n_farms + 1)]
+    )
+    query_segments = np.concatenate(
+        [
+            codes[has_farm],
+            np.full(has_farm.sum(), n_farms),
+            np.tile(np.arange(n_farms + 1), n_unknown),
+        ]
+    )
+
+    offsets = query_segments * width
+    lower = np.searchsorted(
+        sorted_keys, offsets + query_acres * (1 - tolerance), side="left"
+    )
+    upper = np.searchsorted(
+        sorted_keys, offsets + query_acres * (1 + tolerance), side="right"
+    )
+    counts = upper - lower
+
+    # expand the intervals [lower, upper) to one pair per shape file
+    starts = np.repeat(lower - (np.cumsum(counts) - counts), counts)
+    pairs = pd.DataFrame(
+        {
+            "Field": np.repeat(query_pos, counts),
+            "Shape": order[starts + np.arange(counts.sum())],
+        }
+    )
+
+    without_acres = pd.DataFrame({"Field": np.unique(field_pos)}).merge(
+        pd.DataFrame({"Shape": np.flatnonzero(~known)}), how="cross"
+    )
+    pair_field_codes = field_codes[without_acres.Field.to_numpy()]
+    pair_shp_codes = shp_codes[without_acres.Shape.to_numpy()]
+    without_acres = without_acres[
+        (pair_field_codes < 0)
+        | (pair_shp_codes < 0)
+        | (pair_field_codes == pair_shp_codes)
+    ]
+
+    pairs = pd.concat([pairs, without_acres]).drop_duplicates()
+    return pairs.Field.to_numpy(), pairs.Shape.to_numpy()
+
+
+def normalize_farm_names(farms: pd.Series) -> np.ndarray:
+    """Stripped, lower case farm names, NaN for missing ones."""
+    farms = farms.astype(object).where(farms.map(lambda f: isinstance(f, str)))
+    return farms.str.strip().str.lower().to_numpy(dtype=object)
+
+
+def get_farm_shapes(farm, shp_farms: np.ndarray) -> np.ndarray:
+    """Returns the positions of the shape files of `farm` and of those without farm
+    (only the latter for a missing `farm`). All shape files if there are none."""
+    shapes = np.flatnonzero(pd.isna(shp_farms) | (shp_farms == farm))
+    return shapes if len(shapes) else np.arange(len(shp_farms))
+
+
+def get_ranks(field_pos: np.ndarray) -> np.ndarray:
+    """Position of each pair within its field, for pairs sorted by field."""
+    starts = np.flatnonzero(np.r_[True, field_pos[1:] != field_pos[:-1]])
+    sizes = np.diff(np.r_[starts, len(field_pos)])
+    return np.arange(len(field_pos)) - np.repeat(starts, sizes)
+
+
+def rank_candidates(
+    field_pos: np.ndarray,
+    shp_pos: np.ndarray,
+    scores: np.ndarray,
+    agrees: np.ndarray,
+    k: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the `k` best (field, shape file) pairs per field and their scores and
+    acreage agreement, sorted by field and best first: by score, then acreage
+    agreement, then by order of the shape files."""
+    order = np.lexsort((shp_pos, ~agrees, -scores, field_pos))
+    keep = order[get_ranks(field_pos[order]) < k]
+    return field_pos[keep], shp_pos[keep], scores[keep], agrees[keep]
+
+
+def score_pairs(field_names: np.ndarray, shp_names: np.ndarray) -> np.ndarray:
+    """`token_sort_ratio` of the pairs of `field_names` and `shp_names`."""
+    return np.asarray(
+        process.cpdist(
+            field_names.astype(str),
+            shp_names.astype(str),
+            scorer=fuzz.token_sort_ratio,
+            processor=utils.default_process,
+            workers=settings.shp_match.workers,
+        ),
+        dtype=float,
+    )
+
+
+def score_fields(
+    field_names: np.ndarray,
+    shp_names: np.ndarray,
+    field_pos: np.ndarray,
+    shp_pos: np.ndarray,
+    agreeing: np.ndarray,
+    k: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Scores the names of the fields at `field_pos` against those of all shape
+    files at `shp_pos`, returns the `k` best pairs per field (see
+    `rank_candidates`, `agreeing` are the codes of the pairs agreeing in acreage).
+
+    Fields are scored in chunks of about `settings.shp_match.chunk_scores` scores
+    (`process.cdist`), so memory does not grow with fields x shape files.
+    """
+    empty = np.array([], dtype=int)
+    candidates = [(empty, empty, np.array([], dtype=float), np.array([], dtype=bool))]
+    n_shapes = len(shp_names)
+    if len(shp_pos):
+        chunk_size = max(1, settings.shp_match.chunk_scores // len(shp_pos))
+        choices = shp_names[shp_pos].astype(str)
+        for start in range(0, len(field_pos), chunk_size):
+            pos = field_pos[start : start + chunk_size]
+            scores = process.cdist(
+                field_names[pos].astype(str),
+                choices,
+                scorer=fuzz.token_sort_ratio,
+                processor=utils.default_process,
+                workers=settings.shp_match.workers,
+            )
+            pair_field_pos = np.repeat(pos, len(shp_pos))
+            pair_shp_pos = np.tile(shp_pos, len(pos))
+            candidates.append(
+                rank_candidates(
+                    pair_field_pos,
+                    pair_shp_pos,
+                    scores.ravel().astype(float),
+                    np.isin(pair_field_pos * n_shapes + pair_shp_pos, agreeing),
+                    k,
+                )
+            )
+    return tuple(np.concatenate(arrays) for arrays in zip(*candidates))
+
+
+def get_shp_match_candidates(
+    fields: pd.DataFrame,
+    shp_overview: pd.DataFrame,
+    k: int = 3,
+    tolerance: float = acreage_tolerance,
+    ratio: float = partial_match_ratio,
+) -> pd.DataFrame:
+    """Returns the `k` best shape file names (`Candidate`, `Score`, `Rank`) for the
+    field name of each row (`Row`, by position) of `fields`.
+
+    Names are first only scored within blocks of candidates: shape files of the
+    same farm (if both have `Farm_name`) whose `Acreage_calc` agrees with the
+    planted or harvested acres of the field within `tolerance`. Fields whose best
+    (rounded) score is not above `ratio`, or without acres, are scored against all
+    shape files of their farm (or without farm, all if there are none) and, if
+    still not above `ratio`, against all shape files. Names are scored with
+    `token_sort_ratio`, ties are ranked by acreage agreement and then by the order
+    of `shp_overview`.
+    """
+    n_fields, n_shapes = len(fields), len(shp_overview)
+    cols = ["Row", "Candidate", "Score", "Rank"]
+    if not n_fields or not n_shapes:
+        return pd.DataFrame(columns=cols)
+
+    if "Farm_name" in fields and "Farm_name" in shp_overview:
+        field_farms = normalize_farm_names(fields.Farm_name)
+        shp_farms = normalize_farm_names(shp_overview.Farm_name)
+    else:
+        field_farms = np.full(n_fields, np.nan, dtype=object)
+        shp_farms = np.full(n_shapes, np.nan, dtype=object)
+
+    field_names = fields.Field_name.to_numpy(dtype=object)
+    shp_names = shp_overview.Field_name.to_numpy(dtype=object)
+    named_fields = pd.notna(field_names)
+    named_shapes = np.flatnonzero(pd.notna(shp_names))
+
+    acre_cols = [col for col in ACRE_COLS if col in fields]
+    if acre_cols and "Acreage_calc" in shp_overview:
+        field_pos, shp_pos = get_acreage_pairs(
+            fields[acre_cols].apply(pd.to_numeric, errors="coerce").to_numpy(float),
+            pd.to_numeric(shp_overview.Acreage_calc, errors="coerce").to_numpy(float),
+            field_farms,
+            shp_farms,
+            tolerance,
+        )
+        field_pos, shp_pos = field_pos.astype(int), shp_pos.astype(int)
+    else:
+        field_pos = shp_pos = np.array([], dtype=int)
+    named = named_fields[field_pos] & pd.notna(shp_names[shp_pos])
+    field_pos, shp_pos = field_pos[named], shp_pos[named]
+    # pairs agreeing in acreage, by a single code
+    agreeing = field_pos * n_shapes + shp_pos
+
+    candidates = [
+        rank_candidates(
+            field_pos,
+            shp_pos,
+            score_pairs(field_names[field_pos], shp_names[shp_pos]),
+            np.ones(len(field_pos), dtype=bool),
+            k,
+        )
+    ]
+
+    def get_pending() -> np.ndarray:
+        """Fields with name whose best score is not above `ratio` yet."""
+        best = np.full(n_fields, -np.inf)
+        for field_pos, _, scores, _ in candidates:
+            np.maximum.at(best, field_pos, scores)
+        return np.flatnonzero(named_fields & (best.round() <= ratio))
+
+    # fields without a good match in their block: all shape files of their farm
+    pending = get_pending()
+    scored_all = np.zeros(n_fields, dtype=bool)
+    farms = field_farms[pending]
+    for farm in pd.unique(farms):
+        group = pending[pd.isna(farms) if pd.isna(farm) else farms == farm]
+        shapes = get_farm_shapes(farm, shp_farms)
+        scored_all[group] = len(shapes) == n_shapes
+        shapes = shapes[pd.notna(shp_names[shapes])]
+        candidates.append(
+            score_fields(field_names, shp_names, group, shapes, agreeing, k)
+        )
+
+    # fields still without a good match: all shape files
+    pending = get_pending()
+    pending = pending[~scored_all[pending]]
+    candidates.append(
+        score_fields(field_names, shp_names, pending, named_shapes, agreeing, k)
+    )
+
+    field_pos, shp_pos, scores, agrees = (
+        np.concatenate(arrays) for arrays in zip(*candidates)
+    )
+    # pairs scored in more than one stage count once
+    _, first = np.unique(field_pos * n_shapes + shp_pos, return_index=True)
+    field_pos, shp_pos, scores, _ = rank_candidates(
+        field_pos[first], shp_pos[first], scores[first], agrees[first], k
+    )
+    return pd.DataFrame(
+        {
+            "Row": field_pos,
+            "Candidate": shp_names[shp_pos],
+            "Score": scores,
+            "Rank": get_ranks(field_pos),
+        },
+        columns=cols,
+    )
 
 
 def fuzzy_match_field_names(
-    source_df: pd.DataFrame, list1: pd.Series, list2: pd.Series, ratio: float
+    source_df: pd.DataFrame, shp_overview: pd.DataFrame, ratio: float
 ):
     # Helper to fuzzy match function below
-    matches = []
-    probabilities = []
-
-    for i in list1:
-        ratios = process.extractOne(i, list2, scorer=fuzz.token_sort_ratio)
-
-        if int(ratios[1]) > ratio:  # can play with this number
-            matches.append(ratios[0])
-            probabilities.append(ratios[1])
-        else:
-            matches.append("no match")
-            probabilities.append(None)
+    best = (
+        get_shp_match_candidates(source_df, shp_overview, k=1, ratio=ratio)
+        .set_index("Row")
+        .reindex(range(len(source_df)))
+    )
+    is_match = (best.Score.round() > ratio).to_numpy()  # can play with this number
 
     df = source_df
-    df["Potential_shp_match"] = matches
-    df["Match_score"] = probabilities
+    df["Potential_shp_match"] = np.where(is_match, best.Candidate, "no match")
+    df["Match_score"] = best.Score.round().where(is_match).to_numpy()
 
     return df
 
@@ -41,8 +334,7 @@ def add_shp_file_name_comparison(
 
     temp = fuzzy_match_field_names(
         source_df=decisions,
-        list1=decisions["Field_name"],
-        list2=shp_overview["Field_name"],
+        shp_overview=shp_overview,
         ratio=partial_match_ratio,
     )
 
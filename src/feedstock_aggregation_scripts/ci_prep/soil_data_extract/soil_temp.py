@@ -1,7 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Hashable
+
+import numpy as np
 import requests
-from pandas import DataFrame, to_datetime
+from pandas import DataFrame, DatetimeIndex, concat, to_datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ...config import settings
+from .soil_temp_cache import SoilTemperatureCache
+
+SOIL_TEMPERATURE_CACHE = (
+    SoilTemperatureCache(
+        cache_dir=settings.soil_temperature_cache.path,
+        grid_resolution=settings.soil_temperature_cache.grid_resolution,
+    )
+    if settings.soil_temperature_cache.enabled
+    else None
+)
+
+
+def create_session(
+    retries: int, backoff_factor: float, pool_size: int
+) -> requests.Session:
+    """Session with a connection pool of `pool_size` and retries with exponential
+    backoff on connection errors and 429 / 5xx responses."""
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SOIL_TEMPERATURE_SESSION = create_session(
+    retries=settings.soil_temperature_api.retries,
+    backoff_factor=settings.soil_temperature_api.backoff_factor,
+    pool_size=settings.soil_temperature_api.max_workers,
+)
 
 
 def get_hourly_soil_temp_data(
@@ -27,9 +70,21 @@ def get_hourly_soil_temp_data(
     Returns:
         A DataFrame with soil temperature data.
     """
-    response = requests.get(
-        f"{settings.soil_temperature_api.url}?latitude={lat}&longitude={long}&start_date={start_date}&end_date={end_date}&hourly={temp_var}&timezone={tz}&temperature_unit={temp_unit}"
+    if SOIL_TEMPERATURE_CACHE is not None:
+        # data is requested (and cached) for the grid point, fields within the same
+        # grid cell share one request
+        lat, long = SOIL_TEMPERATURE_CACHE.grid_point(lat, long)
+        key = (lat, long, start_date, end_date, temp_var, temp_unit, tz)
+
+        cached = SOIL_TEMPERATURE_CACHE.get(*key)
+        if cached is not None:
+            return cached
+
+    response = SOIL_TEMPERATURE_SESSION.get(
+        f"{settings.soil_temperature_api.url}?latitude={lat}&longitude={long}&start_date={start_date}&end_date={end_date}&hourly={temp_var}&timezone={tz}&temperature_unit={temp_unit}",
+        timeout=settings.soil_temperature_api.timeout,
     )
+    response.raise_for_status()
     complete_temperature_data = response.json()
 
     # Extract components needed to create the df from json
@@ -40,9 +95,118 @@ def get_hourly_soil_temp_data(
     temperature_data["date"] = to_datetime(temperature_data["date"])
     temperature_data.set_index("date", inplace=True)
 
+    if SOIL_TEMPERATURE_CACHE is not None:
+        SOIL_TEMPERATURE_CACHE.put(temperature_data, *key)
+
     return temperature_data
 
 
+def get_hourly_soil_temp_data_batch(
+    start_date: str,
+    end_date: str,
+    locations: dict[Hashable, tuple[float, float]],
+    max_workers: int | None = None,
+    **kwargs,
+) -> dict[Hashable, DataFrame]:
+    """Batched version of `get_hourly_soil_temp_data` for `locations` (key -> (lat,
+    long)), e.g. all field centroids of a grower.
+
+    Locations sharing a grid cell of the soil temperature cache are requested once,
+    distinct ones concurrently over the pooled session. Returns the hourly soil
+    temperatures per key of `locations`.
+    """
+    points = {
+        key: (
+            SOIL_TEMPERATURE_CACHE.grid_point(lat, long)
+            if SOIL_TEMPERATURE_CACHE is not None
+            else (lat, long)
+        )
+        for key, (lat, long) in locations.items()
+    }
+    unique_points = list(dict.fromkeys(points.values()))
+
+    with ThreadPoolExecutor(
+        max_workers or settings.soil_temperature_api.max_workers
+    ) as executor:
+        data = dict(
+            zip(
+                unique_points,
+                executor.map(
+                    lambda point: get_hourly_soil_temp_data(
+                        start_date, end_date, *point, **kwargs
+                    ),
+                    unique_points,
+                ),
+            )
+        )
+
+    return {key: data[point] for key, point in points.items()}
+
+
+@dataclass
+class SoilTemperaturePanel:
+    """Daily soil temperatures and their moving average for several locations, as
+    2-D arrays of shape (days, locations)."""
+
+    locations: list
+    days: DatetimeIndex
+    daily: np.ndarray
+    ma: np.ndarray
+
+    @classmethod
+    def from_hourly(
+        cls, data: dict[Hashable, DataFrame], ma_interval: int = 7
+    ) -> "SoilTemperaturePanel":
+        """Resamples the hourly temperatures in `data` (key -> DataFrame as returned
+        by `get_hourly_soil_temp_data`) to daily means and adds their moving average
+        (see `create_ma`) for all locations at once."""
+        locations = list(data)
+        if not locations:
+            empty = np.empty((0, 0))
+            return cls(locations, DatetimeIndex([], name="date"), empty, empty)
+
+        hourly = concat([data[key]["temps"] for key in locations], axis=1)
+        daily = hourly.resample("D").mean()
+        ma = daily.rolling(window=ma_interval).mean()
+
+        return cls(
+            locations=locations,
+            days=daily.index,
+            daily=daily.to_numpy(dtype=float),
+            ma=ma.to_numpy(dtype=float),
+        )
+
+    def start_4r_timings(self, target_temperature: float = 50) -> dict:
+        """Start of the 4R timing period per location, the first day its temperature
+        is less than `target_temperature` like `return_start_4r_timing` (`None` if
+        it never is)."""
+        below = self.daily < target_temperature
+        has_cutoff = below.any(axis=0)
+        first_day = below.argmax(axis=0)
+
+        return {
+            location: (
+                self.days[first_day[i]].strftime("%Y-%m-%d") if has_cutoff[i] else None
+            )
+            for i, location in enumerate(self.locations)
+        }
+
+
+def get_start_4r_timings(
+    start_date: str,
+    end_date: str,
+    locations: dict[Hashable, tuple[float, float]],
+    ma_interval: int = 7,
+    target_temperature: float = 50,
+) -> dict[Hashable, str | None]:
+    """Returns the start of the 4R timing period (see `return_start_4r_timing`) per
+    key of `locations` (key -> (lat, long)), from the soil temperatures between
+    `start_date` and `end_date`."""
+    data = get_hourly_soil_temp_data_batch(start_date, end_date, locations)
+    panel = SoilTemperaturePanel.from_hourly(data, ma_interval)
+    return panel.start_4r_timings(target_temperature)
+
+
 def create_ma(data: DataFrame, ma_interval: int) -> DataFrame:
     """Adds a moving average column on the temperature data.
 
@@ -77,3 +241,4 @@ def return_start_4r_timing(data, ma_interval=7, target_temperature=50) -> str |
     first_date = daily_data[daily_data.temps < target_temperature].first_valid_index()
 
     return first_date.strftime("%Y-%m-%d")
+
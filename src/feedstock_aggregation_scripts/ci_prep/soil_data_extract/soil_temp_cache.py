@@ -0,0 +1,59 @@
+import hashlib
+import os
+import pathlib
+import tempfile
+
+import numpy as np
+from pandas import DataFrame, DatetimeIndex
+
+
+class SoilTemperatureCache:
+    """On-disk cache of hourly soil temperature series.
+
+    Entries are keyed by grid point, date range, variable, unit and time zone and
+    stored as compressed `.npz` files (the datetime64 timestamps, in the unit
+    they were parsed with, plus the temperature values), so reruns and fields sharing a grid cell do not hit the
+    API again.
+    """
+
+    def __init__(self, cache_dir: str | pathlib.Path, grid_resolution: float):
+        self.cache_dir = pathlib.Path(cache_dir)
+        self.grid_resolution = grid_resolution
+
+    def grid_point(self, lat: float, long: float) -> tuple[float, float]:
+        """Snaps `lat` / `long` to the center of their grid cell."""
+        res = self.grid_resolution
+        return round(round(lat / res) * res, 6), round(round(long / res) * res, 6)
+
+    def cache_path(self, *key) -> pathlib.Path:
+        digest = hashlib.sha256("|".join(map(str, key)).encode()).hexdigest()
+        return self.cache_dir.joinpath(digest[:2], f"{digest}.npz")
+
+    def get(self, *key) -> DataFrame | None:
+        path = self.cache_path(*key)
+        try:
+            with np.load(path) as cached:
+                dates, temps = cached["date"], cached["temps"]
+        except FileNotFoundError:
+            return None
+
+        return DataFrame({"temps": temps}, index=DatetimeIndex(dates, name="date"))
+
+    def put(self, data: DataFrame, *key):
+        path = self.cache_path(*key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # write next to the target and move into place, so concurrent readers never
+        # see partial files
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    date=data.index.values,
+                    temps=data["temps"].to_numpy(dtype=float),
+                )
+            os.replace(tmp, path)
+        except BaseException:
+            pathlib.Path(tmp).unlink(missing_ok=True)
+            raise
@@ -1,42 +1,8 @@
+import numpy as np
 import pandas as pd
 from loguru import logger as log
 
 
-def determine_till_depth(
-    area_applied: float | None, till_depth: float | None
-) -> float | None:
-    """Returns value for tillage depth, based on parameters supplied.
-    If both `area_applied` and `till_depth` is NaN, the assumption
-    is, that no tillage records are found in the data. The function,
-    hence, return None as tillage depth.
-
-    In all other cases, the (maximum) tillage depth in inches is
-    returned.
-    """
-    if pd.isna(area_applied) and pd.isna(till_depth):
-        return None
-    else:
-        return till_depth
-
-
-def determine_till_passes(
-    area_applied: float | None, reference_acreage: float | None
-) -> float | None:
-    """Returns number of tillage passes based on `area_applied`. In cases where
-    NaN is supplied for `area_applied`, the assumption is that no tillage
-    records are available and the function returns None as tillage passes,
-    accordingly.
-
-    Where no reference_acreage is available, no value is returned.
-    """
-
-    if pd.isna(area_applied) or pd.isna(reference_acreage) or reference_acreage == 0.0:
-        return None
-
-    else:
-        return area_applied / reference_acreage
-
-
 def add_tillage_params(
     decisions: pd.DataFrame, bulk_upload_overview: pd.DataFrame
 ) -> pd.DataFrame:
@@ -77,13 +43,16 @@ def add_tillage_params(
     # Add tillage metrics to decision matrix
     decisions = decisions.rename(columns={"Applied_rate": "Till_depth"})
 
-    decisions["Till_depth"] = decisions.apply(
-        lambda x: determine_till_depth(x["Area_applied"], x["Till_depth"]), axis=1
-    )
-
-    decisions["Till_passes"] = decisions.apply(
-        lambda x: determine_till_passes(x["Area_applied"], x["Reference_acreage"]),
-        axis=1,
+    # If both `Area_applied` and `Till_depth` are NaN, no tillage records are found
+    # in the data and tillage depth stays NaN. In all other cases, it is the
+    # (maximum) tillage depth in inches.
+    #
+    # Tillage passes are NaN where `Area_applied` is NaN (no tillage records) or no
+    # reference acreage is available.
+    tilled_acres = pd.to_numeric(decisions["Area_applied"])
+    reference_acreage = pd.to_numeric(decisions["Reference_acreage"])
+    decisions["Till_passes"] = tilled_acres / reference_acreage.where(
+        reference_acreage != 0.0
     )
 
     # Rename `Reference_acreage` to match the column name
@@ -93,7 +62,9 @@ def add_tillage_params(
     return decisions
 
 
-def add_tillage_practice_decision(field, till_depth, till_passes):
+def get_tillage_practice_decisions(decisions: pd.DataFrame) -> pd.Series:
+    """Returns the tillage practice by `Till_depth` and `Till_passes` for each row
+    of `decisions`."""
     # This function implements the Verity STIR Lite methodology,
     # which classifies tillage practices for GREET's FD-CIC
     # model based on the tillage depth and the number of
@@ -106,24 +77,33 @@ def add_tillage_practice_decision(field, till_depth, till_passes):
     # that is <= 3 inches.
     #
     # NO_TILLAGE: < 1 tillage passes and no tillage depth.
-    if pd.isna(till_depth) and pd.isna(till_passes):
+    till_depth = decisions["Till_depth"].to_numpy(dtype=float)
+    till_passes = decisions["Till_passes"].to_numpy(dtype=float)
+
+    # comparisons with NaN are always False
+    depth_missing = np.isnan(till_depth)
+    passes_missing = np.isnan(till_passes)
+    reduced_depth = (3.0 >= till_depth) & (till_depth >= 0.0)
+    reduced_passes = (3.0 >= till_passes) & (till_passes >= 1.0)
+
+    undetermined = depth_missing & passes_missing
+    for field in decisions["Field_name"][undetermined]:
         log.warning(
-            f"Unable to determine tillage practice for field {field} with depth: {till_depth}, and passes: {till_passes}"
+            f"Unable to determine tillage practice for field {field} without tillage depth and passes"
         )
-        return None
-    elif (
-        (till_depth > 3.0 or till_passes > 3.0)
-        or (pd.isna(till_passes) and till_depth > 3.0)
-        or (pd.isna(till_depth) and till_passes > 3.0)
-    ):
-        return "CONVENTIONAL_TILLAGE"
-
-    elif (
-        (3.0 >= till_depth >= 0.0 and 3.0 >= till_passes >= 1.0)
-        or (pd.isna(till_depth) and 3.0 >= till_passes >= 1.0)
-        or (3.0 >= till_depth >= 0.0 and pd.isna(till_passes))
-    ):
-        return "REDUCED_TILLAGE"
-
-    elif till_depth == 0 and till_passes < 1.0:
-        return "NO_TILLAGE"
+
+    return pd.Series(
+        np.select(
+            [
+                undetermined,
+                (till_depth > 3.0) | (till_passes > 3.0),
+                (reduced_depth & reduced_passes)
+                | (depth_missing & reduced_passes)
+                | (reduced_depth & passes_missing),
+                (till_depth == 0) & (till_passes < 1.0),
+            ],
+            [None, "CONVENTIONAL_TILLAGE", "REDUCED_TILLAGE", "NO_TILLAGE"],
+            default=None,
+        ),
+        index=decisions.index,
+    )
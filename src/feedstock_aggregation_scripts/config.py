@@ -8,6 +8,7 @@ Attributes:
 """
 from __future__ import annotations
 
+import os
 from functools import lru_cache
 from os import PathLike
 from pathlib import Path
@@ -22,7 +23,12 @@ from pydantic_settings import (
     SettingsConfigDict,
 )
 
-config_base_path: Path = Path(__file__).parents[2].resolve() / "application.yaml"
+# `FEEDSTOCK_CONFIG` points to another configuration file (e.g. for tests)
+config_base_path: Path = Path(
+    os.environ.get(
+        "FEEDSTOCK_CONFIG", Path(__file__).parents[2].resolve() / "application.yaml"
+    )
+)
 
 
 class YamlConfigSettingsSource(PydanticBaseSettingsSource):
@@ -71,6 +77,13 @@ class DataPrep(BaseSettings):
 
 class SoilTemperatureAPI(BaseSettings):
     url: HttpUrl
+    # seconds per request
+    timeout: float = 30
+    # retries with exponential backoff on connection errors and 429 / 5xx responses
+    retries: int = 5
+    backoff_factor: float = 0.5
+    # concurrent requests for batched fetches
+    max_workers: int = 8
 
 
 class GCSInfo(BaseSettings):
@@ -89,6 +102,53 @@ class FeedstockBucketFolders(BaseSettings):
     support_data: str | Path | PathLike
 
 
+class RawDataCache(BaseSettings):
+    """Local cache for raw GCS objects, see `data_aggregators/cache.py`."""
+
+    enabled: bool = True
+    path: str | Path | PathLike = Path.home() / ".cache" / "feedstock_raw_data"
+    max_size_mb: int = 2048
+    # max. number of raw exports fetched and parsed concurrently per file type
+    max_file_workers: int = 8
+
+
+class SoilTemperatureCache(BaseSettings):
+    """Local cache for soil temperature API responses, see
+    `ci_prep/soil_data_extract/soil_temp_cache.py`."""
+
+    enabled: bool = True
+    path: str | Path | PathLike = Path.home() / ".cache" / "feedstock_soil_temperature"
+    # coordinates are snapped to this grid (degrees) before requesting data
+    grid_resolution: float = 0.1
+
+
+class CountyStore(BaseSettings):
+    """Local store of the US county boundaries, see `shp_files/county_store.py`."""
+
+    path: str | Path | PathLike = Path.home() / ".cache" / "feedstock_county_store"
+    # local counties GeoJSON the store is built from when it does not exist yet
+    geojson: str | Path | PathLike | None = None
+
+
+class ProductMatchMemory(BaseSettings):
+    """Fuzzy product matching and its on-disk match memory, see
+    `data_prep/product_match.py`."""
+
+    enabled: bool = True
+    path: str | Path | PathLike = Path.home() / ".cache" / "feedstock_product_matches"
+    # threads scoring products, -1 uses all cores
+    workers: int = -1
+
+
+class ShpMatch(BaseSettings):
+    """Matching field names to shape file names, see `ci_prep/shp_files.py`."""
+
+    # threads scoring names, -1 uses all cores
+    workers: int = -1
+    # names are scored in chunks of fields of about this many scores
+    chunk_scores: int = 2**20
+
+
 class Settings(BaseSettings):
     """Collection of all settings definitions."""
 
@@ -98,6 +158,11 @@ class Settings(BaseSettings):
     soil_temperature_api: SoilTemperatureAPI
     gcs_dev: GCSInfo
     bucket_folders: FeedstockBucketFolders
+    raw_data_cache: RawDataCache = RawDataCache()
+    soil_temperature_cache: SoilTemperatureCache = SoilTemperatureCache()
+    product_match_memory: ProductMatchMemory = ProductMatchMemory()
+    shp_match: ShpMatch = ShpMatch()
+    county_store: CountyStore = CountyStore()
 
     @classmethod
     def settings_customise_sources(
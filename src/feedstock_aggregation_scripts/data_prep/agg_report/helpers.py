@@ -276,11 +276,8 @@ def get_fuel_params(path_to_data, grower, growing_cycle, data_aggregator, file_t
     )
 
     field_mapping = gen.read_field_name_mapping(path_to_data, grower)
-    fuel.Field_name = fuel.apply(
-        lambda x: gen.map_clear_name_using_farm_name(
-            field_mapping, x.Field_name, x.Farm_name
-        ),
-        axis=1,
+    fuel.Field_name = gen.NameResolver(field_mapping).clear_names(
+        fuel.Field_name, fuel.Farm_name
     )
 
     return fuel
@@ -123,20 +123,14 @@ def create_clean_file(
         )
 
     if not field_mapping.empty:
-        temp.Field_name = temp.apply(
-            lambda x: gen.map_clear_name_using_farm_name(
-                field_mapping, x.Field_name, x.Farm_name
-            ),
-            axis=1,
+        temp.Field_name = gen.NameResolver(field_mapping).clear_names(
+            temp.Field_name, temp.Farm_name
         )
 
     if "Product" in temp.columns:
-        temp.Product = temp.apply(
-            lambda x: gen.map_clear_name(product_mapping, x.Product), axis=1
-        )
-        temp["Product_type"] = temp.apply(
-            lambda x: gen.map_fert_type(product_mapping, x.Product), axis=1
-        )
+        product_names = gen.NameResolver(product_mapping)
+        temp.Product = product_names.clear_names(temp.Product)
+        temp["Product_type"] = product_names.fert_types(temp.Product)
 
     for col in ["Operation_start", "Operation_end", "Product", "Product_type"]:
         if col not in temp.columns:
@@ -3,7 +3,6 @@ import pathlib
 
 import numpy as np
 import pandas as pd
-from fuzzywuzzy import process
 from loguru import logger as log
 
 from ..general import read_field_name_mapping
@@ -17,6 +16,7 @@ from .extract_file_types.land_db import read_file_by_file_type
 from .harvest_dates.harvest_dates import get_harvest_dates
 from .helpers import get_seeding_area
 from .lime.lime import extract_lime_info_from_apps
+from .product_match import match_products
 from .split_field.split_field import prepare_split_field_data
 
 # %%
@@ -387,22 +387,12 @@ def create_unmatched_product_list(
 
 def match_lists(source_df, list1, list2, ratio):
     # Helper to fuzzy match function below
-    matches = []
-    probabilities = []
-
-    for i in list1:
-        ratios = process.extractOne(i, list2)
-
-        if int(ratios[1]) > ratio:  # can play with this number
-            matches.append(ratios[0])
-            probabilities.append("Fertilizer")
-        else:
-            matches.append("no match")
-            probabilities.append("NOT fertilizer")
+    matches = match_products(pd.Series(list1), list2)
+    is_match = (matches.Score.round() > ratio).to_numpy()  # can play with this number
 
     df = source_df
-    df["potential product match"] = matches
-    df["likely product type"] = probabilities
+    df["potential product match"] = np.where(is_match, matches.Match, "no match")
+    df["likely product type"] = np.where(is_match, "Fertilizer", "NOT fertilizer")
 
     return df
 
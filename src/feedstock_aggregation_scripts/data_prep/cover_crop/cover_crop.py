@@ -64,11 +64,8 @@ def create_cc_report(
     if not temp.empty:
         # map field names (for known fields)
         field_mapping = gen.read_field_name_mapping(path_to_data, grower)
-        temp["Field_name"] = temp.apply(
-            lambda x: gen.map_clear_name_using_farm_name(
-                field_mapping, x.Field_name, x.Farm_name
-            ),
-            axis=1,
+        temp["Field_name"] = gen.NameResolver(field_mapping).clear_names(
+            temp.Field_name, temp.Farm_name
         )
 
         temp = temp.sort_values(by=["Farm_name", "Field_name"], ignore_index=True)
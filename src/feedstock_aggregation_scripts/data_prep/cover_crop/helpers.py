@@ -11,7 +11,7 @@ from ...util.readers.general import (
     read_file_by_file_type,
 )
 from ..constants import FDCIC_CROPS, HARVEST, HARVEST_DATES, NOT_FOUND, PLANTING
-from ..helpers import classify_op_growing_cycle_relevant, create_min_max_harvest_dates
+from ..helpers import classify_ops_growing_cycle_relevant, create_min_max_harvest_dates
 
 
 def extract_cc_info_from_planting(
@@ -66,11 +66,8 @@ def extract_cc_info_from_planting(
     # return seed
     field_mapping = gen.read_field_name_mapping(path_to_data, grower)
     if not field_mapping.empty:
-        seed.Field_name = seed.apply(
-            lambda x: gen.map_clear_name_using_farm_name(
-                field_mapping, x.Field_name, x.Farm_name
-            ),
-            axis=1,
+        seed.Field_name = gen.NameResolver(field_mapping).clear_names(
+            seed.Field_name, seed.Farm_name
         )
 
     harvest_dates = read_file_by_file_type(
@@ -88,15 +85,12 @@ def extract_cc_info_from_planting(
         temp["Harvest_date_prev"] = pd.NaT
         temp["Harvest_date_curr"] = pd.NaT
     # return temp
-    temp["Op_relevance"] = temp.apply(
-        lambda x: classify_op_growing_cycle_relevant(
-            x.Planting_date,
-            x.Operation_type,
-            x.Harvest_date_prev,
-            x.Harvest_date_curr,
-            growing_cycle,
-        ),
-        axis=1,
+    temp["Op_relevance"] = classify_ops_growing_cycle_relevant(
+        temp.Planting_date,
+        temp.Operation_type,
+        temp.Harvest_date_prev,
+        temp.Harvest_date_curr,
+        growing_cycle,
     )
     # exclude operations that are outside the harvest dates
     temp = temp[~temp.Op_relevance.isin(["exclude"])]
@@ -176,19 +170,12 @@ def extract_cc_info_from_harvesting(
 
     field_mapping = gen.read_field_name_mapping(path_to_data, grower)
     if not field_mapping.empty:
-        harvest.Field_name = harvest.apply(
-            lambda x: gen.map_clear_name_using_farm_name(
-                field_mapping, x.Field_name, x.Farm_name
-            ),
-            axis=1,
+        field_names = gen.NameResolver(field_mapping)
+        harvest.Field_name = field_names.clear_names(
+            harvest.Field_name, harvest.Farm_name
         )
         if not seed.empty:
-            seed.Field_name = seed.apply(
-                lambda x: gen.map_clear_name_using_farm_name(
-                    field_mapping, x.Field_name, x.Farm_name
-                ),
-                axis=1,
-            )
+            seed.Field_name = field_names.clear_names(seed.Field_name, seed.Farm_name)
 
     harvest = harvest.rename(columns={"Operation_start": "Harvest_date"})
 
@@ -6,9 +6,7 @@ import pandas as pd
 from loguru import logger as log
 
 from ...general import (
-    map_clear_name,
-    map_clear_name_using_farm_name,
-    map_fert_type,
+    NameResolver,
     read_field_name_mapping,
     read_product_mapping_file,
 )
@@ -54,19 +52,13 @@ def create_Granular_planting_file(path_to_data, grower, growing_cycle):
         apps, path_to_data, grower, growing_cycle
     )
 
-    apps.Product = apps.apply(
-        lambda x: map_clear_name(product_mapping, x.Product), axis=1
-    )
-    apps["Product_type"] = apps.apply(
-        lambda x: map_fert_type(product_mapping, x.Product), axis=1
-    )
+    product_names = NameResolver(product_mapping)
+    apps.Product = product_names.clear_names(apps.Product)
+    apps["Product_type"] = product_names.fert_types(apps.Product)
 
     field_mapping = read_field_name_mapping(path_to_data, grower)
-    apps.Field_name = apps.apply(
-        lambda x: map_clear_name_using_farm_name(
-            field_mapping, x.Field_name, x.Farm_name
-        ),
-        axis=1,
+    apps.Field_name = NameResolver(field_mapping).clear_names(
+        apps.Field_name, apps.Farm_name
     )
 
     apps = apps[apps.Operation_type == "Planting"]
@@ -140,11 +132,8 @@ def create_Granular_tillage_file(path_to_data, grower, growing_cycle):
     )
 
     field_mapping = read_field_name_mapping(path_to_data, grower)
-    till.Field_name = till.apply(
-        lambda x: map_clear_name_using_farm_name(
-            field_mapping, x.Field_name, x.Farm_name
-        ),
-        axis=1,
+    till.Field_name = NameResolver(field_mapping).clear_names(
+        till.Field_name, till.Farm_name
     )
 
     till = till[till.Task_name.isin(["Strip Till", "Strip- Till"])]
@@ -5,10 +5,8 @@ from loguru import logger as log
 from pandas import DataFrame
 
 from ...general import (
+    NameResolver,
     clean_col_entry,
-    map_clear_name,
-    map_clear_name_using_farm_name,
-    map_fert_type,
     read_field_name_mapping,
     read_product_mapping_file,
 )
@@ -53,24 +51,18 @@ def create_LDB_planting_file(path_to_data, grower, growing_cycle):
     # return apps
     # apps = supplement_Granular_client_and_farm(apps, path_to_data, grower, growing_cycle)
 
-    apps.Product = apps.apply(
-        lambda x: map_clear_name(product_mapping, x.Product), axis=1
-    )
-    apps["Product_type"] = apps.apply(
-        lambda x: map_fert_type(product_mapping, x.Product), axis=1
-    )
+    product_names = NameResolver(product_mapping)
+    apps.Product = product_names.clear_names(apps.Product)
+    apps["Product_type"] = product_names.fert_types(apps.Product)
 
     field_mapping = read_field_name_mapping(path_to_data, grower)
-    apps.Field_name = apps.apply(
-        lambda x: map_clear_name_using_farm_name(
-            field_mapping, x.Field_name, x.Farm_name
-        ),
-        axis=1,
+    apps.Field_name = NameResolver(field_mapping).clear_names(
+        apps.Field_name, apps.Farm_name
     )
 
     apps = apps[
         (apps.Product.isin(["Planting"]))
-        | (apps.Applied_unit.isin(seeding_planting_params))
+        | (apps.Applied_unit.isin(seeding_planting_params()))
     ]
 
     apps.Operation_type = "Planting"
@@ -139,19 +131,13 @@ def create_LDB_fuel_file(path_to_data, grower, growing_cycle):
         data_aggregator=DA_LDB,
     )
 
-    apps.Product = apps.apply(
-        lambda x: map_clear_name(product_mapping, x.Product), axis=1
-    )
-    apps["Product_type"] = apps.apply(
-        lambda x: map_fert_type(product_mapping, x.Product), axis=1
-    )
+    product_names = NameResolver(product_mapping)
+    apps.Product = product_names.clear_names(apps.Product)
+    apps["Product_type"] = product_names.fert_types(apps.Product)
 
     field_mapping = read_field_name_mapping(path_to_data, grower)
-    apps.Field_name = apps.apply(
-        lambda x: map_clear_name_using_farm_name(
-            field_mapping, x.Field_name, x.Farm_name
-        ),
-        axis=1,
+    apps.Field_name = NameResolver(field_mapping).clear_names(
+        apps.Field_name, apps.Farm_name
     )
 
     apps["Fuel_op"] = apps["Product"].apply(mark_fuel_ops)
@@ -212,19 +198,13 @@ def create_LDB_tillage_file(path_to_data, grower, growing_cycle):
     # apps = supplement_Granular_client_and_farm(apps, path_to_data, grower, growing_cycle)
 
     apps.Product = apps.Product.apply(clean_col_entry)
-    apps.Product = apps.apply(
-        lambda x: map_clear_name(product_mapping, x.Product), axis=1
-    )
-    apps["Product_type"] = apps.apply(
-        lambda x: map_fert_type(product_mapping, x.Product), axis=1
-    )
+    product_names = NameResolver(product_mapping)
+    apps.Product = product_names.clear_names(apps.Product)
+    apps["Product_type"] = product_names.fert_types(apps.Product)
 
     field_mapping = read_field_name_mapping(path_to_data, grower)
-    apps.Field_name = apps.apply(
-        lambda x: map_clear_name_using_farm_name(
-            field_mapping, x.Field_name, x.Farm_name
-        ),
-        axis=1,
+    apps.Field_name = NameResolver(field_mapping).clear_names(
+        apps.Field_name, apps.Farm_name
     )
 
     apps = apps[apps.Product.isin(["Field Cult w/ Harrow", "Tillage"])]
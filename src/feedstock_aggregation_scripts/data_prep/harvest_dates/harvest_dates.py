@@ -83,11 +83,8 @@ def get_harvest_dates(
 
     # map field names (for known fields)
     field_mapping = gen.read_field_name_mapping(path_to_data, grower)
-    harvest_dates.Field_name = harvest_dates.apply(
-        lambda x: gen.map_clear_name_using_farm_name(
-            field_mapping, x.Field_name, x.Farm_name
-        ),
-        axis=1,
+    harvest_dates.Field_name = gen.NameResolver(field_mapping).clear_names(
+        harvest_dates.Field_name, harvest_dates.Farm_name
     )
 
     return harvest_dates
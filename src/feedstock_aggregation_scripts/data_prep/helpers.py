@@ -1,6 +1,5 @@
 import os
 import pathlib
-from datetime import datetime
 
 import numpy as np
 import pandas as pd
@@ -33,6 +32,7 @@ def get_all_available_field_names(
     fields = pd.Series(dtype=str)
 
     field_mapping = gen.read_field_name_mapping(path_to_data, grower)
+    field_names = gen.NameResolver(field_mapping)
 
     # SUGGESTION:
     # instead of trying to read files from all potential data sources,
@@ -48,12 +48,7 @@ def get_all_available_field_names(
             continue
         # map field names to clear names for comparison across data sources
         if not field_mapping.empty:
-            temp.Field_name = temp.apply(
-                lambda x: gen.map_clear_name_using_farm_name(
-                    field_mapping, x.Field_name, x.Farm_name
-                ),
-                axis=1,
-            )
+            temp.Field_name = field_names.clear_names(temp.Field_name, temp.Farm_name)
 
         fields = pd.concat([fields, temp.Field_name])
 
@@ -210,11 +205,8 @@ def get_harvested_area(
     field_mapping = gen.read_field_name_mapping(path_to_data, grower)
 
     if not field_mapping.empty:
-        harvest.Field_name = harvest.apply(
-            lambda x: gen.map_clear_name_using_farm_name(
-                field_mapping, x.Field_name, x.Farm_name
-            ),
-            axis=1,
+        harvest.Field_name = gen.NameResolver(field_mapping).clear_names(
+            harvest.Field_name, harvest.Farm_name
         )
 
     # add seeding areas per field
@@ -266,10 +258,17 @@ def create_min_max_harvest_dates(clean_data, harvest_dates, growing_cycle):
     return temp
 
 
-def classify_op_growing_cycle_relevant(
-    operation_start, operation_type, harvest_prev, harvest_curr, growing_cycle
-):
-    """
+def classify_ops_growing_cycle_relevant(
+    operation_start: pd.Series,
+    operation_type: pd.Series,
+    harvest_prev: pd.Series,
+    harvest_curr: pd.Series,
+    growing_cycle: int,
+) -> pd.Series:
+    """Classifies operations as `relevant`, `likely_relevant`, `exclude` or
+    `missing_op_date` for `growing_cycle` by their start date and the harvest dates
+    of the previous and current year.
+
     Asumptions:
     - if a harvest date is missing in `harvest_prev`, all operations that happened before 1st Sep of the previous year
       are marked 'exclude'
@@ -277,62 +276,51 @@ def classify_op_growing_cycle_relevant(
       are marked 'exclude'
     - operations marked 'exclude' will NOT appear in the cleaned file
     """
-    if pd.isnull(operation_start):
-        return "missing_op_date"
-
-    elif pd.isnull(harvest_prev) and pd.isnull(harvest_curr):
-        if operation_start >= datetime.strptime(
-            str(growing_cycle - 1) + "-09-01 00:00:00", "%Y-%m-%d %H:%M:%S"
-        ) and operation_start < datetime.strptime(
-            str(growing_cycle) + "-11-01 00:00:00", "%Y-%m-%d %H:%M:%S"
-        ):
-            return "likely_relevant"
-        else:
-            return "exclude"
-
-    # cut-off operations that happened before 1st of September of previous year, when harvest_prev is missing
-    elif pd.isnull(harvest_prev) and operation_start <= datetime.strptime(
-        str(growing_cycle - 1) + "-09-01 00:00:00", "%Y-%m-%d %H:%M:%S"
-    ):
-        return "exclude"
-
+    start = pd.to_datetime(operation_start).to_numpy()
+    prev = pd.to_datetime(harvest_prev).to_numpy()
+    curr = pd.to_datetime(harvest_curr).to_numpy()
+    is_harvest = (operation_type == "Harvest").to_numpy()
+
+    # comparisons with NaT are always False
+    prev_missing = np.isnat(prev)
+    curr_missing = np.isnat(curr)
+    cycle_start = np.datetime64(f"{growing_cycle - 1}-09-01")
+    cycle_end = np.datetime64(f"{growing_cycle}-11-01")
+
+    conditions = [
+        np.isnat(start),
+        prev_missing & curr_missing & (start >= cycle_start) & (start < cycle_end),
+        prev_missing & curr_missing,
+        # cut-off operations that happened before 1st of September of previous year, when harvest_prev is missing
+        prev_missing & (start <= cycle_start),
         # cut-off operations that happened after 31st of October of current year, when harvest_curr is missing
-    elif pd.isnull(harvest_curr) and operation_start >= datetime.strptime(
-        str(growing_cycle) + "-11-01 00:00:00", "%Y-%m-%d %H:%M:%S"
-    ):
-        return "exclude"
-
-    elif pd.isnull(harvest_prev) and operation_start <= harvest_curr:
-        return "likely_relevant"
-
-    elif operation_start == harvest_prev:
-        return "exclude"
-
-    # all operations that happend from right after previous harvest, when harvest_curr is missing
-    elif (
-        operation_start >= harvest_prev
-        and operation_type != "Harvest"
-        and pd.isnull(harvest_curr)
-    ):
-        return "likely_relevant"
-
-    elif (
-        operation_start >= harvest_prev
-        and operation_type != "Harvest"
-        and operation_start <= harvest_curr
-    ):
-        return "relevant"
-
-    # include only harvest operations that happended AFTER previous harvest
-    elif (
-        operation_start > harvest_prev
-        and operation_type == "Harvest"
-        and operation_start <= harvest_curr
-    ):
-        return "relevant"
-
-    elif operation_start < harvest_prev or operation_start > harvest_curr:
-        return "exclude"
+        curr_missing & (start >= cycle_end),
+        prev_missing & (start <= curr),
+        start == prev,
+        # all operations that happend from right after previous harvest, when harvest_curr is missing
+        (start >= prev) & ~is_harvest & curr_missing,
+        (start >= prev) & ~is_harvest & (start <= curr),
+        # include only harvest operations that happended AFTER previous harvest
+        (start > prev) & is_harvest & (start <= curr),
+        (start < prev) | (start > curr),
+    ]
+    choices = [
+        "missing_op_date",
+        "likely_relevant",
+        "exclude",
+        "exclude",
+        "exclude",
+        "likely_relevant",
+        "exclude",
+        "likely_relevant",
+        "relevant",
+        "relevant",
+        "exclude",
+    ]
+
+    return pd.Series(
+        np.select(conditions, choices, default=None), index=operation_start.index
+    )
 
 
 def mark_growing_cycle_relevant_ops(clean_data, harvest_dates, growing_cycle):
@@ -354,15 +342,12 @@ def mark_growing_cycle_relevant_ops(clean_data, harvest_dates, growing_cycle):
     # return temp
     harvest_prev = "Harvest_date_prev"  # + str(growing_cycle-1)
     harvest_curr = "Harvest_date_curr"  # + str(growing_cycle)
-    temp["Op_relevance"] = temp.apply(
-        lambda x: classify_op_growing_cycle_relevant(
-            x.Operation_start,
-            x.Operation_type,
-            x[harvest_prev],
-            x[harvest_curr],
-            growing_cycle,
-        ),
-        axis=1,
+    temp["Op_relevance"] = classify_ops_growing_cycle_relevant(
+        temp.Operation_start,
+        temp.Operation_type,
+        temp[harvest_prev],
+        temp[harvest_curr],
+        growing_cycle,
     )
     temp["Growing_cycle"] = growing_cycle
 
@@ -395,15 +380,12 @@ def add_op_relevance_by_harvest_dates(
         file["Harvest_date_curr"] = pd.NaT
 
     if not file.empty:
-        file["Op_relevance"] = file.apply(
-            lambda x: classify_op_growing_cycle_relevant(
-                x.Operation_start,
-                x.Operation_type,
-                x["Harvest_date_prev"],
-                x["Harvest_date_curr"],
-                growing_cycle,
-            ),
-            axis=1,
+        file["Op_relevance"] = classify_ops_growing_cycle_relevant(
+            file.Operation_start,
+            file.Operation_type,
+            file["Harvest_date_prev"],
+            file["Harvest_date_curr"],
+            growing_cycle,
         )
     else:
         file["Op_relevance"] = np.nan
@@ -43,11 +43,8 @@ def extract_lime_info_from_apps(
 
     # map field names (for known fields)
     field_mapping = gen.read_field_name_mapping(path_to_data, grower)
-    apps.Field_name = apps.apply(
-        lambda x: gen.map_clear_name_using_farm_name(
-            field_mapping, x.Field_name, x.Farm_name
-        ),
-        axis=1,
+    apps.Field_name = gen.NameResolver(field_mapping).clear_names(
+        apps.Field_name, apps.Farm_name
     )
 
     apps = apps[apps.Product.isin(["Lime"])]
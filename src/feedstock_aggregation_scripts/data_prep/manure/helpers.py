@@ -58,11 +58,8 @@ def extract_manure_info_from_apps(
     apps = pd.concat([apps_prev, apps_curr], ignore_index=True)
 
     field_mapping = gen.read_field_name_mapping(path_to_data, grower)
-    apps.Field_name = apps.apply(
-        lambda x: gen.map_clear_name_using_farm_name(
-            field_mapping, x.Field_name, x.Farm_name
-        ),
-        axis=1,
+    apps.Field_name = gen.NameResolver(field_mapping).clear_names(
+        apps.Field_name, apps.Farm_name
     )
 
     if data_aggregator == DA_GRANULAR:
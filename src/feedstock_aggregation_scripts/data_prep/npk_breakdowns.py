@@ -1,33 +1,22 @@
+import numbers
 import pathlib
 
-import numpy as np
 import pandas as pd
 from loguru import logger as log
 
+from ..util.reference_data import REFERENCE_DATA
+
 # -------------------------------------------------------------------------------------------
 # General functions - NPK CALCULATION
 #
 
 
-def get_fert_list(path_to_data: str | pathlib.Path) -> pd.DataFrame:
-    """DUPLICATE FUNCTION | DEPRECATED
+FERT_LIST_FILE = "verity_chemical_product_breakdown_table - Sheet1.csv"
 
-    Should use `get_breakdown_list()` from
-        src/feedstock_aggregation_scripts/util/readers/general.py
-    """
-    try:
-        fert_list = pd.read_csv(
-            pathlib.Path(path_to_data).joinpath(
-                "verity_chemical_product_breakdown_table - Sheet1.csv"
-            )
-        )
+NUTRIENT_COLS = {"N": "% N", "P": "% P2O5", "K": "% K2O"}
 
-    except FileNotFoundError:
-        log.exception(
-            f"no `verity_chemical_product_breakdown_table - Sheet1.csv` at {path_to_data}"
-        )
-        return pd.DataFrame()
 
+def read_fert_list(path_to_file: str | pathlib.Path) -> pd.DataFrame:
     rel_cols = [
         "product_name",
         "product_type",
@@ -38,6 +27,7 @@ def get_fert_list(path_to_data: str | pathlib.Path) -> pd.DataFrame:
         "EEF product (y/n) - Fert only",
     ]
 
+    fert_list = pd.read_csv(path_to_file)
     fert_list = fert_list[(fert_list["product_type"].isin(["Fertilizer", "EEF"]))][
         rel_cols
     ]
@@ -46,39 +36,63 @@ def get_fert_list(path_to_data: str | pathlib.Path) -> pd.DataFrame:
     return fert_list.reset_index(drop=True)
 
 
-def get_n(product: str, total: float, fert_list: pd.DataFrame) -> float:
-    temp = fert_list[fert_list.product_name == product]
-    n = temp["% N"].iloc[0] if not np.isnan(temp["% N"].iloc[0]) else 0
-    conversion = (
-        temp["lbs / gal"].iloc[0] if not np.isnan(temp["lbs / gal"].iloc[0]) else 0
-    )
+def get_fert_list(path_to_data: str | pathlib.Path) -> pd.DataFrame:
+    """DUPLICATE FUNCTION | DEPRECATED
 
-    return n * conversion * total
+    Should use `get_breakdown_list()` from
+        src/feedstock_aggregation_scripts/util/readers/general.py
 
+    The breakdown table is read once per `path_to_data` and cached as reference data.
+    """
+    path_to_file = pathlib.Path(path_to_data).joinpath(FERT_LIST_FILE)
+    name = f"fert_list:{path_to_file}"
+    REFERENCE_DATA.register(name, read_fert_list, lambda: (path_to_file,))
 
-def get_p(product: str, total: float, fert_list: pd.DataFrame) -> float:
-    temp = fert_list[fert_list.product_name == product]
-    p = temp["% P2O5"].iloc[0] if not np.isnan(temp["% P2O5"].iloc[0]) else 0
-    conversion = (
-        temp["lbs / gal"].iloc[0] if not np.isnan(temp["lbs / gal"].iloc[0]) else 0
-    )
+    try:
+        fert_list = REFERENCE_DATA.get(name)
 
-    return p * conversion * total
+    except FileNotFoundError:
+        log.exception(f"no `{FERT_LIST_FILE}` at {path_to_data}")
+        return pd.DataFrame()
+
+    return fert_list.copy()
 
 
-def get_k(product: str, total: float, fert_list: pd.DataFrame) -> float:
-    temp = fert_list[fert_list.product_name == product]
-    k = temp["% K2O"].iloc[0] if not np.isnan(temp["% K2O"].iloc[0]) else 0
-    conversion = (
-        temp["lbs / gal"].iloc[0] if not np.isnan(temp["lbs / gal"].iloc[0]) else 0
+def get_nutrient_factors(products: pd.Series, fert_list: pd.DataFrame) -> pd.DataFrame:
+    """Returns the N, P and K (P2O5, K2O) per unit of each of `products`, i.e. the
+    nutrient percentages times `lbs / gal` of its (first) breakdown in `fert_list`.
+    Missing percentages and densities count as 0."""
+    breakdowns = fert_list.drop_duplicates(subset="product_name").set_index(
+        "product_name"
     )
+    conversion = breakdowns["lbs / gal"].fillna(0)
+    factors = pd.DataFrame(
+        {
+            nutrient: breakdowns[col].fillna(0) * conversion
+            for nutrient, col in NUTRIENT_COLS.items()
+        }
+    )
+    return factors.reindex(products.to_numpy()).set_index(products.index)
 
-    return k * conversion * total
+
+def is_numeric(values: pd.Series) -> bool:
+    """Whether all `values` are numbers (NaN included)."""
+    return (
+        pd.api.types.is_numeric_dtype(values)
+        or values.map(lambda v: isinstance(v, numbers.Number)).all()
+    )
 
 
 def get_NPK_rate(
     apps: pd.DataFrame, path_to_data: str | pathlib.Path, grower="DUMMY"
 ) -> pd.DataFrame:
+    """Adds the TOTAL_N/P/K and RATE_N/P/K (per `Area_applied`) of the fertilizer
+    products in `apps`, dropping all other products.
+
+    Nutrients are computed from `Applied_total` (NaN totals give NaN nutrients). If
+    there is no numeric `Applied_total` column, they are computed from
+    `Applied_rate` for all products instead, with the totals derived from the rate.
+    """
     if apps.empty:
         return apps
 
@@ -92,38 +106,20 @@ def get_NPK_rate(
         )
         return a
 
-    try:
-        a["TOTAL_N"] = a.apply(
-            lambda x: get_n(x.Product, x.Applied_total, fert_list), axis=1
-        )
-        a["TOTAL_P"] = a.apply(
-            lambda x: get_p(x.Product, x.Applied_total, fert_list), axis=1
-        )
-        a["TOTAL_K"] = a.apply(
-            lambda x: get_k(x.Product, x.Applied_total, fert_list), axis=1
-        )
-
-        for col in ["TOTAL_N", "TOTAL_P", "TOTAL_K"]:
-            col_name = col.replace("TOTAL", "RATE")
-
-            a[col_name] = a[col] / a.Area_applied
-
-    except Exception as e:
-        log.exception(str(e))
-        a["RATE_N"] = a.apply(
-            lambda x: get_n(x.Product, x.Applied_rate, fert_list), axis=1
-        )
-        a["RATE_P"] = a.apply(
-            lambda x: get_p(x.Product, x.Applied_rate, fert_list), axis=1
-        )
-        a["RATE_K"] = a.apply(
-            lambda x: get_k(x.Product, x.Applied_rate, fert_list), axis=1
-        )
+    factors = get_nutrient_factors(a.Product, fert_list)
 
-        for col in ["RATE_N", "RATE_P", "RATE_K"]:
-            col_name = col.replace("RATE", "TOTAL")
+    if "Applied_total" in a and is_numeric(a.Applied_total):
+        for nutrient in NUTRIENT_COLS:
+            a[f"TOTAL_{nutrient}"] = factors[nutrient] * a.Applied_total.astype(float)
+        for nutrient in NUTRIENT_COLS:
+            a[f"RATE_{nutrient}"] = a[f"TOTAL_{nutrient}"] / a.Area_applied
 
-            a[col_name] = a[col] * a.Area_applied
+    else:
+        log.warning("no numeric applied totals, using applied rates")
+        for nutrient in NUTRIENT_COLS:
+            a[f"RATE_{nutrient}"] = factors[nutrient] * a.Applied_rate.astype(float)
+        for nutrient in NUTRIENT_COLS:
+            a[f"TOTAL_{nutrient}"] = a[f"RATE_{nutrient}"] * a.Area_applied
 
     return a
 
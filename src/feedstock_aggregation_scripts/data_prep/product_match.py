@@ -0,0 +1,249 @@
+"""Fuzzy matching of product names against known (fertilizer) products.
+
+Products are scored like fuzzywuzzy's `process.extractOne` (`WRatio` on strings
+processed like its `full_process(force_ascii=True)`, first best choice wins), but
+with rapidfuzz: all products are scored against all choices in one `cdist` call per
+chunk, using all cores.
+
+The best match and score per processed product string are kept in a match memory
+on disk, one file per list of choices, so later runs (of any grower and data
+aggregator) only score product strings they have not seen yet.
+
+Benchmark scoring for growing numbers of product names with
+
+    python -m src.feedstock_aggregation_scripts.data_prep.product_match [--sizes ...]
+"""
+import argparse
+import fcntl
+import hashlib
+import os
+import pathlib
+import re
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from loguru import logger as log
+from rapidfuzz import fuzz, process
+
+from ..config import settings
+
+MATCH_COLS = ["Key", "Match", "Score"]
+# bump when the product keys or their scores change, so older memories are not used
+MEMORY_VERSION = 2
+
+# fuzzywuzzy's `force_ascii` drops the characters 128 - 255 (and keeps the others),
+# its processing keeps underscores, unlike `rapidfuzz.utils.default_process`
+NON_ASCII = str.maketrans("", "", "".join(map(chr, range(128, 256))))
+NON_WORD = re.compile(r"\W")
+
+
+class ProductMatchMemory:
+    """On-disk memory of product matches.
+
+    Matches are stored per list of choices (keyed by its digest, as the best match
+    depends on all choices and their order) in a CSV file with the processed
+    product string, its best match and score. Writers of the same file (e.g.
+    parallel runs for several growers) are serialized by a lock file and merge
+    their matches with the ones on disk.
+    """
+
+    def __init__(self, memory_dir: str | pathlib.Path):
+        self.memory_dir = pathlib.Path(memory_dir)
+
+    def memory_path(self, choices: list[str]) -> pathlib.Path:
+        digest = hashlib.sha256(
+            "\n".join([f"v{MEMORY_VERSION}", *choices]).encode()
+        ).hexdigest()
+        return self.memory_dir.joinpath(f"{digest}.csv")
+
+    def get(self, choices: list[str]) -> pd.DataFrame:
+        """Returns the known matches for `choices`, indexed by product key."""
+        try:
+            matches = pd.read_csv(
+                self.memory_path(choices),
+                dtype={"Key": str, "Match": str, "Score": float},
+                # product names like `NA` are no missing values
+                keep_default_na=False,
+                na_values={"Match": [""]},
+            )
+        except FileNotFoundError:
+            matches = pd.DataFrame(columns=MATCH_COLS)
+
+        return matches.set_index("Key")
+
+    def put(self, choices: list[str], matches: pd.DataFrame):
+        """Adds `matches` (indexed by product key) to the known matches for
+        `choices`. Keys already on disk keep their stored match."""
+        path = self.memory_path(choices)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(path.with_suffix(".lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            # matches written by other processes since `matches` was read
+            known = self.get(choices)
+            if not known.empty:
+                new = matches[~matches.index.isin(known.index)]
+                matches = pd.concat([known, new]) if not new.empty else known
+
+            # write next to the target and move into place, so concurrent readers
+            # never see partial files
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".part")
+            try:
+                with os.fdopen(fd, "w", newline="") as f:
+                    matches.rename_axis("Key").reset_index()[MATCH_COLS].to_csv(
+                        f, index=False
+                    )
+                os.replace(tmp, path)
+            except BaseException:
+                pathlib.Path(tmp).unlink(missing_ok=True)
+                raise
+
+
+PRODUCT_MATCH_MEMORY = (
+    ProductMatchMemory(settings.product_match_memory.path)
+    if settings.product_match_memory.enabled
+    else None
+)
+
+
+def process_product(product: str) -> str:
+    """Processes `product` like fuzzywuzzy's `full_process(force_ascii=True)`:
+    without characters 128 - 255, non word characters replaced by spaces, lower case
+    and stripped."""
+    return NON_WORD.sub(" ", product.translate(NON_ASCII)).lower().strip()
+
+
+def process_products(products: pd.Series) -> pd.Series:
+    """Keys of `products` in the match memory, see `process_product`. Non-string
+    products are NaN."""
+    products = products.where(products.map(lambda p: isinstance(p, str)))
+    return products.map(process_product, na_action="ignore")
+
+
+def score_products(
+    products: list[str], choices: list[str], workers: int = -1, chunk_size=1000
+) -> pd.DataFrame:
+    """Returns the best of `choices` (the first one on ties) and its score for each
+    of the processed `products` (see `process_product`), indexed by product.
+    Products are scored in chunks of `chunk_size` to bound the size of the score
+    matrix."""
+    if not choices:
+        return pd.DataFrame(
+            {"Match": np.nan, "Score": 0.0}, index=pd.Index(products, dtype=object)
+        )
+
+    choices_array = np.array(choices, dtype=object)
+    processed_choices = [process_product(c) for c in choices]
+    matches, scores = [], []
+    for start in range(0, len(products), chunk_size):
+        ratios = process.cdist(
+            products[start : start + chunk_size],
+            processed_choices,
+            scorer=fuzz.WRatio,
+            workers=workers,
+        )
+        best = ratios.argmax(axis=1)
+        matches.append(choices_array[best])
+        scores.append(ratios[np.arange(len(best)), best].astype(float))
+
+    return pd.DataFrame(
+        {
+            "Match": np.concatenate(matches) if matches else [],
+            "Score": np.concatenate(scores) if scores else [],
+        },
+        index=pd.Index(products, dtype=object),
+    )
+
+
+def match_products(
+    products: pd.Series,
+    choices,
+    workers: int | None = None,
+    memory: ProductMatchMemory | None = PRODUCT_MATCH_MEMORY,
+) -> pd.DataFrame:
+    """Returns the best match of `choices` and its score (0 - 100) for each of
+    `products`, aligned with `products`. Products without string value get no match
+    and score 0.
+
+    Only products whose processed string is not in the match `memory` yet are
+    scored, the memory is updated with them.
+    """
+    if workers is None:
+        workers = settings.product_match_memory.workers
+    choices = list(dict.fromkeys(c for c in choices if isinstance(c, str)))
+
+    keys = process_products(pd.Series(products))
+    known = (
+        memory.get(choices)
+        if memory is not None
+        else pd.DataFrame(columns=MATCH_COLS).set_index("Key")
+    )
+
+    unique_keys = pd.Series(keys.dropna().unique(), dtype=object)
+    new_keys = unique_keys[~unique_keys.isin(known.index)].tolist()
+    if new_keys:
+        start = time.perf_counter()
+        scored = score_products(new_keys, choices, workers=workers)
+        log.info(
+            f"scored {len(new_keys)} new products against {len(choices)} choices in "
+            f"{time.perf_counter() - start:.2f}s"
+        )
+        known = pd.concat([known, scored]) if not known.empty else scored
+        if memory is not None:
+            memory.put(choices, known)
+
+    matches = known.reindex(keys.to_numpy()).set_index(keys.index)
+    matches["Score"] = matches.Score.fillna(0.0)
+    return matches
+
+
+def benchmark(sizes: list[int], n_choices: int, workers: int) -> pd.DataFrame:
+    """Times scoring `sizes` synthetic product names against `n_choices` synthetic
+    choices, and looking them up again in the match memory."""
+    rng = np.random.default_rng(0)
+    words = np.array(
+        ["urea", "uan", "ammonium", "sulfate", "potash", "liquid", "dry", "blend"]
+        + ["phosphate", "nitrate", "zinc", "boron", "starter", "pro", "max", "ag"]
+    )
+
+    def product_names(n):
+        return [
+            f"{' '.join(rng.choice(words, rng.integers(1, 4)))} {rng.integers(1, 99)}"
+            f"-{rng.integers(0, 52)}-{rng.integers(0, 60)}"
+            for _ in range(n)
+        ]
+
+    choices = product_names(n_choices)
+    timings = []
+    with tempfile.TemporaryDirectory() as memory_dir:
+        for size in sizes:
+            memory = ProductMatchMemory(pathlib.Path(memory_dir).joinpath(str(size)))
+            products = pd.Series(product_names(size))
+
+            start = time.perf_counter()
+            match_products(products, choices, workers=workers, memory=memory)
+            scoring = time.perf_counter() - start
+
+            start = time.perf_counter()
+            match_products(products, choices, workers=workers, memory=memory)
+            lookup = time.perf_counter() - start
+
+            timings.append((size, n_choices, scoring, lookup))
+
+    return pd.DataFrame(
+        timings, columns=["Products", "Choices", "Scoring_s", "Memory_lookup_s"]
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=benchmark.__doc__)
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=[500, 1000, 2000, 5000, 10000]
+    )
+    parser.add_argument("--choices", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=-1)
+    args = parser.parse_args()
+
+    print(benchmark(args.sizes, args.choices, args.workers).to_string(index=False))
@@ -6,7 +6,7 @@ import pandas as pd
 from loguru import logger as log
 
 from ...ci_prep.shp_files import fuzzy_match_field_names
-from ...general import map_clear_name_using_farm_name, read_field_name_mapping
+from ...general import NameResolver, read_field_name_mapping
 from ...shp_files.shp_overview import create_shape_file_overview
 from ...util.readers.generated_reports import read_reference_acreage_report
 from ..constants import CC_REPORT, FDCIC_CROPS
@@ -193,11 +193,8 @@ def generate_reference_acreage_report(
     seed = seed[seed.Crop_type.isin([*FDCIC_CROPS])]
     seed = seed.rename(columns={"Area_applied": "Planted_acres"})
     if not field_mapping.empty and not seed.empty:
-        seed.Field_name = seed.apply(
-            lambda x: map_clear_name_using_farm_name(
-                field_mapping, x.Field_name, x.Farm_name
-            ),
-            axis=1,
+        seed.Field_name = NameResolver(field_mapping).clear_names(
+            seed.Field_name, seed.Farm_name
         )
 
     harvest = get_harvested_area(path_to_data, grower, growing_cycle, data_aggregator)
@@ -226,11 +223,8 @@ def generate_reference_acreage_report(
         )
 
     if not field_mapping.empty and not shp_overview.empty:
-        shp_overview.Field_name = shp_overview.apply(
-            lambda x: map_clear_name_using_farm_name(
-                field_mapping, x.Field_name, x.Farm_name
-            ),
-            axis=1,
+        shp_overview.Field_name = NameResolver(field_mapping).clear_names(
+            shp_overview.Field_name, shp_overview.Farm_name
         )
 
     # combine available field names with planted acres data
@@ -252,12 +246,10 @@ def generate_reference_acreage_report(
     #
     # The shp_file name is used to map the reference acreage
     # from the shp_file_overview into the reference_acreage_report.
-    reference_acres = fuzzy_match_field_names(
-        reference_acres,
-        reference_acres["Field_name"],
-        shp_overview["Field_name"],
-        ratio=60,
-    )
+    # Candidates are narrowed to shp-files whose acreage agrees with
+    # the planted or harvested acres before comparing names, fields
+    # without a good match there are compared to all shp-files.
+    reference_acres = fuzzy_match_field_names(reference_acres, shp_overview, ratio=60)
 
     # Reorder columns
     columns = reference_acres.columns.tolist()
@@ -1,3 +1,4 @@
+from data_aggregators.files import LISTING_INDEX, RAW_DATA_CACHE, prefetch_listing
 from loguru import logger as log
 
 from ..config import settings
@@ -35,6 +36,8 @@ from ..data_prep.manure.manure import create_manure_report
 from ..data_prep.reference_acreage.reference_acreage import (
     create_reference_acreage_report,
 )
+from ..util.readers.general import BUCKET_NAME
+from ..util.reference_data import REFERENCE_DATA
 
 # warnings.simplefilter("ignore")
 
@@ -79,6 +82,14 @@ def run_test():
 
 @log.catch
 def run():
+    # List all growers' raw data once; the readers' folder listings are then
+    # answered from memory for the rest of the run.
+    LISTING_INDEX.clear()
+    try:
+        prefetch_listing(BUCKET_NAME, settings.bucket_folders.raw_data)
+    except Exception as e:
+        log.exception(str(e))
+
     for grower in grower_da_mapping:
         log.info(f"Grower: {grower}")
         for data_aggregator in grower_da_mapping[grower]:
@@ -330,3 +341,7 @@ def run():
             log.exception(str(e))
 
         log.info("--------------" * 8)
+
+    if RAW_DATA_CACHE is not None:
+        log.info(RAW_DATA_CACHE.summary())
+    log.info(REFERENCE_DATA.summary())
@@ -1,5 +1,6 @@
 import os
 import pathlib
+from concurrent.futures import ProcessPoolExecutor
 
 import pandas as pd
 from loguru import logger as log
@@ -7,16 +8,32 @@ from loguru import logger as log
 from ..config import settings
 from ..data_prep.grower_data_agg_mapping import grower_da_mapping
 from ..shp_files import shp_overview
+from ..shp_files.state_county_extractor import load_county_reference_data
 
 path_to_data = settings.data_prep.source_path
 path_to_dest = settings.data_prep.dest_path
 
+# field folders are processed in parallel by this many worker processes
+MAX_SHP_WORKERS = os.cpu_count() or 1
+
 # grouped by grower, feed each data aggregator into function lists
 
 
-def run():
-    for grower in grower_da_mapping:
-        shp_overview.create_shape_file_overview(path_to_data, path_to_dest, grower)
+def run(max_workers=MAX_SHP_WORKERS):
+    if max_workers <= 1:
+        for grower in grower_da_mapping:
+            shp_overview.create_shape_file_overview(path_to_data, path_to_dest, grower)
+        return
+
+    # load county geometries once, forked workers share them read-only
+    load_county_reference_data()
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=load_county_reference_data
+    ) as executor:
+        for grower in grower_da_mapping:
+            shp_overview.create_shape_file_overview(
+                path_to_data, path_to_dest, grower, executor=executor
+            )
 
 
 def create_shapefile_overview_combined(
@@ -349,6 +349,70 @@ def map_fert_type(product_mapping, name):
     return clear_name
 
 
+class NameResolver:
+    """Column-wise counterpart of `map_clear_name`, `map_clear_name_using_farm_name`
+    and `map_fert_type`.
+
+    The mapping (field name mapping or product mapping) is compiled once into
+    lookup tables keyed by `name`, (`farm_name`, `name`) and `clear_name`, keeping
+    only the first record per key. Whole columns are then resolved with a single
+    left merge instead of filtering the mapping once per row.
+    """
+
+    def __init__(self, mapping: pd.DataFrame):
+        self.by_name = self._first_per_key(mapping, ["name"], "clear_name")
+        self.by_farm_and_name = self._first_per_key(
+            mapping, ["farm_name", "name"], "clear_name"
+        )
+        self.by_clear_name = self._first_per_key(mapping, ["clear_name"], "type")
+
+    @staticmethod
+    def _first_per_key(mapping: pd.DataFrame, keys: list, value: str) -> pd.DataFrame:
+        if any(c not in mapping.columns for c in keys + [value]):
+            return pd.DataFrame(columns=keys + ["_value"])
+
+        table = mapping[keys + [value]].rename(columns={value: "_value"})
+        # keys are matched against stripped strings, other keys never match
+        table = table[table[keys].map(lambda k: isinstance(k, str)).all(axis=1)]
+        return table.drop_duplicates(subset=keys, keep="first")
+
+    @staticmethod
+    def _strip(values: pd.Series) -> pd.Series:
+        return values.map(lambda v: v.strip() if isinstance(v, str) else None)
+
+    @staticmethod
+    def _lookup(table: pd.DataFrame, query: pd.DataFrame) -> pd.Series:
+        matched = query.merge(table, on=list(query.columns), how="left")
+        return pd.Series(matched["_value"].to_numpy(), index=query.index, dtype=object)
+
+    def clear_names(
+        self, names: pd.Series, farm_names: pd.Series | None = None
+    ) -> pd.Series:
+        """Maps `names` to their clear names. Rows with a farm name are matched on
+        farm and name, rows without one on the name only. Names without a
+        (valid) clear name are kept as they are."""
+        keys = self._strip(names)
+        clear = self._lookup(self.by_name, pd.DataFrame({"name": keys}))
+
+        if farm_names is not None:
+            farm_keys = self._strip(farm_names)
+            has_farm = farm_keys.notna() & keys.notna()
+            clear[has_farm] = self._lookup(
+                self.by_farm_and_name,
+                pd.DataFrame({"farm_name": farm_keys, "name": keys})[has_farm],
+            )
+
+        is_clear = clear.map(lambda c: isinstance(c, str))
+        return names.where(~is_clear, clear)
+
+    def fert_types(self, names: pd.Series) -> pd.Series:
+        """Maps product clear `names` to their fertilizer type, `OTHER` if unknown."""
+        keys = self._strip(names)
+        types = self._lookup(self.by_clear_name, pd.DataFrame({"clear_name": keys}))
+        is_type = types.map(lambda t: isinstance(t, str))
+        return types.where(is_type, "OTHER")
+
+
 def convert_to_float(num):
     temp = num
     if isinstance(num, str):
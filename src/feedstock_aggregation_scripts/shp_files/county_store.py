@@ -0,0 +1,128 @@
+"""Local binary store of the US county boundaries used for the state / county
+extraction.
+
+The counties GeoJSON (~20 MB, see `COUNTIES_GEOJSON`) is parsed once and written as
+an uncompressed Arrow IPC file in the `county_store` cache directory of the
+settings: one row per county with its `id`, the GeoJSON properties as columns and
+the geometry as WKB. Reading memory maps the file, so the store is opened without
+JSON parsing and worker processes share the same pages.
+
+Nothing is downloaded at run time: a missing store is built from the local GeoJSON
+configured as `county_store.geojson`. (Re)build the store from a local GeoJSON with
+
+    python -m src.feedstock_aggregation_scripts.shp_files.county_store [geojson]
+"""
+import argparse
+import json
+import os
+import pathlib
+
+import numpy as np
+import pyarrow as pa
+import shapely
+from loguru import logger as log
+from shapely.geometry.base import BaseGeometry
+
+from ..config import settings
+from .geometry import get_polygon_from_shp_features
+
+# geojson file containing all states and counties in USA, download it to build the
+# county store
+COUNTIES_GEOJSON = "https://raw.githubusercontent.com/plotly/datasets/master/geojson-counties-fips.json"
+COUNTY_STORE = pathlib.Path(settings.county_store.path).joinpath("counties.arrow")
+
+
+def build_county_store(
+    source: str | pathlib.Path, path_to_store: str | pathlib.Path = COUNTY_STORE
+) -> pathlib.Path:
+    """Parses the local counties GeoJSON at `source` and writes it to
+    `path_to_store`."""
+    with open(source) as f:
+        counties = json.load(f)
+
+    ids, properties, polygons = [], [], []
+    for feature in counties["features"]:
+        p_county = get_polygon_from_shp_features(feature)
+        if not isinstance(p_county, BaseGeometry):
+            log.warning(f"skipping county without valid geometry: {feature.get('id')}")
+            continue
+        ids.append(feature.get("id"))
+        properties.append(feature.get("properties") or {})
+        polygons.append(p_county)
+
+    columns = {"id": ids}
+    for key in dict.fromkeys(k for p in properties for k in p):
+        columns[key] = [p.get(key) for p in properties]
+    columns["geometry"] = pa.array(
+        shapely.to_wkb(np.array(polygons, dtype=object)), type=pa.binary()
+    )
+    table = pa.table(columns)
+
+    path_to_store = pathlib.Path(path_to_store)
+    path_to_store.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path_to_store.with_suffix(".part")
+    with pa.OSFile(str(tmp), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp, path_to_store)
+
+    log.info(f"saved {table.num_rows} counties to {path_to_store}")
+    return path_to_store
+
+
+def ensure_county_store(
+    path_to_store: pathlib.Path = COUNTY_STORE,
+    source: str | pathlib.Path | None = None,
+) -> pathlib.Path:
+    """Returns the path to the county store, building it first from the local
+    GeoJSON `source` (default: `county_store.geojson` of the settings) if it does
+    not exist yet."""
+    if path_to_store.exists():
+        return path_to_store
+
+    source = source or settings.county_store.geojson
+    if source is None:
+        raise FileNotFoundError(
+            f"no county store at {path_to_store} and no counties GeoJSON configured: "
+            f"download {COUNTIES_GEOJSON} and set `county_store.geojson` to it, or "
+            "build the store with `python -m "
+            "src.feedstock_aggregation_scripts.shp_files.county_store <geojson>`"
+        )
+
+    log.info(f"no county store at {path_to_store}, building it from {source}")
+    return build_county_store(source, path_to_store)
+
+
+def read_county_store(
+    path_to_store: pathlib.Path = COUNTY_STORE,
+) -> tuple[np.ndarray, list]:
+    """Returns the county polygons and their GeoJSON like features (`id` and
+    `properties`, no coordinates)."""
+    with pa.memory_map(str(path_to_store)) as source:
+        table = pa.ipc.open_file(source).read_all()
+
+    polygons = shapely.from_wkb(table.column("geometry").to_numpy(zero_copy_only=False))
+    ids = table.column("id").to_pylist()
+    records = table.drop_columns(["id", "geometry"]).to_pylist()
+
+    features = [
+        {
+            "type": "Feature",
+            "id": county_id,
+            # keys absent in the GeoJSON are stored as null
+            "properties": {k: v for k, v in record.items() if v is not None},
+        }
+        for county_id, record in zip(ids, records)
+    ]
+    return polygons, features
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=build_county_store.__doc__)
+    parser.add_argument("source", nargs="?", default=settings.county_store.geojson)
+    parser.add_argument("--dest", default=COUNTY_STORE)
+    args = parser.parse_args()
+    if args.source is None:
+        parser.error(f"no GeoJSON given or configured, download {COUNTIES_GEOJSON}")
+
+    build_county_store(args.source, args.dest)
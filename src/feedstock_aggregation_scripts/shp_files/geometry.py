@@ -1,14 +1,26 @@
+from dataclasses import dataclass
+
 import numpy as np
+import shapely
 from loguru import logger as log
 from pyproj import Geod
-from shapely import wkt
 from shapely.geometry import MultiPolygon, Polygon
+from shapely.geometry.base import BaseGeometry
 
 from ..data_prep.constants import NOT_FOUND
 from .constants import SQUARE_METER_TO_ACRE
 
 # NOT_FOUND = False
 
+# specify a named ellipsoid
+#
+# WGS84 is defined and maintained by the United States National
+# Geospatial-Intelligence Agency (NGA). It is consistent, to about
+# 1cm, with the International Terrestrial Reference Frame (ITRF).
+#
+# see: https://www.linz.govt.nz/guidance/geodetic-system/coordinate-systems-used-new-zealand/geodetic-datums/world-geodetic-system-1984-wgs84#:~:text=The%20World%20Geodetic%20System%201984,Terrestrial%20Reference%20Frame%20(ITRF).
+GEOD = Geod(ellps="WGS84")
+
 
 def get_polygon_from_shp_features(shp_features):
     geometry = shp_features.get("geometry", NOT_FOUND)
@@ -48,22 +60,10 @@ def get_polygon_from_shp_features(shp_features):
 
 
 def get_acreage_from_polygon(shp_poly):
-    # specify a named ellipsoid
-    #
-    # WGS84 is defined and maintained by the United States National
-    # Geospatial-Intelligence Agency (NGA). It is consistent, to about
-    # 1cm, with the International Terrestrial Reference Frame (ITRF).
-    #
-    # see: https://www.linz.govt.nz/guidance/geodetic-system/coordinate-systems-used-new-zealand/geodetic-datums/world-geodetic-system-1984-wgs84#:~:text=The%20World%20Geodetic%20System%201984,Terrestrial%20Reference%20Frame%20(ITRF).
-
-    geod = Geod(ellps="WGS84")
-
-    # wkt.loads reads in string representations of the (Multi)Polygon
-    poly = wkt.loads(str(shp_poly))
     # the area will be the first argument in the list and calculated in
     # square meters and may be negative due to its calculation.
     # Converted to acres
-    area = abs(geod.geometry_area_perimeter(poly)[0]) * SQUARE_METER_TO_ACRE
+    area = abs(GEOD.geometry_area_perimeter(shp_poly)[0]) * SQUARE_METER_TO_ACRE
 
     return area
 
@@ -84,6 +84,44 @@ def get_centroid(shp_features):
     return centroid
 
 
+@dataclass
+class ShapeGeometries:
+    """Geometry values of a batch of shape file features, one entry per feature.
+    Features without a valid geometry have `NaN` values."""
+
+    polygons: np.ndarray
+    acreage: np.ndarray
+    centroid_lat: np.ndarray
+    centroid_long: np.ndarray
+    # minx, miny, maxx, maxy
+    bounds: np.ndarray
+
+
+def get_shape_geometries(shp_features_list) -> ShapeGeometries:
+    """Parses the geometry of each feature in `shp_features_list` once and computes
+    acreage, centroids and bounds for all of them."""
+    polygons = np.array(
+        [get_polygon_from_shp_features(f) for f in shp_features_list], dtype=object
+    )
+    valid = np.array([isinstance(p, BaseGeometry) for p in polygons], dtype=bool)
+    # invalid geometries are passed on as missing values
+    geometries = np.where(valid, polygons, None)
+
+    acreage = np.full(len(polygons), np.nan)
+    for i in np.flatnonzero(valid):
+        acreage[i] = get_acreage_from_polygon(geometries[i])
+
+    centroids = shapely.centroid(geometries)
+
+    return ShapeGeometries(
+        polygons=polygons,
+        acreage=acreage,
+        centroid_lat=shapely.get_y(centroids),
+        centroid_long=shapely.get_x(centroids),
+        bounds=shapely.bounds(geometries),
+    )
+
+
 # def get_shp_box(shp):
 #     bbox = shp.__geo_interface__.get("bbox", NOT_FOUND)
 #     if bbox == NOT_FOUND:
@@ -7,36 +7,46 @@ import shapefile
 from loguru import logger as log
 
 from ..data_prep.constants import NOT_FOUND
+from .county_store import ensure_county_store, read_county_store
 from .geometry import get_polygon_from_shp_features
 
 
+def list_shape_folders(path_to_data, grower) -> list[pathlib.Path]:
+    """returns the field folders at `path_to_data/grower/shp-files`"""
+    return list(pathlib.Path(path_to_data).joinpath(grower, "shp-files").glob("[!.]*"))
+
+
+def read_shapefile(folder: pathlib.Path):
+    """yields the features of the shape file in `folder`, see
+    `read_shapefiles_and_names`"""
+    # this field name serves as a reference to traceback to files
+    # and in cases, where no attributional data is present within
+    # the shp file(s).
+    field_name = folder.stem
+
+    path = next(folder.glob("*.shp"))
+    file_path = "01_data" + str(path).split("01_data")[-1]
+
+    shp = shapefile.Reader(path)
+    # extract geo features
+    shp_features = shp.__geo_interface__.get("features", NOT_FOUND)
+    if shp_features == NOT_FOUND:
+        log.warning(f'no item "features" in {shp}.')
+        return np.nan
+
+    # return all feature combinations present in the shape file
+    for feature in shp_features:
+        yield feature, field_name, file_path
+
+
 def read_shapefiles_and_names(path_to_data, grower):
     """yields 3 values:
     - the shp file (read-in)
     - the field name derived from the file name --> may need adjustment when file name is only "boundary"
     - the file path as reference for the shp file's origin
     """
-    for folder in (
-        pathlib.Path(path_to_data).joinpath(grower, "shp-files").glob("[!.]*")
-    ):
-        # this field name serves as a reference to traceback to files
-        # and in cases, where no attributional data is present within
-        # the shp file(s).
-        field_name = folder.stem
-
-        path = next(folder.glob("*.shp"))
-        file_path = "01_data" + str(path).split("01_data")[-1]
-
-        shp = shapefile.Reader(path)
-        # extract geo features
-        shp_features = shp.__geo_interface__.get("features", NOT_FOUND)
-        if shp_features == NOT_FOUND:
-            log.warning(f'no item "features" in {shp}.')
-            return np.nan
-
-        # return all feature combinations present in the shape file
-        for feature in shp_features:
-            yield feature, field_name, file_path
+    for folder in list_shape_folders(path_to_data, grower):
+        yield from read_shapefile(folder)
 
 
 def sort_unsorted_shp_files(path_to_data, grower):
@@ -58,7 +68,14 @@ def sort_unsorted_shp_files(path_to_data, grower):
         shutil.move(file, path_to_dest.joinpath(file.stem, file.name))
 
 
-def get_county_polygon_and_features(counties: dict):
+def get_county_polygon_and_features(counties: dict | None = None):
+    """yields polygon and features of each county in `counties` (GeoJSON). Without
+    `counties`, both are read from the local county store."""
+    if counties is None:
+        polygons, features = read_county_store(ensure_county_store())
+        yield from zip(polygons, features)
+        return
+
     for county_features in counties["features"]:
         poly = get_polygon_from_shp_features(county_features)
         yield poly, county_features
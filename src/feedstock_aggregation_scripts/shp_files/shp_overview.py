@@ -1,6 +1,9 @@
 import os
 import pathlib
 import shutil
+import time
+from concurrent.futures import Executor
+from functools import partial
 
 import pandas as pd
 from loguru import logger as log
@@ -8,9 +11,9 @@ from loguru import logger as log
 from ..data_prep.complete import add_new_fields_to_mapping
 from ..data_prep.constants import NOT_FOUND
 from .constants import ACREAGE_COLS, FARM_NAME_COLS, FIELD_NAME_COLS, GROWER_NAME_COLS
-from .geometry import get_acreage_from_shp_features, get_centroid
+from .geometry import get_shape_geometries
 from .helpers import get_property_attribute, init_info_extract, mark_majority_county
-from .readers import read_shapefiles_and_names
+from .readers import list_shape_folders, read_shapefile, read_shapefiles_and_names
 from .state_county_extractor import extract_state_county_info
 
 
@@ -61,15 +64,22 @@ def list_all_shp_file_properties_by_file(path_to_data, grower):
     return df.reset_index(drop=True)
 
 
-def extract_info_from_shape_files(path_to_data, grower) -> pd.DataFrame:
+def extract_info_from_shape_folder(
+    folder: pathlib.Path, grower: str
+) -> tuple[pd.DataFrame, pd.DataFrame, float]:
+    """Extracts attributional and state / county data of the shape file in the
+    field `folder`. Returns both tables and the processing time in seconds."""
+    start = time.perf_counter()
     d = init_info_extract()
 
     # Store all available state county data
     state_county = pd.DataFrame()
 
-    for shp_features, field_name, file_path in read_shapefiles_and_names(
-        path_to_data, grower
-    ):
+    shapes = list(read_shapefile(folder))
+    # parse every geometry once, acreage / centroids are computed for all at once
+    geometries = get_shape_geometries([shp_features for shp_features, _, _ in shapes])
+
+    for i, (shp_features, field_name, file_path) in enumerate(shapes):
         d["File_path"].append(file_path)
         d["Grower"].append(grower)
         d["Field_name_folder"].append(field_name)
@@ -86,14 +96,16 @@ def extract_info_from_shape_files(path_to_data, grower) -> pd.DataFrame:
             "Geo_coord"
         ].append(None)
 
-        acres = get_acreage_from_shp_features(shp_features)
-        d["Acreage_calc"].append(acres)
+        d["Acreage_calc"].append(geometries.acreage[i])
+        d["Centroid_lat"].append(geometries.centroid_lat[i])
+        d["Centroid_long"].append(geometries.centroid_long[i])
 
-        centroid = get_centroid(shp_features)
-        d["Centroid_lat"].append(centroid[1])
-        d["Centroid_long"].append(centroid[0])
-
-        state_county_info = extract_state_county_info(shp_features, field_name)
+        state_county_info = extract_state_county_info(
+            shp_features,
+            field_name,
+            shp_geometry=geometries.polygons[i],
+            shp_acres=geometries.acreage[i],
+        )
         state_county = pd.concat([state_county, state_county_info])
 
         props = shp_features.get("properties", NOT_FOUND)
@@ -134,7 +146,41 @@ def extract_info_from_shape_files(path_to_data, grower) -> pd.DataFrame:
         for item, prop in zip(props_fields, props_list, strict=False):
             d[item].append(prop) if props != NOT_FOUND else d[item].append(None)
 
-    attrib_data = pd.DataFrame(d)
+    return pd.DataFrame(d), state_county, time.perf_counter() - start
+
+
+def log_folder_timings(grower, folders, seconds, top=5):
+    """logs the total processing time and the slowest field folders of `grower`"""
+    timings = pd.Series(seconds, index=[folder.stem for folder in folders])
+    slowest = timings.sort_values(ascending=False).head(top)
+    log.info(
+        f"shp-file overview for grower {grower}: {len(timings)} field folders in "
+        f"{timings.sum():.1f}s, slowest: "
+        + ", ".join(f"{name} ({s:.1f}s)" for name, s in slowest.items())
+    )
+
+
+def extract_info_from_shape_files(
+    path_to_data, grower, executor: Executor | None = None
+) -> pd.DataFrame:
+    """Extracts the shape file overview of `grower`. With an `executor` (e.g. a
+    `ProcessPoolExecutor`) the field folders are processed in parallel, results
+    are merged in folder order."""
+    folders = list_shape_folders(path_to_data, grower)
+    extract = partial(extract_info_from_shape_folder, grower=grower)
+
+    if executor is None:
+        results = [extract(folder) for folder in folders]
+    else:
+        results = list(executor.map(extract, folders))
+
+    log_folder_timings(grower, folders, [seconds for _, _, seconds in results])
+
+    if results:
+        attrib_data = pd.concat([d for d, _, _ in results], ignore_index=True)
+        state_county = pd.concat([sc for _, sc, _ in results])
+    else:
+        attrib_data, state_county = pd.DataFrame(init_info_extract()), pd.DataFrame()
     temp = pd.merge(attrib_data, state_county, on="Field_name_folder")
 
     # add majority county mark
@@ -143,7 +189,9 @@ def extract_info_from_shape_files(path_to_data, grower) -> pd.DataFrame:
     return temp
 
 
-def create_shape_file_overview(path_to_data, path_to_dest, grower):
+def create_shape_file_overview(
+    path_to_data, path_to_dest, grower, executor: Executor | None = None
+):
     # check whether unsorted files are present
     if os.path.exists(pathlib.Path(path_to_data).joinpath(grower, "shp-unsorted")):
         sort_unsorted_shp_files(path_to_data, grower)
@@ -154,7 +202,7 @@ def create_shape_file_overview(path_to_data, path_to_dest, grower):
         return pd.DataFrame()
 
     log.info(f"extracting shp-file overview for grower {grower}...")
-    overview = extract_info_from_shape_files(path_to_data, grower)
+    overview = extract_info_from_shape_files(path_to_data, grower, executor)
 
     # Add any field mapping values detected here
     fields = overview[["Farm_name", "Field_name", "Acreage_calc"]].copy()
@@ -1,37 +1,75 @@
-import json
-from urllib.request import urlopen
-
+import numpy as np
 import pandas as pd
+import shapely
 from loguru import logger as log
+from shapely import STRtree
 from shapely.geometry import Polygon, box
+from shapely.geometry.base import BaseGeometry
 
+from ..util.reference_data import REFERENCE_DATA
+from .county_store import ensure_county_store, read_county_store
 from .geometry import (
     get_acreage_from_polygon,
-    get_acreage_from_shp_features,
     get_polygon_from_shp_features,
 )
-from .helpers import get_state_code_dict, init_state_county_extraction_vals
-from .readers import get_county_polygon_and_features
+from .helpers import (
+    CURRENT_DIR,
+    get_state_code_dict,
+    init_state_county_extraction_vals,
+)
 
 NOT_FOUND = False
 
-# read in geojson file containing all states and counties in USA
-with urlopen(
-    "https://raw.githubusercontent.com/plotly/datasets/master/geojson-counties-fips.json"
-) as response:
-    counties = json.load(response)
 
-# read in state codes from file
-state_codes = get_state_code_dict()
+class CountyIndex:
+    """County polygons, prepared and bulk loaded into an `STRtree` for bounding box
+    queries."""
+
+    def __init__(self, polygons: np.ndarray, features: list):
+        self.polygons = polygons
+        self.features = features
+        shapely.prepare(self.polygons)
+        self.tree = STRtree(self.polygons)
+
+    def candidates(self, geometry: BaseGeometry):
+        """Yields polygon and features of all counties whose bounding box intersects
+        the one of `geometry`, in the order of the county store."""
+        for i in np.sort(self.tree.query(geometry)):
+            yield self.polygons[i], self.features[i]
+
+
+REFERENCE_DATA.register(
+    "county_index",
+    lambda path: CountyIndex(*read_county_store(path)),
+    lambda: (ensure_county_store(),),
+)
+# state codes are read from file
+REFERENCE_DATA.register(
+    "state_codes",
+    lambda _: get_state_code_dict(),
+    lambda: (CURRENT_DIR.joinpath("usa-state-codes.csv"),),
+)
+
+
+def load_county_reference_data():
+    """Loads county index and state codes into this process. Used to warm up the
+    parent before forking worker processes (which then share the data) or as
+    initializer of each worker."""
+    REFERENCE_DATA.get("county_index")
+    REFERENCE_DATA.get("state_codes")
 
 
-def extract_state_county_info(shp_features, field_name):
+def extract_state_county_info(
+    shp_features, field_name, shp_geometry=None, shp_acres=None
+):
     """returns a dictionary that contains the FIPS code, State, and County
     information for `shp`. Any information not present within `shp`
     properties, will result in a `None` entry for that field.
 
     @params:
     shp_features - GeoJSON features of a read-in shape file
+    shp_geometry, shp_acres - (Multi-)Polygon and acreage of `shp_features`, if
+        already computed (see `get_shape_geometries`)
     """
 
     # Extract shape file geometry as (Multi-)Polygon. This
@@ -40,7 +78,8 @@ def extract_state_county_info(shp_features, field_name):
     # shape files.
     # This issue needs to be investigated further to understand
     # what causes this behaviour.
-    shp_geometry = get_polygon_from_shp_features(shp_features)
+    if shp_geometry is None:
+        shp_geometry = get_polygon_from_shp_features(shp_features)
 
     # The shape box is used in cases where the intersection fails
     # on the shape geometry.
@@ -48,11 +87,16 @@ def extract_state_county_info(shp_features, field_name):
 
     # The shape's acres are used to calculate the intersection %
     # between the shape geometry and the County geometry.
-    shp_acres = get_acreage_from_shp_features(shp_features)
+    if shp_acres is None:
+        shp_acres = get_acreage_from_polygon(shp_geometry)
 
     values = init_state_county_extraction_vals()
+    county_index = REFERENCE_DATA.get("county_index")
+    state_codes = REFERENCE_DATA.get("state_codes")
 
-    for p_county, feature in get_county_polygon_and_features(counties):
+    # only counties with overlapping bounding boxes can intersect the shape (or
+    # its box), so the exact checks are limited to those few candidates
+    for p_county, feature in county_index.candidates(shp_box):
         try:
             intersects = p_county.intersects(shp_geometry)
             intersection_poly = p_county.intersection(shp_geometry)
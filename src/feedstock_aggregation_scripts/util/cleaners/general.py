@@ -56,13 +56,13 @@ from ...data_prep.constants import (
 from ...general import unify_cols
 from ..readers.general import read_file_by_file_type
 from .helpers import (
-    PLANTING_UNITS_RAW,
     add_missing_columns,
     clean_Granular_crop_type_in_harvest,
-    clean_units,
-    convert_quantity_by_unit,
+    convert_quantities,
     filter_Granular_apps,
     generate_Granular_sub_crop_type_in_harvest,
+    normalize_units,
+    planting_units_raw,
     seeding_planting_params,
 )
 
@@ -212,16 +212,11 @@ def filter_LDB_apps(apps, path_to_data, grower, growing_cycle, verbose=True):
     temp = apps
 
     product_mapping = gen.read_product_mapping_file(path_to_data)
-    temp.Product = temp.apply(
-        lambda x: gen.map_clear_name(product_mapping, x.Product), axis=1
-    )
+    temp.Product = gen.NameResolver(product_mapping).clear_names(temp.Product)
 
     field_mapping = gen.read_field_name_mapping(path_to_data, grower)
-    temp.Field_name = temp.apply(
-        lambda x: gen.map_clear_name_using_farm_name(
-            field_mapping, x.Field_name, x.Farm_name
-        ),
-        axis=1,
+    temp.Field_name = gen.NameResolver(field_mapping).clear_names(
+        temp.Field_name, temp.Farm_name
     )
 
     for file_type in LDB_GENERATED:
@@ -273,7 +268,7 @@ def clean_JDOps_file(df, file_type):
         temp["Total_dry_yield_check"] = temp.Yield * temp.Area_applied
 
         # convert units to backend accepted units
-        temp.Applied_unit = temp.Applied_unit.apply(clean_units)
+        temp.Applied_unit = normalize_units(temp.Applied_unit)
 
         temp = temp.dropna(
             subset=["Area_applied", "Total_dry_yield"]
@@ -291,7 +286,7 @@ def clean_JDOps_file(df, file_type):
         temp.Area_applied = temp.Area_applied.apply(gen.clean_numeric_col)
 
         # convert units to backend accepted units
-        temp.Applied_unit = temp.Applied_unit.apply(clean_units)
+        temp.Applied_unit = normalize_units(temp.Applied_unit)
 
         temp["Operation_type"] = "Tillage"
 
@@ -313,19 +308,8 @@ def clean_JDOps_file(df, file_type):
         temp.Area_applied = temp.Area_applied.apply(gen.clean_numeric_col)
 
         # convert seed related units to BAG Or AC (required for planting file to feed into seeded area)
-        cleaned_apps_params = temp.apply(
-            lambda x: convert_quantity_by_unit(
-                x.Applied_total,
-                x.Applied_unit,
-                params_to_convert=seeding_planting_params,
-            ),
-            axis=1,
-            result_type="expand",
-        )
-        # index 0 refers to quantity / index 2 refers to unit
-        temp.Applied_total, temp.Applied_unit = (
-            cleaned_apps_params[0],
-            cleaned_apps_params[1],
+        temp.Applied_total, temp.Applied_unit = convert_quantities(
+            temp.Applied_total, temp.Applied_unit, restrict_to=seeding_planting_params()
         )
 
         temp["Operation_type"] = "Planting"
@@ -346,7 +330,7 @@ def clean_JDOps_file(df, file_type):
         temp.Area_applied = temp.Area_applied.apply(gen.clean_numeric_col)
 
         # convert units to backend accepted units
-        temp.Applied_unit = temp.Applied_unit.apply(clean_units)
+        temp.Applied_unit = normalize_units(temp.Applied_unit)
 
         temp["Operation_type"] = "Application"
         temp = add_missing_columns(temp, APPLICATION_COLUMNS)
@@ -359,14 +343,9 @@ def clean_JDOps_file(df, file_type):
         temp = temp.drop(columns=["Product", "Applied_total", "Applied_unit"])
 
         # convert fuel to gallons
-        cleaned_fuel_params = temp.apply(
-            lambda x: convert_quantity_by_unit(x.Total_fuel, x.Fuel_unit),
-            axis=1,
-            result_type="expand",
+        temp.Total_fuel, temp.Fuel_unit = convert_quantities(
+            temp.Total_fuel, temp.Fuel_unit
         )
-        # index 0 refers to quantity / index 2 refers to unit
-        temp.Total_fuel, temp.Fuel_unit = cleaned_fuel_params[0], cleaned_fuel_params[1]
-
         temp = add_missing_columns(temp, FUEL_COLUMNS)
         temp = temp[FUEL_COLUMNS]
 
@@ -395,7 +374,7 @@ def clean_Granular_file(df, file_type):
         temp["Operation_type"] = "Harvest"
 
         # convert units to backend accepted units
-        temp.Applied_unit = temp.Applied_unit.apply(clean_units)
+        temp.Applied_unit = normalize_units(temp.Applied_unit)
 
         temp = add_missing_columns(temp, HARVEST_COLUMNS)
 
@@ -426,7 +405,7 @@ def clean_Granular_file(df, file_type):
         temp.Area_applied = temp.Area_applied.apply(gen.clean_numeric_col)
 
         # convert units to backend accepted units
-        temp.Applied_unit = temp.Applied_unit.apply(clean_units)
+        temp.Applied_unit = normalize_units(temp.Applied_unit)
 
         temp.Applied_rate = temp.Applied_total / temp.Area_applied
 
@@ -440,17 +419,8 @@ def clean_Granular_file(df, file_type):
 
     if file_type == GRAN_PLANTING:
         # convert seed related units to BAG
-        cleaned_apps_params = temp.apply(
-            lambda x: convert_quantity_by_unit(
-                x.Applied_total, x.Applied_unit, params_to_convert=PLANTING_UNITS_RAW
-            ),
-            axis=1,
-            result_type="expand",
-        )
-        # index 0 refers to quantity / index 2 refers to unit
-        temp.Applied_total, temp.Applied_unit = (
-            cleaned_apps_params[0],
-            cleaned_apps_params[1],
+        temp.Applied_total, temp.Applied_unit = convert_quantities(
+            temp.Applied_total, temp.Applied_unit, restrict_to=planting_units_raw()
         )
 
         temp = add_missing_columns(temp, PLANTING_COLUMNS)
@@ -484,7 +454,7 @@ def clean_CFV_file(df, file_type):
         temp["Operation_type"] = "Harvest"
 
         # convert units to backend accepted units
-        temp.Applied_unit = temp.Applied_unit.apply(clean_units)
+        temp.Applied_unit = normalize_units(temp.Applied_unit)
 
         temp = add_missing_columns(temp, HARVEST_COLUMNS)
         temp = temp[HARVEST_COLUMNS]
@@ -498,17 +468,8 @@ def clean_CFV_file(df, file_type):
         temp["Operation_type"] = "Planting"
 
         # convert seed related units to BAG
-        cleaned_apps_params = temp.apply(
-            lambda x: convert_quantity_by_unit(
-                x.Applied_total, x.Applied_unit, params_to_convert=PLANTING_UNITS_RAW
-            ),
-            axis=1,
-            result_type="expand",
-        )
-        # index 0 refers to quantity / index 2 refers to unit
-        temp.Applied_total, temp.Applied_unit = (
-            cleaned_apps_params[0],
-            cleaned_apps_params[1],
+        temp.Applied_total, temp.Applied_unit = convert_quantities(
+            temp.Applied_total, temp.Applied_unit, restrict_to=planting_units_raw()
         )
 
         temp = add_missing_columns(temp, PLANTING_COLUMNS)
@@ -522,7 +483,7 @@ def clean_CFV_file(df, file_type):
         temp["Operation_type"] = "Application"
 
         # convert units to backend accepted units
-        temp.Applied_unit = temp.Applied_unit.apply(clean_units)
+        temp.Applied_unit = normalize_units(temp.Applied_unit)
 
         temp = add_missing_columns(temp, APPLICATION_COLUMNS)
         temp = temp[APPLICATION_COLUMNS]
@@ -599,7 +560,7 @@ def clean_PAP_file(df, file_type):
         temp.Area_applied = temp.Area_applied.apply(gen.clean_numeric_col)
 
         # convert units to backend accepted units
-        temp.Applied_unit = temp.Applied_unit.apply(clean_units)
+        temp.Applied_unit = normalize_units(temp.Applied_unit)
 
         temp.Applied_rate = temp.Applied_total / temp.Area_applied
 
@@ -641,19 +602,10 @@ def clean_LDB_file(df, file_type):
         temp.Area_applied = temp.Area_applied.apply(gen.clean_numeric_col)
 
         # convert units to backend accepted units
-        temp.Applied_unit = temp.Applied_unit.apply(clean_units)
+        temp.Applied_unit = normalize_units(temp.Applied_unit)
         # need to convert seed applications
-        cleaned_apps_params = temp.apply(
-            lambda x: convert_quantity_by_unit(
-                x.Applied_total, x.Applied_unit, params_to_convert=PLANTING_UNITS_RAW
-            ),
-            axis=1,
-            result_type="expand",
-        )
-        # index 0 refers to quantity / index 2 refers to unit
-        temp.Applied_total, temp.Applied_unit = (
-            cleaned_apps_params[0],
-            cleaned_apps_params[1],
+        temp.Applied_total, temp.Applied_unit = convert_quantities(
+            temp.Applied_total, temp.Applied_unit, restrict_to=planting_units_raw()
         )
 
         temp.Applied_rate = temp.Applied_total / temp.Area_applied
@@ -666,17 +618,8 @@ def clean_LDB_file(df, file_type):
 
     if file_type == LDB_PLANTING:
         # convert seed related units to BAG
-        cleaned_apps_params = temp.apply(
-            lambda x: convert_quantity_by_unit(
-                x.Applied_total, x.Applied_unit, params_to_convert=PLANTING_UNITS_RAW
-            ),
-            axis=1,
-            result_type="expand",
-        )
-        # index 0 refers to quantity / index 2 refers to unit
-        temp.Applied_total, temp.Applied_unit = (
-            cleaned_apps_params[0],
-            cleaned_apps_params[1],
+        temp.Applied_total, temp.Applied_unit = convert_quantities(
+            temp.Applied_total, temp.Applied_unit, restrict_to=planting_units_raw()
         )
 
         temp = add_missing_columns(temp, PLANTING_COLUMNS)
@@ -705,7 +648,7 @@ def clean_FM_file(df, file_type):
         temp["Operation_type"] = "Harvest"
 
         # convert units to backend accepted units
-        temp.Applied_unit = temp.Applied_unit.apply(clean_units)
+        temp.Applied_unit = normalize_units(temp.Applied_unit)
 
         temp = add_missing_columns(temp, HARVEST_COLUMNS)
         temp = temp[HARVEST_COLUMNS]
@@ -718,7 +661,7 @@ def clean_FM_file(df, file_type):
         temp["Applied_unit"] = "in"
 
         # convert units to backend accepted units
-        temp.Applied_unit = temp.Applied_unit.apply(clean_units)
+        temp.Applied_unit = normalize_units(temp.Applied_unit)
 
         temp = add_missing_columns(temp, TILLAGE_COLUMNS)
         temp = temp[TILLAGE_COLUMNS]
@@ -733,7 +676,7 @@ def clean_FM_file(df, file_type):
         temp["Operation_type"] = "Application"
 
         # convert units to backend accepted units
-        temp.Applied_unit = temp.Applied_unit.apply(clean_units)
+        temp.Applied_unit = normalize_units(temp.Applied_unit)
 
         temp = add_missing_columns(temp, APPLICATION_COLUMNS)
         temp = temp[APPLICATION_COLUMNS]
@@ -764,7 +707,7 @@ def clean_SMS_file(df, file_type):
         temp["Operation_type"] = "Harvest"
 
         # convert units to backend accepted units
-        temp.Applied_unit = temp.Applied_unit.apply(clean_units)
+        temp.Applied_unit = normalize_units(temp.Applied_unit)
 
         temp = add_missing_columns(temp, HARVEST_COLUMNS)
         temp = temp[HARVEST_COLUMNS]
@@ -777,17 +720,8 @@ def clean_SMS_file(df, file_type):
         temp["Operation_type"] = "Planting"
 
         # convert seed related units to BAG
-        cleaned_apps_params = temp.apply(
-            lambda x: convert_quantity_by_unit(
-                x.Applied_total, x.Applied_unit, params_to_convert=PLANTING_UNITS_RAW
-            ),
-            axis=1,
-            result_type="expand",
-        )
-        # index 0 refers to quantity / index 2 refers to unit
-        temp.Applied_total, temp.Applied_unit = (
-            cleaned_apps_params[0],
-            cleaned_apps_params[1],
+        temp.Applied_total, temp.Applied_unit = convert_quantities(
+            temp.Applied_total, temp.Applied_unit, restrict_to=planting_units_raw()
         )
 
         temp = add_missing_columns(temp, PLANTING_COLUMNS)
@@ -798,7 +732,7 @@ def clean_SMS_file(df, file_type):
         temp["Operation_type"] = "Application"
 
         # convert units to backend accepted units
-        temp.Applied_unit = temp.Applied_unit.apply(clean_units)
+        temp.Applied_unit = normalize_units(temp.Applied_unit)
 
         temp = add_missing_columns(temp, APPLICATION_COLUMNS)
         temp = temp[APPLICATION_COLUMNS]
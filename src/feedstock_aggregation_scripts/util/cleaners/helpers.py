@@ -1,27 +1,26 @@
-import pathlib
-
 import numpy as np
 import pandas as pd
 from loguru import logger as log
 
-from ...config import settings
 from ...data_prep.constants import DA_GRANULAR, GRAN_PLANTING
 from ..readers.general import read_file_by_file_type
+from ..reference_data import REFERENCE_DATA
+from ..units import unit_engine
+
+
+def planting_units_raw():
+    """All planting related observed units."""
+    qu_converter = REFERENCE_DATA.get("unit_conversions")
+    return qu_converter[qu_converter.target_unit == "BAG"].unit.unique()
 
-# Define globals
-qu_converter = pd.read_csv(
-    pathlib.Path(settings.data_prep.source_path).joinpath("unit_conversions.csv")
-)
 
-qm_converter = pd.read_csv(
-    pathlib.Path(settings.data_prep.source_path).joinpath("unit_mapping_table.csv")
-)
+def seeding_units_raw():
+    qm_converter = REFERENCE_DATA.get("unit_mapping_table")
+    return qm_converter[qm_converter.clear_unit == "AC"].unit.unique()
 
-# extract all planting related observed units
-PLANTING_UNITS_RAW = qu_converter[qu_converter.target_unit == "BAG"].unit.unique()
-SEEDING_UNITS_RAW = qm_converter[qm_converter.clear_unit == "AC"].unit.unique()
 
-seeding_planting_params = np.concatenate((PLANTING_UNITS_RAW, SEEDING_UNITS_RAW))
+def seeding_planting_params():
+    return np.concatenate((planting_units_raw(), seeding_units_raw()))
 
 
 def generate_Granular_sub_crop_type_in_harvest(crop_type):
@@ -70,53 +69,25 @@ def filter_Granular_apps(apps, path_to_data, grower, growing_cycle):
 
 
 # %%
-def clean_units(unit, verbose=False):
-    if not isinstance(unit, str):
-        return unit
+def normalize_units(units: pd.Series, verbose=False) -> pd.Series:
+    return unit_engine().normalize_units(units, verbose=verbose)
+
 
-    if unit == "---" or unit == "--":
-        return np.nan
+def convert_quantities(
+    quantities: pd.Series, units: pd.Series, restrict_to=None
+) -> tuple[pd.Series, pd.Series]:
+    """Converts `quantities` by their (cleaned) `units`. If `restrict_to` is given,
+    e.g. `planting_units_raw()` to convert only seed related units into the only
+    accepted unit by BE: "BAG", other units are returned unchanged."""
+    return unit_engine().convert_quantities(quantities, units, restrict_to=restrict_to)
 
-    u = qm_converter[qm_converter.unit == unit.lower()]
 
-    if u.empty:
-        if unit not in qm_converter.clear_unit.unique() and verbose:
-            log.warning(f"no mapping for unit {unit}")
-        return unit
-    # extract clear unit record from table
-    clear_unit = u.clear_unit.iloc[0]
-    # avoid overwriting units that have no `clear_unit` assigned yet
-    u = clear_unit if not pd.isna(clear_unit) else unit
-    return u
+def clean_units(unit, verbose=False):
+    return unit_engine().normalize_unit(unit, verbose=verbose)
 
 
 def convert_quantity_by_unit(quantity, unit, params_to_convert=None):
-    if params_to_convert is None:
-        params_to_convert = []
-    if not isinstance(unit, str):
-        return quantity, unit
-    unit = clean_units(unit)
-
-    if len(params_to_convert) != 0:
-        # this check enables us to convert only planting related units (seeds) into
-        # the only accepted unit by BE: "BAG"
-        # to achieve this we are using the above defined `PLANTING_UNITS_RAW` passed
-        # in as the `params_to_convert`. If the passed `unit` is not within this list,
-        # we simply return the original `quantity` and `unit`.
-        if unit in params_to_convert:
-            temp = qu_converter[qu_converter.unit == unit.lower()]
-        else:
-            return quantity, unit
-    else:
-        temp = qu_converter[qu_converter.unit == unit.lower()]
-
-    if temp.empty:
-        return quantity * 1, unit
-
-    conversion_factor = temp.conversion_factor.iloc[0]
-    u = temp.target_unit.iloc[0]
-
-    return quantity * conversion_factor, u
+    return unit_engine().convert_quantity(quantity, unit, restrict_to=params_to_convert)
 
 
 def add_missing_columns(df, columns):
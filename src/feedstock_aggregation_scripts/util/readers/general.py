@@ -88,12 +88,15 @@ def read_JDOps_excel_export(
 ):
     folder_path = f"{settings.bucket_folders.raw_data}/{grower}/{growing_cycle}"
 
-    combined_jdops = AggregatorOperationFactory.process_file_by_type_in_gcs(
-        DataAggregators.DA_JDOPS, BUCKET_NAME, folder_path, file_type
+    df = AggregatorOperationFactory.process_file_by_type_in_gcs(
+        DataAggregators.DA_JDOPS,
+        BUCKET_NAME,
+        folder_path,
+        file_type,
+        columnar=True,
+        max_workers=settings.raw_data_cache.max_file_workers,
     )
 
-    df = pd.DataFrame([model.model_dump(by_alias=True) for model in combined_jdops])
-
     # path = (
     #     Path(path_to_data)
     #     .joinpath(grower)
@@ -242,12 +245,15 @@ def get_file_type_by_data_aggregator(
 def read_Granular_export(path_to_data, grower, growing_cycle, file_type, verbose=True):
     folder_path = f"{settings.bucket_folders.raw_data}/{grower}/{growing_cycle}"
 
-    granular_export = AggregatorOperationFactory.process_file_by_type_in_gcs(
-        DataAggregators.DA_GRANULAR, BUCKET_NAME, folder_path, file_type
+    df = AggregatorOperationFactory.process_file_by_type_in_gcs(
+        DataAggregators.DA_GRANULAR,
+        BUCKET_NAME,
+        folder_path,
+        file_type,
+        columnar=True,
+        max_workers=settings.raw_data_cache.max_file_workers,
     )
 
-    df = pd.DataFrame([model.model_dump(by_alias=True) for model in granular_export])
-
     # path = (
     #     Path(path_to_data)
     #     .joinpath(grower)
@@ -276,12 +282,15 @@ def read_Granular_export(path_to_data, grower, growing_cycle, file_type, verbose
 def read_CFV_data(path_to_data, grower, growing_cycle, file_type, verbose):
     folder_path = f"{settings.bucket_folders.raw_data}/{grower}/{growing_cycle}"
 
-    cfv = AggregatorOperationFactory.process_file_by_type_in_gcs(
-        DataAggregators.DA_CFV, BUCKET_NAME, folder_path, file_type
+    results = AggregatorOperationFactory.process_file_by_type_in_gcs(
+        DataAggregators.DA_CFV,
+        BUCKET_NAME,
+        folder_path,
+        file_type,
+        columnar=True,
+        max_workers=settings.raw_data_cache.max_file_workers,
     )
 
-    results = pd.DataFrame([model.model_dump(by_alias=True) for model in cfv])
-
     # initialize variables
     # results = pd.DataFrame()
     # log.debug(f"Reading CFV files: {grower} {file_type} {growing_cycle}")
@@ -383,12 +392,15 @@ def read_FM_export(
 ):
     folder_path = f"{settings.bucket_folders.raw_data}/{grower}/{growing_cycle}"
 
-    cfv = AggregatorOperationFactory.process_file_by_type_in_gcs(
-        DataAggregators.DA_FARMMOBILE, BUCKET_NAME, folder_path, file_type
+    df = AggregatorOperationFactory.process_file_by_type_in_gcs(
+        DataAggregators.DA_FARMMOBILE,
+        BUCKET_NAME,
+        folder_path,
+        file_type,
+        columnar=True,
+        max_workers=settings.raw_data_cache.max_file_workers,
     )
 
-    df = pd.DataFrame([model.model_dump(by_alias=True) for model in cfv])
-
     # path = (
     #     Path(path_to_data)
     #     .joinpath(grower)
@@ -467,12 +479,13 @@ def read_csv_report(
             # Granular generated files are now read from GCS
             folder_path = f"{settings.bucket_folders.raw_data}/{grower}/{growing_cycle}"
 
-            granular_generated = AggregatorOperationFactory.process_file_by_type_in_gcs(
-                DataAggregators.DA_GRANULAR, BUCKET_NAME, folder_path, file_type
-            )
-
-            df = pd.DataFrame(
-                [model.model_dump(by_alias=True) for model in granular_generated]
+            df = AggregatorOperationFactory.process_file_by_type_in_gcs(
+                DataAggregators.DA_GRANULAR,
+                BUCKET_NAME,
+                folder_path,
+                file_type,
+                columnar=True,
+                max_workers=settings.raw_data_cache.max_file_workers,
             )
 
         elif file_type in [*LDB_GENERATED]:
@@ -0,0 +1,110 @@
+import os
+import pathlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import pandas as pd
+from loguru import logger as log
+
+
+@dataclass
+class LoadTiming:
+    name: str
+    sources: tuple
+    seconds: float
+
+
+@dataclass
+class ReferenceTable:
+    loader: Callable[..., Any]
+    sources: Callable[[], tuple]
+    key: tuple | None = None
+    value: Any = None
+    # sources of `key` and when their mtimes were last checked (`time.monotonic`)
+    paths: tuple | None = None
+    checked: float = float("-inf")
+
+
+def source_version(source: str | pathlib.Path) -> tuple:
+    """(source, mtime) for local files. Remote sources (URLs) never change within a
+    process, their mtime is `None`."""
+    if isinstance(source, str) and "://" in source:
+        return source, None
+    return str(source), os.stat(source).st_mtime_ns
+
+
+class ReferenceDataRegistry:
+    """Reference tables (unit tables, product breakdowns, county shapes, ...) loaded
+    on first use instead of at import time.
+
+    Each table is registered with a loader and a function returning its sources
+    (file paths or URLs), so that settings are only resolved on first use as well.
+    Loaded values are memoized per process and reloaded when the path of a source
+    changes. Source mtimes are checked at most every `check_interval` seconds, or on
+    the next `get` after `reload()`.
+    """
+
+    def __init__(self, check_interval: float = 5.0):
+        self.check_interval = check_interval
+        self.tables: dict[str, ReferenceTable] = {}
+        self.timings: list[LoadTiming] = []
+        self._lock = threading.RLock()
+
+    def register(
+        self, name: str, loader: Callable[..., Any], sources: Callable[[], tuple]
+    ):
+        """Registers `name`, loaded by `loader(*sources())`. Registering an already
+        known name again is a no-op."""
+        with self._lock:
+            self.tables.setdefault(name, ReferenceTable(loader, sources))
+
+    def get(self, name: str) -> Any:
+        table = self.tables[name]
+        sources = table.sources()
+        paths = tuple(map(str, sources))
+        now = time.monotonic()
+
+        if table.paths == paths and now - table.checked < self.check_interval:
+            return table.value
+
+        key = tuple(source_version(source) for source in sources)
+        with self._lock:
+            if table.key != key:
+                start = time.perf_counter()
+                table.value = table.loader(*sources)
+                table.key = key
+                seconds = time.perf_counter() - start
+
+                self.timings.append(LoadTiming(name, paths, seconds))
+                log.debug(f"loaded reference data `{name}` in {seconds:.2f}s")
+            table.paths, table.checked = paths, now
+
+        return table.value
+
+    def reload(self):
+        """Checks the mtimes of all sources again on their next `get`, reloading the
+        tables whose sources changed."""
+        with self._lock:
+            for table in self.tables.values():
+                table.checked = float("-inf")
+
+    def clear(self):
+        with self._lock:
+            for table in self.tables.values():
+                table.key, table.value, table.paths = None, None, None
+
+    def load_timings(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [(t.name, ", ".join(t.sources), t.seconds) for t in self.timings],
+            columns=["Name", "Sources", "Seconds"],
+        )
+
+    def summary(self) -> str:
+        total = sum(t.seconds for t in self.timings)
+        loaded = ", ".join(f"{t.name} ({t.seconds:.2f}s)" for t in self.timings)
+        return f"reference data: {len(self.timings)} loads in {total:.2f}s: {loaded}"
+
+
+REFERENCE_DATA = ReferenceDataRegistry()
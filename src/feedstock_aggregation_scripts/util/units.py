@@ -0,0 +1,174 @@
+import pathlib
+
+import numpy as np
+import pandas as pd
+from loguru import logger as log
+
+from ..config import settings
+from .reference_data import REFERENCE_DATA
+
+MISSING_UNITS = ["---", "--"]
+
+
+class UnitEngine:
+    """Unit normalization and quantity conversion for whole columns.
+
+    `unit_mapping` (`unit_mapping_table.csv`: `unit`, `clear_unit`) and
+    `unit_conversions` (`unit_conversions.csv`: `unit`, `target_unit`,
+    `conversion_factor`) are compiled once into dictionaries and arrays, keeping the
+    first record per unit like the former per-value table filters.
+    """
+
+    def __init__(
+        self, unit_conversions: pd.DataFrame, unit_mapping: pd.DataFrame | None = None
+    ):
+        conversions = unit_conversions.drop_duplicates(subset="unit", keep="first")
+        self.conversion_index = {u: i for i, u in enumerate(conversions.unit)}
+        self.conversion_factors = conversions.conversion_factor.to_numpy(dtype=float)
+        self.target_units = conversions.target_unit.to_numpy(dtype=object)
+
+        self.clear_units = {}
+        self.known_clear_units = set()
+        if unit_mapping is not None:
+            mapping = unit_mapping.drop_duplicates(subset="unit", keep="first")
+            # units without `clear_unit` assigned yet are kept as they are
+            mapping = mapping[mapping.clear_unit.notna()]
+            self.clear_units = dict(zip(mapping.unit, mapping.clear_unit))
+            self.known_clear_units = set(unit_mapping.clear_unit.unique())
+
+    def normalize_unit(self, unit, verbose: bool = False):
+        """Scalar version of `normalize_units`."""
+        if not isinstance(unit, str):
+            return unit
+        if unit in MISSING_UNITS:
+            return np.nan
+
+        clear_unit = self.clear_units.get(unit.lower())
+        if clear_unit is None:
+            if verbose and unit not in self.known_clear_units:
+                log.warning(f"no mapping for unit {unit}")
+            return unit
+        return clear_unit
+
+    def convert_quantity(self, quantity, unit, restrict_to=None, normalize=True):
+        """Scalar version of `convert_quantities`."""
+        if not isinstance(unit, str):
+            return quantity, unit
+        if normalize and len(self.clear_units):
+            unit = self.normalize_unit(unit)
+            if not isinstance(unit, str):
+                return quantity, unit
+        if (
+            restrict_to is not None
+            and len(restrict_to) != 0
+            and unit not in restrict_to
+        ):
+            return quantity, unit
+
+        position = self.conversion_index.get(unit.lower())
+        if position is None:
+            return quantity, unit
+        return quantity * self.conversion_factors[position], self.target_units[position]
+
+    def normalize_units(self, units: pd.Series, verbose: bool = False) -> pd.Series:
+        """Maps raw `units` to their clear units (`---`/`--` become NaN). Non-string
+        values and units without mapping are kept as they are."""
+        is_str = units.map(lambda u: isinstance(u, str)).to_numpy(dtype=bool)
+        lowered = units.where(is_str).str.lower() if is_str.any() else units
+        clear = lowered.map(self.clear_units)
+
+        out = units.where(~(is_str & clear.notna().to_numpy()), clear)
+        out = out.where(~(is_str & units.isin(MISSING_UNITS).to_numpy()), np.nan)
+
+        if verbose:
+            unmapped = units[
+                is_str
+                & clear.isna().to_numpy()
+                & ~units.isin(MISSING_UNITS).to_numpy()
+                & ~units.isin(self.known_clear_units).to_numpy()
+            ]
+            for unit in unmapped.unique():
+                log.warning(f"no mapping for unit {unit}")
+
+        return out
+
+    def convert_quantities(
+        self,
+        quantities: pd.Series,
+        units: pd.Series,
+        restrict_to=None,
+        normalize: bool = True,
+    ) -> tuple[pd.Series, pd.Series]:
+        """Converts `quantities` to the target unit of their `units` (LIQUID to GAL,
+        DRY to LBS, seed products to BAG). With `normalize` units are mapped to
+        their clear units first. If `restrict_to` is non-empty, only units in it are
+        converted. Returns the converted quantities and units, aligned with
+        `quantities`."""
+        is_str = units.map(lambda u: isinstance(u, str)).to_numpy(dtype=bool)
+        if normalize and len(self.clear_units):
+            units = self.normalize_units(units)
+            is_str = is_str & units.map(lambda u: isinstance(u, str)).to_numpy(
+                dtype=bool
+            )
+
+        convert = is_str
+        if restrict_to is not None and len(restrict_to) != 0:
+            convert = convert & units.isin(restrict_to).to_numpy()
+
+        positions = (
+            units.where(convert).str.lower().map(self.conversion_index)
+            if convert.any()
+            else pd.Series(np.nan, index=units.index)
+        )
+        hit = positions.notna().to_numpy()
+        idx = positions[hit].to_numpy(dtype=int)
+
+        values = quantities.to_numpy(dtype=object).copy()
+        converted_units = units.to_numpy(dtype=object).copy()
+        values[hit] = (
+            quantities[hit].to_numpy(dtype=float) * self.conversion_factors[idx]
+        )
+        converted_units[hit] = self.target_units[idx]
+
+        return (
+            pd.Series(values, index=quantities.index).infer_objects(),
+            pd.Series(converted_units, index=quantities.index),
+        )
+
+
+def unit_table_source(file_name: str) -> tuple:
+    return (pathlib.Path(settings.data_prep.source_path).joinpath(file_name),)
+
+
+REFERENCE_DATA.register(
+    "unit_conversions", pd.read_csv, lambda: unit_table_source("unit_conversions.csv")
+)
+REFERENCE_DATA.register(
+    "unit_mapping_table",
+    pd.read_csv,
+    lambda: unit_table_source("unit_mapping_table.csv"),
+)
+REFERENCE_DATA.register(
+    "unit_engine",
+    lambda *_: UnitEngine(
+        unit_conversions=REFERENCE_DATA.get("unit_conversions"),
+        unit_mapping=REFERENCE_DATA.get("unit_mapping_table"),
+    ),
+    lambda: unit_table_source("unit_conversions.csv")
+    + unit_table_source("unit_mapping_table.csv"),
+)
+REFERENCE_DATA.register(
+    "unit_conversion_engine",
+    lambda *_: UnitEngine(unit_conversions=REFERENCE_DATA.get("unit_conversions")),
+    lambda: unit_table_source("unit_conversions.csv"),
+)
+
+
+def unit_engine() -> UnitEngine:
+    """Engine for unit normalization and conversion."""
+    return REFERENCE_DATA.get("unit_engine")
+
+
+def unit_conversion_engine() -> UnitEngine:
+    """Engine converting by `unit_conversions.csv` only, without unit normalization."""
+    return REFERENCE_DATA.get("unit_conversion_engine")
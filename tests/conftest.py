@@ -0,0 +1,62 @@
+"""Test configuration: settings are read from a temporary configuration file, and
+all caches of the application live in a temporary directory."""
+import atexit
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+
+import pandas as pd
+import pytest
+
+ROOT = pathlib.Path(__file__).parents[1]
+sys.path[:0] = [str(ROOT), str(ROOT.joinpath("src"))]
+
+CONFIG_DIR = pathlib.Path(tempfile.mkdtemp(prefix="feedstock_tests_"))
+atexit.register(shutil.rmtree, CONFIG_DIR, ignore_errors=True)
+CONFIG_DIR.joinpath("application.yaml").write_text(f"""
+data_prep:
+  source_path: {CONFIG_DIR / "data"}
+  dest_path: {CONFIG_DIR / "data" / "out"}
+soil_temperature_api:
+  url: http://localhost:1/api
+  retries: 0
+gcs_dev:
+  project_id: test
+  bucket_name: test
+bucket_folders:
+  bulk_templates: bulk_templates
+  cleaned_data: cleaned_data
+  field_decisions: field_decisions
+  mapping_data: mapping_data
+  merged_data: merged_data
+  raw_data: raw_data
+  reporting: reporting
+  support_data: support_data
+raw_data_cache:
+  path: {CONFIG_DIR / "raw_data"}
+soil_temperature_cache:
+  path: {CONFIG_DIR / "soil_temperature"}
+product_match_memory:
+  path: {CONFIG_DIR / "product_matches"}
+county_store:
+  path: {CONFIG_DIR / "county_store"}
+""")
+os.environ.setdefault("FEEDSTOCK_CONFIG", str(CONFIG_DIR / "application.yaml"))
+
+
+@pytest.fixture
+def unit_conversions():
+    """Writes a small `unit_conversions.csv` to the data prep source path."""
+    from src.feedstock_aggregation_scripts.config import settings
+
+    source_path = pathlib.Path(settings.data_prep.source_path)
+    source_path.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(
+        {
+            "unit": ["oz", "qt", "ton"],
+            "target_unit": ["LBS", "GAL", "LBS"],
+            "conversion_factor": [0.0625, 0.25, 2000],
+        }
+    ).to_csv(source_path.joinpath("unit_conversions.csv"), index=False)
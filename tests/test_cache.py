@@ -0,0 +1,131 @@
+import os
+import uuid
+
+import fsspec
+import pytest
+
+from data_aggregators.cache import ObjectCache
+
+
+@pytest.fixture
+def fs(monkeypatch):
+    """Memory filesystem reporting `fs.generations` as object generation, counting
+    downloads per object."""
+    fs = fsspec.filesystem("memory")
+    fs.bucket = f"/bucket-{uuid.uuid4().hex}"
+    fs.generations, fs.downloads = {}, []
+    info, open_file = fs.info, fs.open
+
+    def versioned_info(path, **kwargs):
+        return {**info(path, **kwargs), "generation": fs.generations.get(path)}
+
+    def counted_open(path, mode="rb", *args, **kwargs):
+        if mode.startswith("r"):
+            fs.downloads.append(path)
+        return open_file(path, mode, *args, **kwargs)
+
+    monkeypatch.setattr(fs, "info", versioned_info)
+    monkeypatch.setattr(fs, "open", counted_open)
+    yield fs
+    fs.rm(fs.bucket, recursive=True)
+
+
+def put(fs, name: str, content: bytes, generation: int = 1) -> str:
+    path = f"{fs.bucket}/{name}"
+    fs.pipe(path, content)
+    fs.generations[path] = generation
+    return path
+
+
+def read(cache: ObjectCache, fs, path: str) -> bytes:
+    with cache.open(fs, path) as f:
+        return f.read()
+
+
+def test_miss_then_hit(fs, tmp_path):
+    cache = ObjectCache(tmp_path, max_bytes=1024)
+    path = put(fs, "export.csv", b"a,b\n1,2\n")
+
+    assert read(cache, fs, path) == b"a,b\n1,2\n"
+    assert read(cache, fs, path) == b"a,b\n1,2\n"
+
+    assert fs.downloads == [path]
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.bytes_downloaded == 8
+    assert cache.summary().startswith("raw data cache: 1 hits, 1 misses")
+
+
+def test_cache_is_shared_between_instances(fs, tmp_path):
+    path = put(fs, "export.csv", b"data")
+    read(ObjectCache(tmp_path, max_bytes=1024), fs, path)
+
+    cache = ObjectCache(tmp_path, max_bytes=1024)
+
+    assert read(cache, fs, path) == b"data"
+    assert fs.downloads == [path]
+    assert cache.stats.hits == 1
+
+
+def test_new_generation_is_downloaded_again(fs, tmp_path):
+    cache = ObjectCache(tmp_path, max_bytes=1024)
+    path = put(fs, "export.csv", b"old")
+    read(cache, fs, path)
+
+    put(fs, "export.csv", b"new", generation=2)
+
+    assert read(cache, fs, path) == b"new"
+    assert read(cache, fs, path) == b"new"
+    assert fs.downloads == [path, path]
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_least_recently_used_entries_are_evicted(fs, tmp_path):
+    cache = ObjectCache(tmp_path, max_bytes=25)
+    paths = {name: put(fs, name, name.encode() * 10) for name in "abc"}
+    read(cache, fs, paths["a"])
+    read(cache, fs, paths["b"])
+    # make both entries old, `b` older than `a`
+    for name, mtime in [("a", 2000), ("b", 1000)]:
+        os.utime(cache.cache_path(paths[name], "1"), (mtime, mtime))
+
+    # reading `a` again makes it the most recently used entry
+    read(cache, fs, paths["a"])
+    read(cache, fs, paths["c"])
+
+    cached = {
+        name: cache.cache_path(path, "1").exists() for name, path in paths.items()
+    }
+    assert cached == {"a": True, "b": False, "c": True}
+    assert cache.stats.evictions == 1
+    assert read(cache, fs, paths["b"]) == b"b" * 10
+    assert fs.downloads.count(paths["b"]) == 2
+
+
+def test_object_larger_than_cache_is_kept_until_next_download(fs, tmp_path):
+    cache = ObjectCache(tmp_path, max_bytes=5)
+    first = put(fs, "first.csv", b"0123456789")
+    second = put(fs, "second.csv", b"abcdefghij")
+
+    assert read(cache, fs, first) == b"0123456789"
+    assert cache.cache_path(first, "1").exists()
+
+    assert read(cache, fs, second) == b"abcdefghij"
+    assert not cache.cache_path(first, "1").exists()
+    assert cache.cache_path(second, "1").exists()
+    assert cache.stats.evictions == 1
+
+
+@pytest.mark.parametrize(
+    "info, version",
+    [
+        ({"generation": 7, "etag": "x", "size": 3}, "7"),
+        ({"etag": "x", "md5Hash": "y", "size": 3}, "x"),
+        ({"md5Hash": "y", "size": 3}, "y"),
+        ({"ETag": "z", "size": 3}, "z"),
+        ({"size": 3, "mtime": 100.0}, "3-100.0"),
+        ({"size": 3, "updated": "2023-01-01"}, "3-2023-01-01"),
+        ({"size": 3, "created": 5.0}, "3-5.0"),
+    ],
+)
+def test_object_version(info, version):
+    assert ObjectCache.object_version(info) == version
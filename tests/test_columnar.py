@@ -0,0 +1,172 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import BaseModel, field_validator, model_validator
+
+from data_aggregators import schema
+from data_aggregators.columnar import (
+    ColumnarNotSupportedError,
+    get_column_rule,
+    validate_frame,
+)
+from data_aggregators.files import DataFile
+
+# cell values covering the NA, str, float and `---` rules and their failures
+VALUES = [
+    np.nan,
+    None,
+    pd.NaT,
+    "---",
+    " --- ",
+    "",
+    "abc",
+    "2.5",
+    " 7 ",
+    "12%",
+    "1,000",
+    "1,5%",
+    "1e400",
+    1.5,
+    0.1 + 0.2,
+    1e16,
+    -0.0,
+    3,
+    True,
+    "2023-04-01 10:00:00",
+    [1, 2],
+]
+
+MODELS = [
+    schema.Measurement,
+    schema.CFVApplicationReport,
+    schema.CFVPlantingReport,
+    schema.CFVHarvestReport,
+    schema.MyJohnDeereApplication,
+    schema.MyJohnDeereHarvest,
+    schema.GranularPlantingData,
+    schema.FarMobileApplication,
+]
+
+
+def validate_rows(df: pd.DataFrame, model) -> tuple[pd.DataFrame, list]:
+    """The per-row path: one model per row (of the cell values, `iterrows` may
+    upcast None in mixed rows to NaN)."""
+    rows, failed = [], []
+    for i, row in enumerate(df.to_dict("records")):
+        try:
+            rows.append(model(**row).model_dump(by_alias=True))
+        except Exception:
+            failed.append(i)
+    return pd.DataFrame(rows), failed
+
+
+def random_frame(model, seed: int, n_rows: int = 60) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    columns = [info.alias or name for name, info in model.model_fields.items()]
+    # every other row without lists, so the validated frame is not empty
+    scalars = [v for v in VALUES if not isinstance(v, list)]
+    return pd.DataFrame(
+        {
+            col: [
+                pool[rng.integers(0, len(pool))]
+                for pool in [scalars, VALUES] * (n_rows // 2)
+            ]
+            for col in columns
+        },
+        dtype=object,
+    )
+
+
+def test_schema_validators_have_column_rules():
+    for model in [schema.CFVApplicationReport, schema.CFVPlantingReport]:
+        for dec in model.__pydantic_decorators__.field_validators.values():
+            assert get_column_rule(dec.func) is not None, dec.cls_var_name
+    for dec in schema.FarMobileData.__pydantic_decorators__.model_validators.values():
+        assert get_column_rule(dec.func) is not None
+    # validators without registered rule run value by value
+    for dec in schema.DataTemplate.__pydantic_decorators__.field_validators.values():
+        if dec.cls_var_name == "value_not_none":
+            assert get_column_rule(dec.func) is None
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("model", MODELS, ids=lambda m: m.__name__)
+def test_validate_frame_matches_per_row_path(model, seed):
+    df = random_frame(model, seed)
+    expected, expected_failed = validate_rows(df, model)
+    result = validate_frame(df, model, strict=False)
+
+    assert sorted(result.errors.row.unique()) == expected_failed
+    if expected.empty:
+        assert result.frame.empty
+    else:
+        pd.testing.assert_frame_equal(
+            result.frame, expected[list(result.frame.columns)], check_dtype=False
+        )
+
+
+class AfterValidated(BaseModel):
+    name: str
+    area: float | None = None
+
+    @model_validator(mode="after")
+    def check_area(self):
+        if self.area is not None and self.area < 0:
+            raise ValueError("negative area")
+        return self
+
+
+class WrapValidated(BaseModel):
+    name: str
+
+    @field_validator("name", mode="wrap")
+    def strip_name(cls, value, handler):
+        return handler(value).strip()
+
+
+FRAMES = {
+    "after.csv": pd.DataFrame({"name": ["North", "South"], "area": [80.0, None]}),
+    "wrap.csv": pd.DataFrame({"name": [" East ", "West"]}),
+}
+
+
+class InMemoryFile(DataFile):
+    """Reads `FRAMES` instead of GCS objects, with the model by file name."""
+
+    @staticmethod
+    def model(file_path: str):
+        return AfterValidated if file_path.startswith("after") else WrapValidated
+
+    @classmethod
+    def read_file(cls, file_path: str) -> pd.DataFrame:
+        return FRAMES[file_path]
+
+    @classmethod
+    def from_file(cls, file_path: str) -> "InMemoryFile":
+        file = cls(file_name=file_path)
+        for row in cls.read_file(file_path).to_dict("records"):
+            file.add_operation(cls.model(file_path)(**row))
+        return file
+
+    @classmethod
+    def frame_from_file(cls, file_path: str) -> pd.DataFrame:
+        return validate_frame(cls.read_file(file_path), cls.model(file_path)).frame
+
+
+@pytest.mark.parametrize("model", [AfterValidated, WrapValidated])
+def test_unsupported_validators_raise(model):
+    with pytest.raises(ColumnarNotSupportedError):
+        validate_frame(pd.DataFrame({"name": ["North"]}), model)
+
+
+def test_load_files_falls_back_to_per_row_path():
+    files = ["after.csv", "wrap.csv"]
+    expected = pd.concat(
+        [InMemoryFile.from_file(file).to_frame() for file in files],
+        ignore_index=True,
+    )
+
+    frame = InMemoryFile.load_files(files, columnar=True)
+
+    pd.testing.assert_frame_equal(frame, expected)
+    assert frame.name.tolist() == ["North", "South", "East", "West"]
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+pytest.importorskip("shapely")
+pytest.importorskip("pyarrow")
+
+from src.feedstock_aggregation_scripts.config import settings
+from src.feedstock_aggregation_scripts.shp_files import county_store
+
+COUNTIES = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "id": "17019",
+            "properties": {"STATE": "17", "COUNTY": "019", "NAME": "Champaign"},
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[-88.5, 40.0], [-88.0, 40.0], [-88.0, 40.4]]],
+            },
+        },
+        {
+            "type": "Feature",
+            "id": "17041",
+            "properties": {"STATE": "17", "NAME": "Douglas"},
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[-88.5, 39.6], [-88.0, 39.6], [-88.0, 39.9]]],
+            },
+        },
+    ],
+}
+
+
+@pytest.fixture
+def geojson(tmp_path):
+    path = tmp_path / "counties.json"
+    path.write_text(json.dumps(COUNTIES))
+    return path
+
+
+def test_missing_store_without_geojson_fails(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings.county_store, "geojson", None)
+    store = tmp_path / "store" / "counties.arrow"
+
+    with pytest.raises(FileNotFoundError, match="county_store.geojson"):
+        county_store.ensure_county_store(store)
+    assert not store.exists()
+
+
+def test_missing_store_is_built_from_configured_geojson(tmp_path, geojson, monkeypatch):
+    monkeypatch.setattr(settings.county_store, "geojson", geojson)
+    store = tmp_path / "store" / "counties.arrow"
+
+    assert county_store.ensure_county_store(store) == store
+    polygons, features = county_store.read_county_store(store)
+
+    assert [f["id"] for f in features] == ["17019", "17041"]
+    # keys absent in the GeoJSON are left out again
+    assert [f["properties"] for f in features] == [
+        f["properties"] for f in COUNTIES["features"]
+    ]
+    assert [round(p.area, 3) for p in polygons] == [0.1, 0.075]
+
+
+def test_existing_store_is_not_rebuilt(tmp_path, geojson, monkeypatch):
+    store = county_store.build_county_store(geojson, tmp_path / "counties.arrow")
+    monkeypatch.setattr(settings.county_store, "geojson", tmp_path / "missing.json")
+
+    assert county_store.ensure_county_store(store) == store
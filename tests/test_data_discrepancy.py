@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.feedstock_aggregation_scripts.ci_prep.data_discrepancy.applications import (
+    create_app_input_comparison_by_crop,
+)
+from src.feedstock_aggregation_scripts.ci_prep.helpers import (
+    get_attributes_from_all_sources,
+)
+from src.feedstock_aggregation_scripts.util.conversion import convert_quantity_by_unit
+
+
+def reference_app_input_comparison_by_crop(data_sources: dict) -> pd.DataFrame:
+    """The former loop `create_app_input_comparison_by_crop` replaces, except for
+    the units of entries created by a total without unit: the loop filled them from
+    the last converted total of any field and product (failing if there was none),
+    now they take the first unit of a later total of their own crop type (or over
+    all crop types for entries without crop type)."""
+    fields = get_attributes_from_all_sources("Field_name", data_sources)
+    products = get_attributes_from_all_sources("Product", data_sources)
+    crops = get_attributes_from_all_sources("Crop_type", data_sources)
+
+    cols = ["Field_name", "Crop_type", "Product", "Applied_unit", "Operation_type"]
+    df = pd.DataFrame(columns=cols)
+    operation_type = "Application"
+
+    for name, data in data_sources.items():
+        if data.empty:
+            continue
+        df[name] = np.nan
+
+        for field in fields:
+            data_t = data[(data.Field_name == field)]
+            if data_t.empty:
+                continue
+
+            for product in products:
+                if pd.isna(product):
+                    continue
+                data_tp = data_t[(data_t.Product == product)]
+                if data_tp.empty:
+                    continue
+
+                for crop in crops:
+                    if not pd.isna(crop):
+                        data_tpc = data_tp[(data_tp.Crop_type == crop)]
+                        existing_entry = df[
+                            (df.Field_name == field)
+                            & (df.Product == product)
+                            & (df.Crop_type == crop)
+                        ]
+                    else:
+                        data_tpc = data_tp
+                        existing_entry = df[
+                            (df.Field_name == field) & (df.Product == product)
+                        ]
+                    if data_tpc.empty:
+                        continue
+
+                    data_q = data_tpc.Applied_total.sum()
+                    unit = None
+                    if not (data_q == 0 or np.isnan(data_q)):
+                        data_u = data_tpc.Applied_unit.iloc[0]
+                        data_q, data_u = convert_quantity_by_unit(data_q, data_u)
+                        unit = data_u
+
+                    t = pd.DataFrame(
+                        columns=cols + [name],
+                        data=[[field, crop, product, unit, operation_type, data_q]],
+                    )
+                    if existing_entry.empty:
+                        df = pd.concat([df, t], ignore_index=True)
+                    else:
+                        for i in existing_entry.index:
+                            df.loc[i, name] = data_q
+                        own = existing_entry.index[
+                            existing_entry.Crop_type.isna() == pd.isna(crop)
+                        ]
+                        for i in own:
+                            if pd.isna(df.loc[i, "Applied_unit"]):
+                                df.loc[i, "Applied_unit"] = unit
+
+    return df
+
+
+def random_data_sources(seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+
+    def choice(values, n):
+        return [values[i] for i in rng.integers(0, len(values), n)]
+
+    sources = {}
+    for name in ["CFV", "JDOPS", "GRANULAR", "FARMOBILE"][: rng.integers(1, 5)]:
+        n = int(rng.integers(0, 20))
+        sources[name] = pd.DataFrame(
+            {
+                "Field_name": choice(["North", "South", "East", np.nan], n),
+                "Product": choice(["UAN", "Urea", "Potash", np.nan], n),
+                "Crop_type": choice(["CORN", "SOYBEANS", "WHEAT", np.nan], n),
+                "Applied_total": choice([0, np.nan, 1, 2.5, 10, 40], n),
+                "Applied_unit": choice(["GAL", "LBS", "oz", "qt", np.nan], n),
+            },
+            columns=["Field_name", "Product", "Crop_type", "Applied_total"]
+            + ["Applied_unit"],
+        )
+    return sources
+
+
+def without_na(df: pd.DataFrame) -> pd.DataFrame:
+    return df.astype(object).where(df.notna(), None)
+
+
+@pytest.mark.parametrize("seed", range(150))
+def test_app_input_comparison_matches_former_loop(seed, unit_conversions):
+    data_sources = random_data_sources(seed)
+
+    result = create_app_input_comparison_by_crop(data_sources)
+    expected = reference_app_input_comparison_by_crop(data_sources)
+
+    if expected.empty:
+        assert result.empty
+        assert list(result.columns) == list(expected.columns)
+    else:
+        # missing units are None or NaN depending on the inferred dtype
+        pd.testing.assert_frame_equal(
+            without_na(result), without_na(expected), check_dtype=False
+        )
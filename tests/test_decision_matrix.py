@@ -0,0 +1,302 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.feedstock_aggregation_scripts.ci_prep import n_management
+from src.feedstock_aggregation_scripts.ci_prep.cc_use import (
+    get_cover_crop_use_decisions,
+)
+from src.feedstock_aggregation_scripts.ci_prep.helpers import (
+    get_major_crop_types,
+    map_by_field,
+)
+from src.feedstock_aggregation_scripts.ci_prep.manure_use import (
+    get_manure_use_decisions,
+)
+from src.feedstock_aggregation_scripts.ci_prep.n_management import (
+    get_eef_decisions,
+    get_fertilizer_timing_decisions_4r,
+    get_n_management_decisions,
+)
+from src.feedstock_aggregation_scripts.ci_prep.tillage import (
+    add_tillage_params,
+    get_tillage_practice_decisions,
+)
+from src.feedstock_aggregation_scripts.data_prep.constants import FDCIC_CROPS
+
+FIELDS = ["North", "South", "East", "West", "Creek", np.nan]
+GROWER = "DUMMY"
+GROWING_CYCLE = 2023
+
+# Reference: the former per-field `add_*_decision` helpers, applied to each row of
+# the decision matrix
+
+
+def reference_timing_decision_4r(field, comprehensive_input_list, start_timings_4r):
+    fertilizer_input_list = comprehensive_input_list[
+        (comprehensive_input_list["Field_name"].isin([field]))
+        & (comprehensive_input_list["Input_type"].isin(["FERTILIZER", "EEF"]))
+    ]
+    timing = fertilizer_input_list["Fertilizer_timing"]
+    fall_applications = fertilizer_input_list[timing.isin(["Fall"])]
+
+    if fertilizer_input_list.empty or timing.isin(["NO_4R"]).any():
+        return "NO_4R"
+    elif timing.isin(["FLAG"]).any():
+        return "NO_4R"
+    elif not fall_applications.empty:
+        if field in start_timings_4r:
+            start_timing_for_4r = start_timings_4r[field]
+            if start_timing_for_4r is None:
+                return "NO_4R"
+            for fall_application in fall_applications.itertuples(index=False):
+                if fall_application.Operation_start < pd.to_datetime(
+                    start_timing_for_4r
+                ):
+                    return "NO_4R"
+            return "4R"
+        else:
+            return "NO_4R"
+    else:
+        return "4R"
+
+
+def reference_eef_decision(field_name, bulk_upload_template):
+    bulk_upload_template_by_field = bulk_upload_template[
+        bulk_upload_template["Field_name"] == field_name
+    ]
+    if bulk_upload_template_by_field["EEF_product"].str.contains("y").any():
+        return "EEF"
+    else:
+        return None
+
+
+def reference_n_management_decision(timing_4r, amount_4r, eef):
+    if timing_4r == "4R" and amount_4r == "4R":
+        return "4R"
+    elif eef == "EEF":
+        return "EEF"
+    else:
+        return "BUSINESS_AS_USUAL"
+
+
+def reference_use_decision(field, report):
+    """The former `add_manure_use_decision` and `add_cover_crop_use_decision`."""
+    temp = report[report["Field_name"].isin([field])]
+    if temp.empty:
+        return False
+    else:
+        if (temp["Area_coverage_percent"] > 0.50).any():
+            return True
+        return False
+
+
+def reference_major_crop_type(field, decisions):
+    temp = decisions[
+        (decisions["Field_name"].isin([field]))
+        & (decisions["Crop_type"].isin(FDCIC_CROPS))
+    ]
+    num_crops = len(temp["Crop_type"].unique())
+    if num_crops == 1:
+        return temp["Crop_type"].iloc[0]
+    elif num_crops > 1:
+        return "Potential_split_field"
+    else:
+        return None
+
+
+def reference_till_depth(area_applied, till_depth):
+    if pd.isna(area_applied) and pd.isna(till_depth):
+        return None
+    else:
+        return till_depth
+
+
+def reference_till_passes(area_applied, reference_acreage):
+    if pd.isna(area_applied) or pd.isna(reference_acreage) or reference_acreage == 0.0:
+        return None
+    else:
+        return area_applied / reference_acreage
+
+
+def reference_tillage_practice_decision(field, till_depth, till_passes):
+    if pd.isna(till_depth) and pd.isna(till_passes):
+        return None
+    elif (
+        (till_depth > 3.0 or till_passes > 3.0)
+        or (pd.isna(till_passes) and till_depth > 3.0)
+        or (pd.isna(till_depth) and till_passes > 3.0)
+    ):
+        return "CONVENTIONAL_TILLAGE"
+    elif (
+        (3.0 >= till_depth >= 0.0 and 3.0 >= till_passes >= 1.0)
+        or (pd.isna(till_depth) and 3.0 >= till_passes >= 1.0)
+        or (3.0 >= till_depth >= 0.0 and pd.isna(till_passes))
+    ):
+        return "REDUCED_TILLAGE"
+    elif till_depth == 0 and till_passes < 1.0:
+        return "NO_TILLAGE"
+
+
+def without_na(values):
+    """Missing decisions are None or NaN depending on the inferred dtype."""
+    return values.astype(object).where(values.notna(), None)
+
+
+def random_inputs(rng: np.random.Generator, n: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Field_name": rng.choice(np.array(FIELDS, dtype=object), n),
+            "Input_type": rng.choice(["FERTILIZER", "EEF", "HERBICIDE"], n),
+            "Fertilizer_timing": rng.choice(
+                np.array(["Fall", "Fall", "Spring", "Spring", "FLAG", "NO_4R", None]),
+                n,
+            ),
+            "Operation_start": pd.to_datetime("2022-09-01")
+            + pd.to_timedelta(rng.integers(0, 120, n), unit="D"),
+            "EEF_product": rng.choice(np.array(["y", "n", "yes", None]), n),
+            "Operation_type": rng.choice(["Tillage", "Application"], n),
+            "Area_applied": np.where(rng.random(n) < 0.2, np.nan, 160 * rng.random(n)),
+            "Applied_rate": np.where(rng.random(n) < 0.3, np.nan, rng.random(n) * 6),
+        }
+    )
+
+
+def random_decisions(rng: np.random.Generator) -> pd.DataFrame:
+    fields = list(FIELDS) + ["Orchard"]
+    return pd.DataFrame(
+        {
+            "Field_name": [f for f in fields for _ in range(2)],
+            "Crop_type": rng.choice(
+                np.array(FDCIC_CROPS + ["WHEAT", None], dtype=object),
+                2 * len(fields),
+            ),
+        }
+    )
+
+
+def random_cut_offs(rng: np.random.Generator) -> dict:
+    """4R cut-off dates of the fields with location, some without cut-off."""
+    dates = [None] + [f"2022-{month}-15" for month in [9, 10, 11, 12]]
+    return {
+        field: dates[rng.integers(0, len(dates))]
+        for field in FIELDS
+        if rng.random() < 0.8
+    }
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_timing_decisions_match_per_field_reference(seed, monkeypatch):
+    rng = np.random.default_rng(seed)
+    inputs = random_inputs(rng, int(rng.integers(0, 25)))
+    decisions = random_decisions(rng)
+    cut_offs = random_cut_offs(rng)
+    requested = []
+
+    def get_start_4r_timings_by_field(grower, growing_cycle, fields):
+        requested.extend(fields)
+        return {field: cut_offs[field] for field in fields if field in cut_offs}
+
+    monkeypatch.setattr(
+        n_management, "get_start_4r_timings_by_field", get_start_4r_timings_by_field
+    )
+
+    expected = decisions.apply(
+        lambda x: reference_timing_decision_4r(x["Field_name"], inputs, cut_offs),
+        axis=1,
+    )
+    result = map_by_field(
+        decisions["Field_name"],
+        get_fertilizer_timing_decisions_4r(GROWER, GROWING_CYCLE, inputs),
+        default="NO_4R",
+    )
+
+    assert result.tolist() == expected.tolist()
+    # cut-offs are requested once, only for fields reaching the fall application
+    # branch
+    assert len(requested) == len(set(requested))
+    assert set(requested) <= set(
+        inputs[
+            inputs.Input_type.isin(["FERTILIZER", "EEF"])
+            & (inputs.Fertilizer_timing == "Fall")
+        ].Field_name
+    )
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_field_decisions_match_per_field_reference(seed):
+    rng = np.random.default_rng(seed)
+    inputs = random_inputs(rng, int(rng.integers(1, 25)))
+    decisions = random_decisions(rng)
+    report = pd.DataFrame(
+        {
+            "Field_name": rng.choice(np.array(FIELDS, dtype=object), 6),
+            "Area_coverage_percent": rng.choice([0.1, 0.5, 0.51, 0.9, np.nan], 6),
+        }
+    )
+
+    eef = map_by_field(decisions["Field_name"], get_eef_decisions(inputs))
+    assert without_na(eef).tolist() == [
+        reference_eef_decision(field, inputs) for field in decisions["Field_name"]
+    ]
+
+    for get_decisions in [get_manure_use_decisions, get_cover_crop_use_decisions]:
+        use = map_by_field(
+            decisions["Field_name"], get_decisions(report), default=False
+        )
+        assert use.tolist() == [
+            reference_use_decision(field, report) for field in decisions["Field_name"]
+        ]
+
+    major_crop_types = map_by_field(
+        decisions["Field_name"], get_major_crop_types(decisions)
+    )
+    assert without_na(major_crop_types).tolist() == [
+        reference_major_crop_type(field, decisions) for field in decisions["Field_name"]
+    ]
+
+    timing_4r = pd.Series(rng.choice(["4R", "NO_4R"], len(decisions)))
+    amount_4r = pd.Series(rng.choice(["4R", "NO_4R"], len(decisions)))
+    n_management_decisions = get_n_management_decisions(timing_4r, amount_4r, eef)
+    assert n_management_decisions.tolist() == [
+        reference_n_management_decision(*decision)
+        for decision in zip(timing_4r, amount_4r, eef)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_tillage_decisions_match_row_wise_reference(seed):
+    rng = np.random.default_rng(seed)
+    inputs = random_inputs(rng, int(rng.integers(1, 25)))
+    inputs["Reference_acreage"] = inputs.Field_name.map(
+        dict(zip(FIELDS, rng.choice([0.0, np.nan, 40.0, 80.0], len(FIELDS))))
+    )
+    decisions = random_decisions(rng).drop_duplicates(subset="Field_name")
+
+    result = add_tillage_params(decisions, inputs)
+    result["TILL_PRACTICE"] = get_tillage_practice_decisions(result)
+
+    expected = add_tillage_params(decisions, inputs)
+    expected["Till_depth"] = expected.apply(
+        lambda x: reference_till_depth(x["Area_applied"], x["Till_depth"]), axis=1
+    )
+    expected["Till_passes"] = expected.apply(
+        lambda x: reference_till_passes(x["Area_applied"], x["REFERENCE_ACREAGE"]),
+        axis=1,
+    )
+    try:
+        expected["TILL_PRACTICE"] = expected.apply(
+            lambda x: reference_tillage_practice_decision(
+                x["Field_name"], x["Till_depth"], x["Till_passes"]
+            ),
+            axis=1,
+        )
+    except TypeError:
+        # without any tillage passes (no tilled area or reference acreage) they
+        # were all None and comparing them with numbers failed
+        assert expected.Till_passes.isna().all()
+        return
+
+    pd.testing.assert_frame_equal(
+        without_na(result), without_na(expected), check_dtype=False
+    )
@@ -0,0 +1,144 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.feedstock_aggregation_scripts.data_prep.helpers import (
+    classify_ops_growing_cycle_relevant,
+)
+
+
+def reference_classify_op(
+    operation_start, operation_type, harvest_prev, harvest_curr, growing_cycle
+):
+    """The former row-wise classification `classify_ops_growing_cycle_relevant`
+    replaces."""
+    if pd.isnull(operation_start):
+        return "missing_op_date"
+
+    elif pd.isnull(harvest_prev) and pd.isnull(harvest_curr):
+        if operation_start >= datetime.strptime(
+            str(growing_cycle - 1) + "-09-01 00:00:00", "%Y-%m-%d %H:%M:%S"
+        ) and operation_start < datetime.strptime(
+            str(growing_cycle) + "-11-01 00:00:00", "%Y-%m-%d %H:%M:%S"
+        ):
+            return "likely_relevant"
+        else:
+            return "exclude"
+
+    elif pd.isnull(harvest_prev) and operation_start <= datetime.strptime(
+        str(growing_cycle - 1) + "-09-01 00:00:00", "%Y-%m-%d %H:%M:%S"
+    ):
+        return "exclude"
+
+    elif pd.isnull(harvest_curr) and operation_start >= datetime.strptime(
+        str(growing_cycle) + "-11-01 00:00:00", "%Y-%m-%d %H:%M:%S"
+    ):
+        return "exclude"
+
+    elif pd.isnull(harvest_prev) and operation_start <= harvest_curr:
+        return "likely_relevant"
+
+    elif operation_start == harvest_prev:
+        return "exclude"
+
+    elif (
+        operation_start >= harvest_prev
+        and operation_type != "Harvest"
+        and pd.isnull(harvest_curr)
+    ):
+        return "likely_relevant"
+
+    elif (
+        operation_start >= harvest_prev
+        and operation_type != "Harvest"
+        and operation_start <= harvest_curr
+    ):
+        return "relevant"
+
+    elif (
+        operation_start > harvest_prev
+        and operation_type == "Harvest"
+        and operation_start <= harvest_curr
+    ):
+        return "relevant"
+
+    elif operation_start < harvest_prev or operation_start > harvest_curr:
+        return "exclude"
+
+
+GROWING_CYCLE = 2023
+# the cut-offs and dates right next to them
+BOUNDARIES = [
+    datetime(GROWING_CYCLE - 1, 9, 1) + offset
+    for offset in [timedelta(0), timedelta(seconds=-1), timedelta(seconds=1)]
+] + [
+    datetime(GROWING_CYCLE, 11, 1) + offset
+    for offset in [timedelta(0), timedelta(seconds=-1), timedelta(seconds=1)]
+]
+
+
+@st.composite
+def operations(draw):
+    # dates are drawn from a small shared pool so equal start and harvest dates
+    # are common
+    pool = draw(
+        st.lists(
+            st.datetimes(
+                min_value=datetime(GROWING_CYCLE - 2, 6, 1),
+                max_value=datetime(GROWING_CYCLE + 1, 6, 1),
+            )
+            | st.sampled_from(BOUNDARIES),
+            min_size=1,
+            max_size=6,
+        )
+    )
+    date = st.sampled_from(pool) | st.none()
+    rows = draw(
+        st.lists(
+            st.tuples(
+                date,
+                st.sampled_from(["Harvest", "Application", "Tillage", None]),
+                date,
+                date,
+            ),
+            min_size=1,
+            max_size=30,
+        )
+    )
+    return pd.DataFrame(
+        rows,
+        columns=["Operation_start", "Operation_type", "Harvest_prev", "Harvest_curr"],
+    ).astype(
+        {
+            "Operation_start": "datetime64[ns]",
+            "Harvest_prev": "datetime64[ns]",
+            "Harvest_curr": "datetime64[ns]",
+        }
+    )
+
+
+@settings(max_examples=300, deadline=None)
+@given(ops=operations(), growing_cycle=st.sampled_from([2022, 2023, 2024]))
+def test_classification_matches_row_wise_reference(ops, growing_cycle):
+    expected = ops.apply(
+        lambda row: reference_classify_op(
+            row.Operation_start,
+            row.Operation_type,
+            row.Harvest_prev,
+            row.Harvest_curr,
+            growing_cycle,
+        ),
+        axis=1,
+    )
+
+    result = classify_ops_growing_cycle_relevant(
+        ops.Operation_start,
+        ops.Operation_type,
+        ops.Harvest_prev,
+        ops.Harvest_curr,
+        growing_cycle,
+    )
+
+    assert result.tolist() == expected.tolist()
@@ -0,0 +1,104 @@
+import uuid
+
+import fsspec
+import pytest
+
+from data_aggregators.listing import ListingIndex
+
+FILES = [
+    "raw/grower_a/2023/Field_application_@grower_a.csv",
+    "raw/grower_a/2023/efr_data_harvest.json",
+    "raw/grower_a/2024/Granular_harvest_2024.csv",
+    "raw/grower_b/2023/data_template_planting.xlsx",
+    "raw/readme.txt",
+    "mapping/units.csv",
+]
+
+
+@pytest.fixture
+def fs(monkeypatch):
+    """Memory filesystem with `FILES` below a bucket of its own, counting `ls`
+    and `find` calls."""
+    fs = fsspec.filesystem("memory")
+    bucket = f"/bucket-{uuid.uuid4().hex}"
+    for file in FILES:
+        fs.pipe(f"{bucket}/{file}", b"data")
+
+    calls = {"ls": 0, "find": 0}
+    for method in calls:
+        original = getattr(fs, method)
+
+        def counted(*args, method=method, original=original, **kwargs):
+            calls[method] += 1
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(fs, method, counted)
+
+    fs.bucket, fs.calls = bucket, calls
+    yield fs
+    fs.rm(bucket, recursive=True)
+
+
+def listed(fs, path: str) -> list:
+    return [p.rstrip("/") for p in fs.ls(path, detail=False)]
+
+
+@pytest.mark.parametrize(
+    "folder", ["raw", "raw/grower_a", "raw/grower_a/2023", "mapping"]
+)
+def test_ls_is_listed_once(fs, folder):
+    index = ListingIndex()
+    path = f"{fs.bucket}/{folder}"
+    expected = listed(fs, path)
+    fs.calls["ls"] = 0
+
+    first = index.ls(fs, path)
+    # trailing slashes and protocols name the same folder
+    second = index.ls(fs, f"memory://{path}/")
+
+    assert sorted(first) == sorted(expected)
+    assert second == first
+    assert fs.calls["ls"] == 1
+
+
+def test_prefetch_serves_all_folders_below_prefix(fs):
+    index = ListingIndex()
+    folders = ["raw", "raw/grower_a", "raw/grower_a/2023", "raw/grower_a/2024"]
+    folders += ["raw/grower_b", "raw/grower_b/2023"]
+    expected = {f: sorted(listed(fs, f"{fs.bucket}/{f}")) for f in folders}
+    fs.calls["ls"] = 0
+
+    index.prefetch(fs, f"{fs.bucket}/raw")
+
+    assert {f: index.ls(fs, f"{fs.bucket}/{f}") for f in folders} == expected
+    assert fs.calls == {"ls": 0, "find": 1}
+
+
+def test_prefetch_missing_folder_raises_without_listing(fs):
+    index = ListingIndex()
+    index.prefetch(fs, f"{fs.bucket}/raw")
+    fs.calls["ls"] = 0
+
+    with pytest.raises(FileNotFoundError):
+        index.ls(fs, f"{fs.bucket}/raw/grower_c")
+    assert fs.calls["ls"] == 0
+
+
+def test_folders_outside_prefix_are_listed(fs):
+    index = ListingIndex()
+    index.prefetch(fs, f"{fs.bucket}/raw")
+
+    assert index.ls(fs, f"{fs.bucket}/mapping") == [f"{fs.bucket}/mapping/units.csv"]
+    assert fs.calls["ls"] == 1
+
+
+def test_clear_lists_again(fs):
+    index = ListingIndex()
+    index.prefetch(fs, f"{fs.bucket}/raw")
+    index.clear()
+    fs.pipe(f"{fs.bucket}/raw/grower_c/2023/new.csv", b"data")
+
+    assert index.ls(fs, f"{fs.bucket}/raw/grower_c/2023") == [
+        f"{fs.bucket}/raw/grower_c/2023/new.csv"
+    ]
+    assert fs.calls["ls"] == 1
@@ -0,0 +1,107 @@
+import threading
+import time
+import uuid
+
+import fsspec
+import pandas as pd
+import pytest
+
+from data_aggregators import files
+from data_aggregators.files import DataFile
+
+
+class CsvFile(DataFile):
+    """Raw export with one operation per csv row."""
+
+    @classmethod
+    def read_file(cls, file_path: str) -> pd.DataFrame:
+        return super(CsvFile, cls).read_file(file_path=file_path)
+
+    @classmethod
+    def from_file(cls, file_path: str) -> "CsvFile":
+        file = cls(file_name=file_path)
+        for operation in cls.read_file(file_path).to_dict("records"):
+            file.add_operation(operation)
+        return file
+
+    @classmethod
+    def frame_from_file(cls, file_path: str) -> pd.DataFrame:
+        return cls.read_file(file_path)
+
+
+@pytest.fixture
+def fs(monkeypatch):
+    """Memory filesystem standing in for GCS (without the raw data cache), reads
+    of earlier files take longer and the number of concurrent reads is tracked."""
+    fs = fsspec.filesystem("memory")
+    bucket = f"/bucket-{uuid.uuid4().hex}"
+    fs.bucket = bucket
+    fs.reads = {"running": 0, "peak": 0}
+    lock = threading.Lock()
+    open_file = fs.open
+
+    def slow_open(path, *args, **kwargs):
+        with lock:
+            fs.reads["running"] += 1
+            fs.reads["peak"] = max(fs.reads["peak"], fs.reads["running"])
+        # the first file finishes last
+        time.sleep(0.02 * (9 - int(path[-5])))
+        with lock:
+            fs.reads["running"] -= 1
+        return open_file(path, *args, **kwargs)
+
+    monkeypatch.setattr(fs, "open", slow_open)
+    monkeypatch.setattr(files, "GOOGLE_CLOUD_FILE_SYSTEM", fs)
+    monkeypatch.setattr(files, "RAW_DATA_CACHE", None)
+    yield fs
+    fs.rm(bucket, recursive=True)
+
+
+def write_exports(fs, n: int, broken=()) -> list:
+    paths = []
+    for i in range(n):
+        path = f"{fs.bucket}/raw/export_{i}.csv"
+        # empty files cannot be parsed as csv
+        content = "" if i in broken else f"Field,Row\nfield_{i},0\nfield_{i},1\n"
+        fs.pipe(path, content.encode())
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("max_workers", [1, 3, 8])
+def test_results_keep_file_order(fs, max_workers):
+    paths = write_exports(fs, 6)
+
+    frame = CsvFile.load_files(paths, columnar=True, max_workers=max_workers)
+    operations = CsvFile.load_files(paths, max_workers=max_workers)
+
+    expected = [f"field_{i}" for i in range(6) for _ in range(2)]
+    assert frame.Field.tolist() == expected
+    assert [operation["Field"] for operation in operations] == expected
+    assert frame.Row.tolist() == [0, 1] * 6
+    if max_workers == 1:
+        assert fs.reads["peak"] == 1
+    else:
+        assert 1 < fs.reads["peak"] <= max_workers
+
+
+@pytest.mark.parametrize("columnar", [True, False])
+def test_failed_files_are_skipped(fs, columnar, caplog):
+    paths = write_exports(fs, 6, broken={1, 4})
+
+    result = CsvFile.load_files(
+        paths, columnar=columnar, skip_failed=True, max_workers=4
+    )
+
+    fields = result.Field if columnar else [op["Field"] for op in result]
+    assert list(fields) == [f"field_{i}" for i in [0, 0, 2, 2, 3, 3, 5, 5]]
+    errors = [r.getMessage() for r in caplog.records if r.levelname == "ERROR"]
+    assert len(errors) == 2
+    assert paths[1] in errors[0] and paths[4] in errors[1]
+
+
+def test_failed_file_raises_without_skip(fs):
+    paths = write_exports(fs, 4, broken={2})
+
+    with pytest.raises(pd.errors.EmptyDataError):
+        CsvFile.load_files(paths, columnar=True, max_workers=4)
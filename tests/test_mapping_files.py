@@ -0,0 +1,201 @@
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+from data_aggregators.files import (
+    CoverCropTable,
+    FieldNameMapping,
+    ProductNameMapping,
+    UnitConversionTable,
+    UnitNameMapping,
+)
+from data_aggregators.schema import (
+    CoverCropTableData,
+    FieldNameMappingData,
+    ProductNameMappingData,
+    UnitConversionTableData,
+    UnitNameMappingData,
+)
+
+
+def field_entry(farm_name, name, clear_name):
+    return FieldNameMappingData(
+        system="JDOps",
+        farm_name=farm_name,
+        name=name,
+        system_acres=80.0,
+        clear_name=clear_name,
+        clear_acres=None,
+    )
+
+
+@pytest.fixture
+def field_mapping():
+    mapping = FieldNameMapping(file_name="field_name_mapping.csv", grower="DUMMY")
+    for entry in [
+        field_entry(None, "North", "North 80"),
+        field_entry("Circle F", "North", "Circle F North"),
+        field_entry("Circle F", "North", "shadowed by the first entry"),
+        field_entry("Circle F", "South", "Circle F South"),
+        field_entry("Hilltop", "East", "Hilltop East"),
+    ]:
+        mapping.add_entry(entry)
+    return mapping
+
+
+def assert_rows_match(result: pd.DataFrame, expected: list):
+    """`result` rows equal the `query_entry` results, all-NaN rows for misses."""
+    assert len(result) == len(expected)
+    for (_, row), entry in zip(result.iterrows(), expected):
+        if entry is None:
+            assert row.isna().all()
+        else:
+            row = row.astype(object)
+            assert row.where(row.notna(), None).to_dict() == entry.model_dump()
+
+
+def test_field_names_are_aligned_with_query_entry(field_mapping):
+    field_names = pd.Series(
+        ["North", "North", "South", "South", "East", "West", "North"],
+        index=[7, 3, 11, 0, 5, 2, 9],
+    )
+    farm_names = pd.Series(
+        [None, "Circle F", None, "Hilltop", np.nan, None, "Hilltop"],
+        index=field_names.index,
+    )
+
+    result = field_mapping.query_many(field_names, farm_names)
+
+    assert (result.index == field_names.index).all()
+    assert_rows_match(
+        result,
+        [
+            field_mapping.query_entry(name, farm, verbose=False)
+            for name, farm in zip(field_names, farm_names)
+        ],
+    )
+    assert result.clear_name.tolist()[:3] == [
+        "North 80",
+        "Circle F North",
+        # without farm name the first entry of that field name
+        "Circle F South",
+    ]
+    # with a farm name only the pair matches
+    assert result.loc[[0, 9]].clear_name.isna().all()
+
+
+def test_field_names_without_farm_names(field_mapping):
+    field_names = pd.Series(["North", "South", "West"])
+
+    result = field_mapping.query_many(field_names)
+
+    assert result.clear_name.tolist()[:2] == ["North 80", "Circle F South"]
+    assert_rows_match(
+        result, [field_mapping.query_entry(name, verbose=False) for name in field_names]
+    )
+
+
+def test_misses_are_logged_once(field_mapping, caplog):
+    field_names = pd.Series(["West", "North", "West", "Creek", "South"])
+    farm_names = pd.Series([None, "Hilltop", None, None, None])
+
+    with caplog.at_level(logging.WARNING):
+        field_mapping.query_many(field_names, farm_names)
+
+    assert len(caplog.records) == 1
+    message = caplog.records[0].getMessage()
+    assert "FieldNameMapping" in message
+    assert "4 of 5 queries (3 unique)" in message
+    assert "Creek" in message
+
+
+@pytest.mark.parametrize(
+    "mapping, entries, queries",
+    [
+        pytest.param(
+            ProductNameMapping(file_name="products.csv"),
+            [
+                ProductNameMappingData(name="0-0-60 ", clear_name="Potash"),
+                ProductNameMappingData(name="UAN28", clear_name="UAN 28"),
+                ProductNameMappingData(name="UAN28", clear_name="shadowed"),
+            ],
+            ["UAN28", "Urea", "0-0-60 ", np.nan, "UAN28"],
+            id="products",
+        ),
+        pytest.param(
+            CoverCropTable(file_name="cover_crops.csv"),
+            [
+                CoverCropTableData(
+                    Cover_crop_type="Rye",
+                    N_content_above=1.0,
+                    N_content_below=0.5,
+                    N_content_total=1.5,
+                    Yield_mt_per_hectare=None,
+                ),
+            ],
+            ["Oats", "Rye"],
+            id="cover crops",
+        ),
+        pytest.param(
+            UnitNameMapping(file_name="unit_mapping_table.csv"),
+            [
+                UnitNameMappingData(
+                    unit="floz", clear_unit="FL_OZ", system=None, comment=None
+                ),
+                UnitNameMappingData(
+                    unit="lb", clear_unit="LBS", system="JD", comment=None
+                ),
+            ],
+            ["lb", "FLOZ", "floz", "gal"],
+            id="units",
+        ),
+        pytest.param(
+            UnitConversionTable(file_name="unit_conversions.csv"),
+            [
+                UnitConversionTableData(
+                    unit="fl_oz",
+                    target_unit="GAL",
+                    conversion_factor=0.0078125,
+                    comment=None,
+                ),
+                UnitConversionTableData(
+                    unit="ton", target_unit="LBS", conversion_factor=2000, comment=None
+                ),
+            ],
+            # conversion units are matched lowercased
+            ["FL_OZ", "ton", "kg", np.nan, "fl_oz"],
+            id="unit conversions",
+        ),
+    ],
+)
+def test_query_many_is_aligned_with_query_entry(mapping, entries, queries):
+    for entry in entries:
+        mapping.add_entry(entry)
+    queries = pd.Series(queries, index=range(10, 10 + len(queries)), dtype=object)
+
+    result = mapping.query_many(queries)
+
+    assert (result.index == queries.index).all()
+    assert list(result.columns) == list(entries[0].model_dump())
+    assert_rows_match(
+        result,
+        [
+            (
+                mapping.query_entry(query, verbose=False)
+                if isinstance(query, str)
+                else None
+            )
+            for query in queries
+        ],
+    )
+
+
+def test_indexes_are_reset_by_new_entries(field_mapping):
+    assert field_mapping.query_many(pd.Series(["West"])).clear_name.isna().all()
+
+    field_mapping.add_entry(field_entry(None, "West", "West 40"))
+
+    assert field_mapping.query_many(pd.Series(["West"])).clear_name.tolist() == [
+        "West 40"
+    ]
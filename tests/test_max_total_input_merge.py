@@ -0,0 +1,281 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.feedstock_aggregation_scripts.ci_prep.helpers import clean_input_type
+from src.feedstock_aggregation_scripts.ci_prep.max_total_input_merge.applications import (
+    create_comprehensive_apps_from_cleaned_files,
+)
+from src.feedstock_aggregation_scripts.ci_prep.max_total_input_merge.harvest import (
+    create_comprehensive_harvest_from_cleaned_files,
+)
+from src.feedstock_aggregation_scripts.ci_prep.max_total_input_merge.tillage import (
+    create_comprehensive_tillage_from_cleaned_files,
+)
+from src.feedstock_aggregation_scripts.util.conversion import convert_quantity_by_unit
+
+# Reference: the pairwise merges `select_max_total` replaces
+
+
+def reference_apps_list(source_1: pd.DataFrame, source_2: pd.DataFrame):
+    if not source_1.empty:
+        temp = pd.concat(
+            [
+                pd.Series(source_1.Field_name.unique()),
+                pd.Series(source_2.Field_name.unique()),
+            ]
+        )
+    else:
+        temp = pd.Series(source_2.Field_name.unique(), name="Field_name")
+    fields = temp.unique()
+
+    source_1 = source_1.drop_duplicates(ignore_index=True)
+    source_2 = source_2.drop_duplicates(ignore_index=True)
+    df = pd.DataFrame(columns=source_1.columns.to_list())
+
+    for field in fields:
+        source_1_t = source_1[(source_1.Field_name == field)]
+        source_2_t = source_2[(source_2.Field_name == field)]
+        temp = pd.concat(
+            [
+                pd.Series(source_1_t.Product.unique()),
+                pd.Series(source_2_t.Product.unique()),
+            ]
+        )
+        for product in temp.unique():
+            source_1_tp = source_1_t[(source_1_t.Product == product)]
+            source_2_tp = source_2_t[(source_2_t.Product == product)]
+            source_1_q = source_1_tp.Applied_total.sum()
+            source_2_q = source_2_tp.Applied_total.sum()
+
+            if (source_1_q == 0 or np.isnan(source_1_q)) and source_2_q > 0:
+                df = pd.concat([df, source_2_tp])
+            elif (source_2_q == 0 or np.isnan(source_2_q)) and source_1_q > 0:
+                df = pd.concat([df, source_1_tp])
+            elif source_2_q == source_1_q == 0:
+                pass
+            else:
+                source_1_u = source_1_tp.Applied_unit.iloc[0]
+                source_2_u = source_2_tp.Applied_unit.iloc[0]
+                if source_1_u != source_2_u:
+                    source_1_q, source_1_u = convert_quantity_by_unit(
+                        source_1_q, source_1_u
+                    )
+                    source_2_q, source_2_u = convert_quantity_by_unit(
+                        source_2_q, source_2_u
+                    )
+                df = (
+                    pd.concat([df, source_1_tp])
+                    if source_1_q > source_2_q
+                    else pd.concat([df, source_2_tp])
+                )
+    return df
+
+
+def reference_harvest_list(source_1: pd.DataFrame, source_2: pd.DataFrame):
+    temp = pd.concat(
+        [
+            pd.Series(source_1.Field_name.unique()),
+            pd.Series(source_2.Field_name.unique()),
+        ]
+    )
+    fields = temp.unique()
+
+    source_1 = source_1.drop_duplicates(ignore_index=True)
+    source_2 = source_2.drop_duplicates(ignore_index=True)
+    df = pd.DataFrame(columns=source_1.columns.to_list())
+
+    for field in fields:
+        source_1_t = source_1[
+            (source_1["Field_name"] == field)
+            & (source_1["Operation_type"] == "Harvest")
+        ]
+        source_2_t = source_2[
+            (source_2["Field_name"] == field)
+            & (source_2["Operation_type"] == "Harvest")
+        ]
+        temp = pd.concat(
+            [
+                pd.Series(source_1_t["Crop_type"].unique()),
+                pd.Series(source_2_t["Crop_type"].unique()),
+            ]
+        )
+        for crop in temp.unique():
+            source_1_tc = source_1_t[(source_1_t["Crop_type"] == crop)]
+            source_2_tc = source_2_t[(source_2_t["Crop_type"] == crop)]
+            source_1_aa = (
+                float("NaN")
+                if source_1_tc.empty
+                else source_1_tc["Total_dry_yield"].sum()
+            )
+            source_2_aa = (
+                float("NaN")
+                if source_2_tc.empty
+                else source_2_tc["Total_dry_yield"].sum()
+            )
+
+            if (source_1_aa == 0 or np.isnan(source_1_aa)) and source_2_aa > 0:
+                df = pd.concat([df, source_2_tc])
+            elif (source_2_aa == 0 or np.isnan(source_2_aa)) and source_1_aa > 0:
+                df = pd.concat([df, source_1_tc])
+            elif source_2_aa == source_1_aa == 0:
+                pass
+            else:
+                df = (
+                    pd.concat([df, source_1_tc])
+                    if source_1_aa > source_2_aa
+                    else pd.concat([df, source_2_tc])
+                )
+    return df
+
+
+def reference_tillage_list(source_1: pd.DataFrame, source_2: pd.DataFrame):
+    temp = pd.concat(
+        [
+            pd.Series(source_1.Field_name.unique()),
+            pd.Series(source_2.Field_name.unique()),
+        ]
+    )
+    fields = temp.unique()
+
+    source_1 = source_1.drop_duplicates(ignore_index=True)
+    source_2 = source_2.drop_duplicates(ignore_index=True)
+    df = pd.DataFrame(columns=source_1.columns.to_list())
+
+    for field in fields:
+        source_1_t = source_1[
+            (source_1.Field_name == field) & (source_1.Operation_type == "Tillage")
+        ]
+        source_2_t = source_2[
+            (source_2.Field_name == field) & (source_2.Operation_type == "Tillage")
+        ]
+        source_1_aa = source_1_t.Area_applied.sum()
+        source_2_aa = source_2_t.Area_applied.sum()
+
+        if (source_1_aa == 0 or np.isnan(source_1_aa)) and source_2_aa > 0:
+            df = pd.concat([df, source_2_t])
+        elif (source_2_aa == 0 or np.isnan(source_2_aa)) and source_1_aa > 0:
+            df = pd.concat([df, source_1_t])
+        elif source_2_aa == source_1_aa == 0:
+            pass
+        else:
+            df = (
+                pd.concat([df, source_1_t])
+                if source_1_aa > source_2_aa
+                else pd.concat([df, source_2_t])
+            )
+    return df
+
+
+def reference_apps(cleaned_files: dict) -> pd.DataFrame:
+    comp_inputs = pd.DataFrame(
+        columns=[
+            "Data_source",
+            "Field_name",
+            "Product",
+            "Applied_total",
+            "Applied_unit",
+        ]
+    )
+    for name, file in cleaned_files.items():
+        if name != "PAP" and not file.empty:
+            comp_inputs = reference_apps_list(comp_inputs, file)
+    if "PAP" in cleaned_files:
+        comp_inputs = pd.concat([comp_inputs, cleaned_files["PAP"]], ignore_index=True)
+    if not comp_inputs.empty:
+        comp_inputs = clean_input_type(comp_inputs)
+        comp_inputs.Growing_cycle = comp_inputs.Growing_cycle.astype(int)
+    return comp_inputs.reset_index(drop=True)
+
+
+def reference_fold(merge, columns: list, cleaned_files: dict) -> pd.DataFrame:
+    comp_inputs = pd.DataFrame(columns=columns)
+    for file in cleaned_files.values():
+        comp_inputs = merge(comp_inputs, file)
+    return clean_input_type(comp_inputs).reset_index(drop=True)
+
+
+def reference_harvest(cleaned_files: dict) -> pd.DataFrame:
+    columns = [
+        "Data_source",
+        "Field_name",
+        "Operation_type",
+        "Total_dry_yield",
+        "Crop_type",
+    ]
+    return reference_fold(reference_harvest_list, columns, cleaned_files)
+
+
+def reference_tillage(cleaned_files: dict) -> pd.DataFrame:
+    columns = [
+        "Data_source",
+        "Field_name",
+        "Operation_type",
+        "Area_applied",
+        "Applied_rate",
+    ]
+    return reference_fold(reference_tillage_list, columns, cleaned_files)
+
+
+def random_cleaned_files(seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+
+    def choice(values, n):
+        return [values[i] for i in rng.integers(0, len(values), n)]
+
+    files = {}
+    for name in ["CFV", "JDOPS", "GRANULAR", "PAP"][: rng.integers(1, 5)]:
+        n = int(rng.integers(0, 25))
+        files[name] = pd.DataFrame(
+            {
+                "Data_source": name,
+                "Field_name": choice(["North", "South", "East", "West", np.nan], n),
+                "Operation_type": choice(["Application", "Harvest", "Tillage"], n),
+                "Product": choice(["UAN", "Urea", "Potash", "Atrazine", np.nan], n),
+                "Crop_type": choice(["CORN", "SOYBEANS", np.nan], n),
+                "Applied_total": choice([0, np.nan, 1, 2.5, 10, 40, 160], n),
+                "Applied_unit": choice(["GAL", "LBS", "oz", "qt", "ton", np.nan], n),
+                "Total_dry_yield": choice([0, np.nan, 50, 120, 200], n),
+                "Area_applied": choice([0, np.nan, 20, 80, 160], n),
+                "Applied_rate": choice([0, 1.5, 3], n),
+                "Growing_cycle": 2023,
+            },
+            columns=[
+                "Data_source",
+                "Field_name",
+                "Operation_type",
+                "Product",
+                "Crop_type",
+                "Applied_total",
+                "Applied_unit",
+                "Total_dry_yield",
+                "Area_applied",
+                "Applied_rate",
+                "Growing_cycle",
+            ],
+        )
+    return files
+
+
+@pytest.mark.parametrize(
+    "merge, reference",
+    [
+        (create_comprehensive_apps_from_cleaned_files, reference_apps),
+        (create_comprehensive_harvest_from_cleaned_files, reference_harvest),
+        (create_comprehensive_tillage_from_cleaned_files, reference_tillage),
+    ],
+    ids=["applications", "harvest", "tillage"],
+)
+@pytest.mark.parametrize("seed", range(100))
+def test_merge_matches_pairwise_reference(merge, reference, seed, unit_conversions):
+    cleaned_files = random_cleaned_files(seed)
+
+    expected = reference({k: v.copy() for k, v in cleaned_files.items()})
+    result = merge({k: v.copy() for k, v in cleaned_files.items()})
+
+    if expected.empty:
+        # without any selected rows the pairwise merge only keeps its own columns
+        assert result.empty
+    else:
+        # same rows in the same order
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from pandas import isna
+
+from src.feedstock_aggregation_scripts.ci_prep.helpers import get_datetime
+from src.feedstock_aggregation_scripts.ci_prep.n_management import (
+    add_fertilizer_timing_categorization_4r,
+)
+
+GROWING_CYCLES = [2022, 2023, 2024]
+
+
+def reference_categorize_fertilizer_timing_4r(
+    input_type, operation_start, operation_end, growing_cycle
+):
+    """The former row-wise `categorize_fertilizer_timing_4r`."""
+    if input_type != "FERTILIZER":
+        return None
+
+    if (
+        get_datetime(growing_cycle - 1, month=9, day=1)
+        <= operation_start
+        < get_datetime(growing_cycle, 1, 1)
+        and get_datetime(growing_cycle - 1, 9, 1)
+        <= operation_end
+        < get_datetime(growing_cycle, 1, 1)
+        or get_datetime(growing_cycle - 1, 9, 1)
+        <= operation_start
+        < get_datetime(growing_cycle, 1, 1)
+        and isna(operation_end)
+    ):
+        return "Fall"
+
+    elif (
+        get_datetime(growing_cycle, month=3, day=1)
+        <= operation_start
+        < get_datetime(growing_cycle, 7, 1)
+        and get_datetime(growing_cycle, 3, 1)
+        <= operation_end
+        < get_datetime(growing_cycle, 7, 1)
+        or get_datetime(growing_cycle, 3, 1)
+        <= operation_start
+        < get_datetime(growing_cycle, 7, 1)
+        and isna(operation_end)
+    ):
+        return "Spring"
+
+    elif (
+        get_datetime(growing_cycle, month=1, day=1)
+        <= operation_start
+        < get_datetime(growing_cycle, 3, 1)
+        and get_datetime(growing_cycle, 1, 1)
+        <= operation_end
+        < get_datetime(growing_cycle, 3, 1)
+        or get_datetime(growing_cycle, 1, 1)
+        <= operation_start
+        < get_datetime(growing_cycle, 3, 1)
+        and isna(operation_end)
+    ):
+        return "FLAG"
+
+    else:
+        return "NO_4R"
+
+
+# the window bounds of all growing cycles and the dates right next to them
+BOUNDARIES = [
+    bound + offset
+    for cycle in GROWING_CYCLES
+    for bound in [
+        datetime(cycle - 1, 9, 1),
+        datetime(cycle, 1, 1),
+        datetime(cycle, 3, 1),
+        datetime(cycle, 7, 1),
+    ]
+    for offset in [timedelta(0), timedelta(seconds=-1), timedelta(seconds=1)]
+]
+
+
+@st.composite
+def fertilizer_inputs(draw):
+    # dates are drawn from a small shared pool so operations often start and end in
+    # the same window
+    pool = draw(
+        st.lists(
+            st.datetimes(
+                min_value=datetime(min(GROWING_CYCLES) - 2, 6, 1),
+                max_value=datetime(max(GROWING_CYCLES) + 1, 6, 1),
+            )
+            | st.sampled_from(BOUNDARIES),
+            min_size=1,
+            max_size=6,
+        )
+    )
+    date = st.sampled_from(pool) | st.none()
+    rows = draw(
+        st.lists(
+            st.tuples(
+                st.sampled_from(["FERTILIZER", "EEF", "HERBICIDE", None]),
+                date,
+                date,
+                st.sampled_from(GROWING_CYCLES),
+            ),
+            min_size=1,
+            max_size=30,
+        )
+    )
+    return pd.DataFrame(
+        rows,
+        columns=["Input_type", "Operation_start", "Operation_end", "Growing_cycle"],
+    ).astype({"Operation_start": "datetime64[ns]", "Operation_end": "datetime64[ns]"})
+
+
+@settings(max_examples=300, deadline=None)
+@given(inputs=fertilizer_inputs(), growing_cycle=st.sampled_from(GROWING_CYCLES))
+def test_timing_categorization_matches_row_wise_reference(inputs, growing_cycle):
+    expected = inputs.apply(
+        lambda x: reference_categorize_fertilizer_timing_4r(
+            x.Input_type, x.Operation_start, x.Operation_end, growing_cycle
+        ),
+        axis=1,
+    )
+
+    result = add_fertilizer_timing_categorization_4r(inputs.copy(), growing_cycle)
+
+    assert result.Fertilizer_timing.tolist() == expected.tolist()
+
+
+@settings(max_examples=300, deadline=None)
+@given(inputs=fertilizer_inputs())
+def test_timing_categorization_per_growing_cycle(inputs):
+    expected = inputs.apply(
+        lambda x: reference_categorize_fertilizer_timing_4r(
+            x.Input_type, x.Operation_start, x.Operation_end, x.Growing_cycle
+        ),
+        axis=1,
+    )
+
+    result = add_fertilizer_timing_categorization_4r(inputs.copy())
+
+    assert result.Fertilizer_timing.tolist() == expected.tolist()
@@ -0,0 +1,367 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.feedstock_aggregation_scripts.bulk_to_excel.npk import (
+    GREET_ELEMENT_COLS,
+    get_greet_elements,
+)
+from src.feedstock_aggregation_scripts.ci_prep.excel_api import npk_extraction
+from src.feedstock_aggregation_scripts.ci_prep.excel_api.npk_extraction import (
+    calculate_inputs_by_row,
+    extract_product_breakdown_info,
+)
+from src.feedstock_aggregation_scripts.data_prep.npk_breakdowns import (
+    FERT_LIST_FILE,
+    get_fert_list,
+    get_NPK_rate,
+)
+from src.feedstock_aggregation_scripts.util.conversion import convert_quantity_by_unit
+
+PRODUCTS = ["UAN 28", "Urea", "Potash", "Roundup", "Warrior", "Ag Lime", "Unknown"]
+PRODUCT_TYPES = {
+    "UAN 28": "Fertilizer",
+    "Urea": "EEF",
+    "Potash": "Fertilizer",
+    "Roundup": "Herbicide",
+    "Warrior": "INSECTICIDE",
+    "Ag Lime": "Lime",
+}
+BREAKDOWN_COLS = GREET_ELEMENT_COLS + ["% N", "% P2O5", "% K2O", "lbs AI / gal"]
+
+
+def random_breakdowns(rng: np.random.Generator) -> pd.DataFrame:
+    """Breakdowns of all known products but "Unknown", some of them twice and some
+    without product type, with missing percentages and densities."""
+    names = list(PRODUCT_TYPES) + list(rng.choice(list(PRODUCT_TYPES), 4))
+    n = len(names)
+
+    def values(n):
+        return np.where(rng.random(n) < 0.2, np.nan, rng.integers(0, 100, n) / 100)
+
+    breakdowns = pd.DataFrame(
+        {
+            "product_name": names + [np.nan],
+            "product_state": "Liquid",
+            "product_type": [PRODUCT_TYPES[name] for name in names] + ["Fertilizer"],
+            **{col: values(n + 1) for col in BREAKDOWN_COLS},
+            "lbs / gal": np.where(
+                rng.random(n + 1) < 0.2, np.nan, 10 * rng.random(n + 1)
+            ),
+            "EEF product (y/n) - Fert only": "n",
+        }
+    )
+    breakdowns.loc[rng.random(n + 1) < 0.15, "product_type"] = np.nan
+    return breakdowns.iloc[rng.permutation(n + 1)].reset_index(drop=True)
+
+
+# Reference: the row-wise `bulk_to_excel.npk.get_greet_element`
+
+
+def reference_greet_element(
+    product, element, total, unit, reference_acreage, fert_list
+):
+    temp = fert_list[fert_list.product_name == product]
+    if temp.empty:
+        return float(np.nan)
+    n = temp[element].iloc[0] if not np.isnan(temp[element].iloc[0]) else 0
+    conversion = (
+        temp["lbs / gal"].iloc[0] if not np.isnan(temp["lbs / gal"].iloc[0]) else 0
+    )
+    total, _ = convert_quantity_by_unit(total, unit)
+    return n * conversion * total / reference_acreage
+
+
+def reference_greet_elements(bulk, breakdown_list) -> np.ndarray:
+    return np.column_stack(
+        [
+            bulk.apply(
+                lambda x: reference_greet_element(
+                    x["INPUT_NAME"],
+                    element,
+                    x["INPUT_RATE"],
+                    x["INPUT_UNIT"],
+                    x["REFERENCE_ACREAGE"],
+                    breakdown_list,
+                ),
+                axis=1,
+            ).to_numpy(dtype=float)
+            for element in GREET_ELEMENT_COLS
+        ]
+    )
+
+
+def random_bulk(rng: np.random.Generator, n: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "INPUT_NAME": rng.choice(PRODUCTS, n),
+            "INPUT_RATE": np.where(rng.random(n) < 0.1, np.nan, 50 * rng.random(n)),
+            "INPUT_UNIT": rng.choice(
+                np.array(["oz", "qt", "ton", "LBS", "GAL", np.nan], dtype=object), n
+            ),
+            "REFERENCE_ACREAGE": rng.choice([np.nan, 1.5, 80.0, 160.0], n),
+        },
+        index=rng.permutation(n) + 10,
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_greet_elements_match_row_wise_reference(seed, unit_conversions):
+    rng = np.random.default_rng(seed)
+    breakdowns = random_breakdowns(rng)
+    bulk = random_bulk(rng, 30)
+
+    np.testing.assert_array_equal(
+        get_greet_elements(bulk, breakdowns),
+        reference_greet_elements(bulk, breakdowns),
+    )
+
+
+def test_greet_elements_zero_acreage(unit_conversions):
+    breakdowns = pd.DataFrame(
+        {
+            "product_name": ["UAN 28", "Urea"],
+            **{col: [0.5, np.nan] for col in GREET_ELEMENT_COLS},
+            "lbs / gal": [10.0, np.nan],
+        }
+    )
+    bulk = pd.DataFrame(
+        {
+            "INPUT_NAME": ["UAN 28", "UAN 28", "Unknown"],
+            "INPUT_RATE": [10.0, 0.0, 10.0],
+            "INPUT_UNIT": ["GAL", "GAL", "GAL"],
+            "REFERENCE_ACREAGE": [0.0, 0.0, 0.0],
+        }
+    )
+
+    elements = get_greet_elements(bulk, breakdowns)
+
+    np.testing.assert_array_equal(elements, reference_greet_elements(bulk, breakdowns))
+    assert np.isinf(elements[0]).all()
+    assert np.isnan(elements[1:]).all()
+
+    # without percentage and density the scalar version divided Python numbers and
+    # raised, now it is NaN like other zero rates
+    urea = bulk.iloc[:1].assign(INPUT_NAME="Urea")
+    with pytest.raises(ZeroDivisionError):
+        reference_greet_elements(urea, breakdowns)
+    assert np.isnan(get_greet_elements(urea, breakdowns)).all()
+
+
+# Reference: the row-wise `data_prep.npk_breakdowns.get_NPK_rate`
+
+
+def reference_nutrient(product, total, fert_list, col):
+    temp = fert_list[fert_list.product_name == product]
+    n = temp[col].iloc[0] if not np.isnan(temp[col].iloc[0]) else 0
+    conversion = (
+        temp["lbs / gal"].iloc[0] if not np.isnan(temp["lbs / gal"].iloc[0]) else 0
+    )
+    return n * conversion * total
+
+
+def reference_npk_rate(apps, path_to_data):
+    fert_list = get_fert_list(path_to_data)
+    a = apps[apps.Product.isin(fert_list.product_name)].reset_index(drop=True)
+    cols = {"N": "% N", "P": "% P2O5", "K": "% K2O"}
+
+    try:
+        for nutrient, col in cols.items():
+            a[f"TOTAL_{nutrient}"] = a.apply(
+                lambda x: reference_nutrient(
+                    x.Product, x.Applied_total, fert_list, col
+                ),
+                axis=1,
+            )
+        for nutrient in cols:
+            a[f"RATE_{nutrient}"] = a[f"TOTAL_{nutrient}"] / a.Area_applied
+
+    except Exception:
+        for nutrient, col in cols.items():
+            a[f"RATE_{nutrient}"] = a.apply(
+                lambda x: reference_nutrient(x.Product, x.Applied_rate, fert_list, col),
+                axis=1,
+            )
+        for nutrient in cols:
+            a[f"TOTAL_{nutrient}"] = a[f"RATE_{nutrient}"] * a.Area_applied
+
+    return a
+
+
+def random_apps(rng: np.random.Generator, n: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Field_name": rng.choice(["North", "South"], n),
+            "Product": rng.choice(PRODUCTS, n),
+            "Applied_total": np.where(rng.random(n) < 0.2, np.nan, 500 * rng.random(n)),
+            "Applied_rate": np.where(rng.random(n) < 0.2, np.nan, 5 * rng.random(n)),
+            "Area_applied": rng.choice([0.0, np.nan, 12.5, 80.0, 160.0], n),
+        }
+    )
+
+
+@pytest.fixture
+def fert_list_path(tmp_path):
+    def write(breakdowns: pd.DataFrame):
+        breakdowns.to_csv(tmp_path.joinpath(FERT_LIST_FILE), index=False)
+        return tmp_path
+
+    return write
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_npk_rate_matches_row_wise_reference(seed, fert_list_path):
+    rng = np.random.default_rng(seed)
+    path = fert_list_path(random_breakdowns(rng))
+    apps = random_apps(rng, 40)
+
+    pd.testing.assert_frame_equal(
+        get_NPK_rate(apps, path), reference_npk_rate(apps, path)
+    )
+
+
+@pytest.mark.parametrize(
+    "totals",
+    [
+        pytest.param(None, id="no totals"),
+        pytest.param(lambda n: ["n/a"] + [1.0] * (n - 1), id="non-numeric totals"),
+    ],
+)
+def test_npk_rate_falls_back_to_rates(totals, fert_list_path):
+    rng = np.random.default_rng(0)
+    path = fert_list_path(random_breakdowns(rng))
+    apps = random_apps(rng, 40)
+    if totals is None:
+        apps = apps.drop(columns="Applied_total")
+    else:
+        apps["Applied_total"] = pd.Series(totals(len(apps)), dtype=object)
+
+    result = get_NPK_rate(apps, path)
+
+    pd.testing.assert_frame_equal(result, reference_npk_rate(apps, path))
+    assert result.RATE_N.notna().any()
+
+
+def test_npk_rate_keeps_missing_totals(fert_list_path):
+    # NaN totals give NaN nutrients, rates are only used without numeric totals
+    path = fert_list_path(random_breakdowns(np.random.default_rng(0)))
+    apps = pd.DataFrame(
+        {
+            "Product": ["Potash", "Potash"],
+            "Applied_total": [np.nan, 100.0],
+            "Applied_rate": [2.0, 2.0],
+            "Area_applied": [50.0, 50.0],
+        }
+    )
+
+    result = get_NPK_rate(apps, path)
+
+    assert result.loc[0, ["TOTAL_N", "TOTAL_P", "TOTAL_K"]].isna().all()
+    assert result.loc[0, ["RATE_N", "RATE_P", "RATE_K"]].isna().all()
+    assert result.loc[1, ["TOTAL_N", "TOTAL_P", "TOTAL_K"]].notna().all()
+
+
+# Reference: the list-based `ci_prep.excel_api.npk_extraction` functions
+
+
+def reference_product_breakdown_info(product_names, cpb):
+    cols = ["Product", "Product_type", "Conversion_factor", "A", "U", "AN", "AS"]
+    cols += ["UAN", "MAP_N", "DAP_N", "MAP_P", "DAP_P", "K2O", "AI_H", "AI_I", "CACO3"]
+    pb = {col: [] for col in cols}
+    cpb_cols = ["% Ammonia", "% Urea", "% AN", "% AS", "% UAN", "% MAP N", "% DAP N"]
+    cpb_cols += ["% MAP P2O5", "% DAP P2O5", "% K2O"]
+
+    for product_name in product_names:
+        temp = cpb[cpb.product_name == product_name]
+        if temp.empty or not isinstance(temp.product_type.iloc[0], str):
+            continue
+
+        pb["Product"].append(product_name)
+        product_type = temp.product_type.iloc[0]
+        pb["Product_type"].append(product_type)
+        pb["Conversion_factor"].append(temp["lbs / gal"].iloc[0])
+        for col, cpb_col in zip(cols[3:13], cpb_cols):
+            pb[col].append(temp[cpb_col].iloc[0])
+
+        ai_h, ai_i, caco3 = None, None, None
+        if product_type.upper() == "HERBICIDE" or product_type.upper() == "FUNGICIDE":
+            ai_h = temp["lbs AI / gal"].iloc[0]
+        elif product_type.upper() == "INSECTICIDE":
+            ai_i = temp["lbs AI / gal"].iloc[0]
+        elif product_type.upper() == "LIME":
+            caco3 = temp["% CaCO3"].iloc[0]
+        pb["AI_H"].append(ai_h)
+        pb["AI_I"].append(ai_i)
+        pb["CACO3"].append(caco3)
+
+    return pd.DataFrame(pb)
+
+
+def reference_inputs_by_row(pb):
+    for col in ["A", "U", "AN", "AS", "UAN", "MAP_N", "DAP_N", "MAP_P", "DAP_P", "K2O"]:
+        pb[f"Total_{col}"] = (
+            pb.Applied_total * pb.Conversion_factor * pb[col] / pb.Area_applied
+        )
+    for col in ["AI_H", "AI_I", "CACO3"]:
+        pb[f"Total_{col}"] = pb.Applied_total * pb[col] / pb.Area_applied
+    return pb
+
+
+def without_na(df: pd.DataFrame) -> pd.DataFrame:
+    return df.astype(object).where(df.notna(), None)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_product_breakdowns_match_list_reference(seed, tmp_path, monkeypatch):
+    rng = np.random.default_rng(seed)
+    breakdowns = random_breakdowns(rng)
+    path = tmp_path.joinpath("breakdowns.csv")
+    breakdowns.to_csv(path, index=False)
+    monkeypatch.setattr(npk_extraction, "CHEMICAL_PRODUCT_BREAKDOWN", path)
+    product_names = list(rng.choice(PRODUCTS + [np.nan], 12))
+
+    result = extract_product_breakdown_info(product_names)
+    expected = reference_product_breakdown_info(product_names, pd.read_csv(path))
+
+    # columns of missing values only are None or NaN depending on the inferred dtype
+    pd.testing.assert_frame_equal(
+        without_na(result), without_na(expected), check_dtype=False
+    )
+
+    apps = pd.DataFrame(
+        {
+            "Applied_total": np.where(
+                rng.random(len(expected)) < 0.2, np.nan, 500 * rng.random(len(expected))
+            ),
+            "Area_applied": rng.choice([np.nan, 12.5, 80.0], len(expected)),
+        }
+    )
+    pd.testing.assert_frame_equal(
+        without_na(calculate_inputs_by_row(pd.concat([result, apps], axis=1))),
+        without_na(reference_inputs_by_row(pd.concat([expected, apps], axis=1))),
+        check_dtype=False,
+    )
+
+
+def test_inputs_by_row_zero_area():
+    pb = pd.DataFrame(
+        {
+            "Product": ["UAN 28", "Roundup"],
+            "Conversion_factor": [10.0, 8.0],
+            **{col: [0.5, np.nan] for col in npk_extraction.FERTILIZER_COLS},
+            "AI_H": [np.nan, 2.0],
+            "AI_I": [None, None],
+            "CACO3": [None, None],
+            "Applied_total": [100.0, 0.0],
+            "Area_applied": [0.0, 0.0],
+        }
+    )
+    # the former column arithmetic divided columns without any values as Python
+    # objects and raised, now all totals are inf (NaN for zeros)
+    with pytest.raises(ZeroDivisionError):
+        reference_inputs_by_row(pb.copy())
+
+    result = calculate_inputs_by_row(pb)
+
+    assert np.isinf(result.loc[0, "Total_A":"Total_K2O"].to_numpy(dtype=float)).all()
+    assert result.loc[1, "Total_A":"Total_CACO3"].isna().all()
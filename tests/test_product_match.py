@@ -0,0 +1,132 @@
+import multiprocessing
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.feedstock_aggregation_scripts.data_prep.product_match import (
+    ProductMatchMemory,
+    match_products,
+)
+
+with warnings.catch_warnings():
+    # without python-Levenshtein fuzzywuzzy warns about its slow SequenceMatcher
+    warnings.simplefilter("ignore")
+    from fuzzywuzzy import process as fuzzywuzzy_process
+
+CHOICES = [
+    "UAN 28",
+    "UAN 32",
+    "UAN-28 Liquid",
+    "Urea 46-0-0",
+    "Roundup PowerMax",
+    "Roundup PowerMax 3",
+    "Potash 0-0-60",
+    "Ammonium Sulfate",
+    "Éclat",
+    "Eclat 20",
+    "Café Blend",
+    "Super_U",
+    "Super U 46",
+]
+
+# repeated spaces, non-ASCII characters (dropped by fuzzywuzzy's `force_ascii`) and
+# underscores (kept by fuzzywuzzy's processing) all change the scores
+PRODUCTS = [
+    "UAN  67",
+    "UAN  7",
+    "UAN   28",
+    "Roundup  PowerMax58",
+    "Roundup   PowerMax",
+    "Éclat",
+    "éclat  20",
+    "Eclat",
+    "Café  Blend",
+    "Cafe Blend",
+    "CAFÉ",
+    "Super_U",
+    "super u",
+    "Super__U 46",
+    "Ammonium  Sulfate  21",
+    "Potash   60",
+    "urea  46",
+]
+
+
+def extract_one(products: list) -> list:
+    return [fuzzywuzzy_process.extractOne(p, CHOICES) for p in products]
+
+
+@pytest.mark.parametrize("product", PRODUCTS)
+def test_match_is_fuzzywuzzy_extract_one(product):
+    matches = match_products(pd.Series([product]), CHOICES, memory=None)
+
+    assert extract_one([product]) == [
+        (matches.Match.iloc[0], round(matches.Score.iloc[0]))
+    ]
+
+
+def test_memory_returns_scored_matches(tmp_path):
+    memory = ProductMatchMemory(tmp_path)
+    products = pd.Series(PRODUCTS + [np.nan, 3] + PRODUCTS[::-1], index=range(5, 41))
+
+    scored = match_products(products, CHOICES, memory=memory)
+    remembered = match_products(products, CHOICES, memory=memory)
+
+    pd.testing.assert_frame_equal(scored, remembered)
+    assert (scored.index == products.index).all()
+    is_str = products.map(lambda p: isinstance(p, str))
+    assert scored.Match.isna().tolist() == (~is_str).tolist()
+    assert (scored.Score[~is_str] == 0).all()
+    assert [
+        (m, round(s)) for m, s in scored[is_str].itertuples(index=False)
+    ] == extract_one(PRODUCTS + PRODUCTS[::-1])
+    # products are only the same key when processed the same
+    assert len(memory.get(CHOICES)) == len(PRODUCTS)
+
+
+def test_put_keeps_matches_written_since_read(tmp_path):
+    memory = ProductMatchMemory(tmp_path)
+    stale = memory.get(CHOICES)
+    first = pd.DataFrame({"Match": ["UAN 28"], "Score": [90.0]}, index=["uan 28"])
+    second = pd.DataFrame(
+        {"Match": ["Super U 46", "Éclat"], "Score": [80.0, 70.0]},
+        index=["super u", "uan 28"],
+    )
+
+    memory.put(CHOICES, first)
+    # written from an older state of the memory, without the first match
+    memory.put(CHOICES, pd.concat([stale, second]))
+
+    known = memory.get(CHOICES)
+    assert known.Match.to_dict() == {"uan 28": "UAN 28", "super u": "Super U 46"}
+    assert known.Score.to_dict() == {"uan 28": 90.0, "super u": 80.0}
+
+
+def match_in_process(memory_dir, products: list):
+    """Matches `products` one by one like separate runs sharing the memory."""
+    memory = ProductMatchMemory(memory_dir)
+    for product in products:
+        match_products(pd.Series([product]), CHOICES, workers=1, memory=memory)
+
+
+def test_concurrent_writers_keep_all_matches(tmp_path):
+    products = [f"{product} {i}" for product in PRODUCTS for i in range(8)]
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=match_in_process, args=(tmp_path, products[i::8]))
+        for i in range(8)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert [worker.exitcode for worker in workers] == [0] * 8
+    memory = ProductMatchMemory(tmp_path)
+    assert len(memory.get(CHOICES)) == len(products)
+    pd.testing.assert_frame_equal(
+        match_products(pd.Series(products), CHOICES, memory=memory),
+        match_products(pd.Series(products), CHOICES, memory=None),
+    )
@@ -0,0 +1,127 @@
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.feedstock_aggregation_scripts.util import reference_data
+from src.feedstock_aggregation_scripts.util.reference_data import (
+    ReferenceDataRegistry,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake `time.monotonic` of the registry, advanced by the tests."""
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(
+        reference_data,
+        "time",
+        SimpleNamespace(monotonic=lambda: clock.now, perf_counter=time.perf_counter),
+    )
+    return clock
+
+
+@pytest.fixture
+def stats(monkeypatch):
+    """Counts the sources whose mtime is checked."""
+    stats = []
+    source_version = reference_data.source_version
+
+    def counted(source):
+        stats.append(str(source))
+        return source_version(source)
+
+    monkeypatch.setattr(reference_data, "source_version", counted)
+    return stats
+
+
+@pytest.fixture
+def table(tmp_path):
+    """Registry with a table reading `table.csv` from a switchable source."""
+    source = SimpleNamespace(path=tmp_path / "table.csv", loads=0)
+    source.path.write_text("a")
+
+    def loader(path):
+        source.loads += 1
+        return path.read_text()
+
+    registry = ReferenceDataRegistry(check_interval=5.0)
+    registry.register("table", loader, lambda: (source.path,))
+    return registry, source
+
+
+def touch(path, content: str):
+    """Rewrites `path` with a later mtime."""
+    mtime = os.stat(path).st_mtime_ns
+    path.write_text(content)
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+def test_values_are_memoized_without_checking_mtimes(table, clock, stats):
+    registry, source = table
+
+    values = [registry.get("table") for _ in range(100)]
+
+    assert values == ["a"] * 100
+    assert source.loads == 1
+    assert len(stats) == 1
+
+
+def test_changed_mtime_is_reloaded_after_check_interval(table, clock, stats):
+    registry, source = table
+    registry.get("table")
+    touch(source.path, "b")
+
+    clock.now = 4.9
+    assert registry.get("table") == "a"
+    clock.now = 5.0
+    assert registry.get("table") == "b"
+    assert source.loads == 2
+    assert len(stats) == 2
+
+
+def test_unchanged_mtime_is_not_reloaded(table, clock, stats):
+    registry, source = table
+    registry.get("table")
+
+    clock.now = 60.0
+    assert registry.get("table") == "a"
+    assert registry.get("table") == "a"
+    assert source.loads == 1
+    assert len(stats) == 2
+
+
+def test_reload_checks_mtimes_on_next_get(table, clock, stats):
+    registry, source = table
+    registry.get("table")
+    touch(source.path, "b")
+
+    registry.reload()
+
+    assert registry.get("table") == "b"
+    assert registry.get("table") == "b"
+    assert source.loads == 2
+    assert len(stats) == 2
+
+
+def test_changed_path_is_reloaded_immediately(table, tmp_path, clock, stats):
+    registry, source = table
+    registry.get("table")
+    source.path = tmp_path / "other.csv"
+    source.path.write_text("c")
+
+    assert registry.get("table") == "c"
+    assert source.loads == 2
+    assert len(registry.timings) == 2
+    assert registry.timings[-1].sources == (str(source.path),)
+
+
+def test_clear_loads_again(table, clock):
+    registry, source = table
+    registry.get("table")
+
+    registry.clear()
+
+    assert registry.get("table") == "a"
+    assert source.loads == 2
@@ -0,0 +1,194 @@
+import numpy as np
+import pandas as pd
+import pytest
+from rapidfuzz import fuzz, process, utils
+
+from src.feedstock_aggregation_scripts.ci_prep.shp_files import (
+    fuzzy_match_field_names,
+    get_shp_match_candidates,
+    normalize_farm_names,
+)
+from src.feedstock_aggregation_scripts.config import settings
+
+
+def test_name_match_outside_acreage_block():
+    shp_overview = pd.DataFrame(
+        {"Field_name": ["North 40", "Smith Home Quarter"], "Acreage_calc": [160, 95]}
+    )
+    fields = pd.DataFrame(
+        {"Field_name": ["North 40"], "Planted_acres": [100], "Harvest_acres": [100]}
+    )
+
+    matched = fuzzy_match_field_names(fields.copy(), shp_overview, ratio=60)
+    without_acres = fuzzy_match_field_names(
+        fields[["Field_name"]].copy(), shp_overview, ratio=60
+    )
+
+    for df in [matched, without_acres]:
+        assert df.Potential_shp_match.tolist() == ["North 40"]
+        assert df.Match_score.tolist() == [100]
+
+
+def test_farm_before_all_shape_files():
+    shp_overview = pd.DataFrame(
+        {
+            "Field_name": ["Creek", "Creek", "Hill"],
+            "Farm_name": ["Other", "Home", "Home"],
+            "Acreage_calc": [80, 200, 80],
+        }
+    )
+    fields = pd.DataFrame(
+        {
+            "Field_name": ["Creek", "Pond"],
+            "Farm_name": [" home", "Home"],
+            "Planted_acres": [80, np.nan],
+        }
+    )
+
+    candidates = get_shp_match_candidates(fields, shp_overview, k=3)
+
+    # `Creek` is not in the acreage block, but on the farm of the field
+    assert candidates[candidates.Row == 0].Candidate.tolist() == ["Creek", "Hill"]
+    assert candidates[candidates.Row == 0].Score.iloc[0] == 100
+    # `Pond` matches no name of its farm, so all shape files are candidates
+    assert len(candidates[candidates.Row == 1]) == 3
+
+
+def test_acreage_agreement_breaks_ties():
+    shp_overview = pd.DataFrame(
+        {
+            "Field_name": ["Smith Home Quarter A", "North 40", "Smith Home Quarter B"],
+            "Acreage_calc": [300, 160, 95],
+        }
+    )
+    fields = pd.DataFrame({"Field_name": ["North 40"], "Harvest_acres": [100]})
+
+    candidates = get_shp_match_candidates(fields, shp_overview, k=3)
+
+    # of the equally scored names the one of the field's acreage is first
+    assert candidates.Candidate.tolist() == [
+        "North 40",
+        "Smith Home Quarter B",
+        "Smith Home Quarter A",
+    ]
+    assert candidates.Score.iloc[1] == candidates.Score.iloc[2]
+
+
+def reference_candidates(fields, shp_overview, k=3, tolerance=0.2, ratio=60):
+    """Scores every (field, shape file) pair and picks each field's candidates
+    from the stages it reaches: acreage block, farm, all shape files."""
+    names = [n if isinstance(n, str) else None for n in shp_overview.Field_name]
+    farms = normalize_farm_names(shp_overview.Farm_name)
+    field_farms = normalize_farm_names(fields.Farm_name)
+    shp_acres = shp_overview.Acreage_calc.to_numpy(float)
+
+    rows = []
+    for row, field in enumerate(fields.itertuples(index=False)):
+        if not isinstance(field.Field_name, str):
+            continue
+        farm = field_farms[row]
+
+        def score(shape):
+            return fuzz.token_sort_ratio(
+                field.Field_name, names[shape], processor=utils.default_process
+            )
+
+        def same_farm(shape):
+            return pd.isna(farms[shape]) or pd.isna(farm) or farms[shape] == farm
+
+        acres = [a for a in [field.Planted_acres, field.Harvest_acres] if pd.notna(a)]
+        block = {
+            shape
+            for shape in range(len(names))
+            if same_farm(shape)
+            and acres
+            and (
+                np.isnan(shp_acres[shape])
+                or any(
+                    a * (1 - tolerance) <= shp_acres[shape] <= a * (1 + tolerance)
+                    for a in acres
+                )
+            )
+        }
+        farm_shapes = {
+            shape
+            for shape in range(len(names))
+            if pd.isna(farms[shape]) or (pd.notna(farm) and farms[shape] == farm)
+        } or set(range(len(names)))
+        scored = set()
+        for stage in [block, farm_shapes, set(range(len(names)))]:
+            scored |= {shape for shape in stage if names[shape] is not None}
+            if scored and round(max(score(shape) for shape in scored)) > ratio:
+                break
+
+        ranked = sorted(
+            scored, key=lambda shape: (-score(shape), shape not in block, shape)
+        )
+        rows.extend(
+            (row, names[shape], score(shape), rank)
+            for rank, shape in enumerate(ranked[:k])
+        )
+    return pd.DataFrame(rows, columns=["Row", "Candidate", "Score", "Rank"])
+
+
+def random_fields(seed: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+
+    def choice(values, n):
+        return [values[i] for i in rng.integers(0, len(values), n)]
+
+    names = ["North 40", "South 80", "Home", "Creek Bottom", "Smith Home Quarter"]
+    names += ["Creek", "North", "West Pivot", "Pivot 3", np.nan]
+    n_shapes, n_fields = rng.integers(1, 25), rng.integers(1, 25)
+    shp_overview = pd.DataFrame(
+        {
+            "Field_name": choice(names, n_shapes),
+            "Farm_name": choice(["Home", "river", " home ", np.nan], n_shapes),
+            "Acreage_calc": choice([40, 80, 95, 100, 160, np.nan], n_shapes),
+        }
+    )
+    fields = pd.DataFrame(
+        {
+            "Field_name": choice(names, n_fields),
+            "Farm_name": choice(["Home", "River", "Other", np.nan], n_fields),
+            "Planted_acres": choice([40, 85, 100, 150, np.nan], n_fields),
+            "Harvest_acres": choice([38, 100, 160, np.nan], n_fields),
+        }
+    )
+    return fields, shp_overview
+
+
+@pytest.mark.parametrize("seed", range(60))
+def test_candidates_match_reference(seed, monkeypatch):
+    fields, shp_overview = random_fields(seed)
+    # score a few fields at a time
+    monkeypatch.setattr(settings.shp_match, "chunk_scores", 10)
+
+    candidates = get_shp_match_candidates(fields, shp_overview, k=3)
+
+    pd.testing.assert_frame_equal(
+        candidates,
+        reference_candidates(fields, shp_overview, k=3),
+        check_dtype=False,
+    )
+
+
+def test_fallback_scores_in_bounded_chunks(monkeypatch):
+    cdist = process.cdist
+    sizes = []
+
+    def recording_cdist(queries, choices, **kwargs):
+        sizes.append(len(queries) * len(choices))
+        return cdist(queries, choices, **kwargs)
+
+    monkeypatch.setattr(process, "cdist", recording_cdist)
+    monkeypatch.setattr(settings.shp_match, "chunk_scores", 1000)
+    # poorly named shape files, nothing to block on
+    shp_overview = pd.DataFrame({"Field_name": [f"shape {i}" for i in range(300)]})
+    fields = pd.DataFrame({"Field_name": [f"field {i}" for i in range(500)]})
+
+    candidates = get_shp_match_candidates(fields, shp_overview, k=2)
+
+    assert candidates.Row.tolist() == np.repeat(np.arange(500), 2).tolist()
+    assert sum(sizes) == 500 * 300
+    assert max(sizes) <= 1000
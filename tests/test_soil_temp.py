@@ -0,0 +1,173 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+
+from src.feedstock_aggregation_scripts.ci_prep.soil_data_extract import soil_temp
+from src.feedstock_aggregation_scripts.ci_prep.soil_data_extract.soil_temp_cache import (
+    SoilTemperatureCache,
+)
+from src.feedstock_aggregation_scripts.config import settings
+
+START, END = "2023-10-01", "2023-11-30"
+
+
+def stub_temperatures(lat: float, start_date: str, end_date: str) -> pd.Series:
+    """Hourly temperatures falling by one degree a day, warmer further north so
+    the 4R cutoff depends on the grid cell."""
+    hours = pd.date_range(
+        start_date, pd.Timestamp(end_date) + pd.Timedelta("23h"), freq="h"
+    )
+    days = (hours - hours[0]).days
+    return pd.Series(70.0 - days + (lat - 40) * 10, index=hours)
+
+
+class SoilTemperatureAPI(BaseHTTPRequestHandler):
+    """Stand-in for the soil temperature API, records the query of each request."""
+
+    requests: list
+
+    def do_GET(self):
+        query = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        self.requests.append(query)
+
+        temps = stub_temperatures(
+            float(query["latitude"]), query["start_date"], query["end_date"]
+        )
+        body = json.dumps(
+            {
+                "hourly": {
+                    "time": temps.index.strftime("%Y-%m-%dT%H:%M").tolist(),
+                    query["hourly"]: temps.tolist(),
+                }
+            }
+        ).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Runs the stub API and points the settings at it. Returns the list of
+    received requests."""
+    received = []
+    handler = type("Handler", (SoilTemperatureAPI,), {"requests": received})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setattr(
+        settings.soil_temperature_api,
+        "url",
+        f"http://127.0.0.1:{server.server_address[1]}/v1/archive",
+    )
+    yield received
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = SoilTemperatureCache(tmp_path, grid_resolution=0.1)
+    monkeypatch.setattr(soil_temp, "SOIL_TEMPERATURE_CACHE", cache)
+    return cache
+
+
+def requested_points(api) -> list:
+    return [(float(r["latitude"]), float(r["longitude"])) for r in api]
+
+
+def test_grid_point():
+    cache = SoilTemperatureCache("unused", grid_resolution=0.1)
+    assert cache.grid_point(40.04, -89.96) == (40.0, -90.0)
+    assert cache.grid_point(40.06, -89.94) == (40.1, -89.9)
+    assert cache.grid_point(-0.04, 0.04) == (0.0, 0.0)
+
+
+def test_cache_miss_then_hit(api, cache):
+    first = soil_temp.get_hourly_soil_temp_data(START, END, 40.02, -90.01)
+    second = soil_temp.get_hourly_soil_temp_data(START, END, 40.02, -90.01)
+
+    assert len(api) == 1
+    pd.testing.assert_frame_equal(first, second)
+    expected = stub_temperatures(40.0, START, END)
+    assert first.temps.tolist() == expected.tolist()
+    assert (first.index == expected.index).all()
+
+
+def test_cache_is_shared_within_grid_cell(api, cache):
+    soil_temp.get_hourly_soil_temp_data(START, END, 40.01, -90.02)
+    # same cell
+    soil_temp.get_hourly_soil_temp_data(START, END, 40.04, -89.98)
+    # next cell north
+    soil_temp.get_hourly_soil_temp_data(START, END, 40.06, -89.98)
+
+    # the API is asked for the grid points, not the field coordinates
+    assert requested_points(api) == [(40.0, -90.0), (40.1, -90.0)]
+
+
+def test_cache_key_includes_date_range_and_variable(api, cache):
+    soil_temp.get_hourly_soil_temp_data(START, END, 40.0, -90.0)
+    soil_temp.get_hourly_soil_temp_data(START, "2023-11-15", 40.0, -90.0)
+    soil_temp.get_hourly_soil_temp_data(
+        START, END, 40.0, -90.0, temp_var="soil_temperature_0_to_7cm"
+    )
+    soil_temp.get_hourly_soil_temp_data(START, END, 40.0, -90.0, temp_unit="celsius")
+
+    assert len(api) == 4
+
+
+def test_cache_persists_on_disk(api, cache, monkeypatch):
+    cached = soil_temp.get_hourly_soil_temp_data(START, END, 40.0, -90.0)
+
+    monkeypatch.setattr(
+        soil_temp,
+        "SOIL_TEMPERATURE_CACHE",
+        SoilTemperatureCache(cache.cache_dir, grid_resolution=0.1),
+    )
+    reread = soil_temp.get_hourly_soil_temp_data(START, END, 40.0, -90.0)
+
+    assert len(api) == 1
+    pd.testing.assert_frame_equal(cached, reread)
+
+
+def test_without_cache_every_call_requests_field_coordinates(api, monkeypatch):
+    monkeypatch.setattr(soil_temp, "SOIL_TEMPERATURE_CACHE", None)
+    soil_temp.get_hourly_soil_temp_data(START, END, 40.01, -90.02)
+    soil_temp.get_hourly_soil_temp_data(START, END, 40.01, -90.02)
+
+    assert requested_points(api) == [(40.01, -90.02)] * 2
+
+
+def test_batch_requests_each_grid_cell_once(api, cache):
+    locations = {
+        "field_1": (40.01, -90.02),
+        "field_2": (40.04, -89.98),
+        "field_3": (40.06, -89.98),
+    }
+    timings = soil_temp.get_start_4r_timings(START, END, locations)
+
+    assert sorted(requested_points(api)) == [(40.0, -90.0), (40.1, -90.0)]
+    # cutoff of the grid point data: first day with a mean below 50 F
+    assert timings == {
+        "field_1": "2023-10-22",
+        "field_2": "2023-10-22",
+        "field_3": "2023-10-23",
+    }
+    assert timings == {
+        key: soil_temp.return_start_4r_timing(
+            soil_temp.get_hourly_soil_temp_data(START, END, *point)
+        )
+        for key, point in locations.items()
+    }